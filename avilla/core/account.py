@@ -13,6 +13,7 @@ if TYPE_CHECKING:
     from avilla.core.context import Context
     from avilla.core.platform import Platform
     from avilla.core.protocol import BaseProtocol
+    from avilla.core.roster import AccountRoster
 
 
 @dataclass
@@ -29,6 +30,7 @@ class AccountInfo:
 class BaseAccount:
     route: Selector
     avilla: Avilla
+    _staff: Staff | None = field(default=None, init=False, repr=False, compare=False)
 
     @property
     def info(self) -> AccountInfo:
@@ -36,7 +38,12 @@ class BaseAccount:
 
     @property
     def staff(self):
-        return Staff(self.get_staff_artifacts(), self.get_staff_components())
+        self._staff = Staff.reuse(self._staff, self.get_staff_artifacts(), self.get_staff_components)
+        return self._staff
+
+    @property
+    def roster(self) -> AccountRoster:
+        return self.avilla.roster.scope(self.route)
 
     @property
     def available(self) -> bool:
@@ -2,22 +2,29 @@ from __future__ import annotations
 
 import asyncio
 import signal
-from typing import TYPE_CHECKING, Any, Callable, Iterable, TypeVar, overload
+from typing import TYPE_CHECKING, Any, AsyncIterator, Callable, Iterable, TypeVar, overload
 
 from creart import it
 from graia.amnesia.builtins.memcache import MemcacheService
+from graia.amnesia.message import MessageChain, Text
 from graia.broadcast import Broadcast
 from launart import Launart
 from launart.service import Service
-from loguru import logger
 
 from avilla.core._runtime import get_current_avilla
 from avilla.core.account import AccountInfo, BaseAccount
 from avilla.core.dispatchers import AvillaBuiltinDispatcher
+from avilla.core.encoding import EncodeCacheConfig, EncodedResourceCache
 from avilla.core.event import MetadataModified
+from avilla.core.http import HttpPool, HttpPoolConfig
+from avilla.core.metacache import MetadataCache, MetadataCacheConfig
+from avilla.core.multicast import BroadcastResult, broadcast_message
 from avilla.core.protocol import BaseProtocol
+from avilla.core.recorder import EventRecordConfig, EventRecorder
+from avilla.core.roster import RosterCache, RosterConfig
 from avilla.core.ryanvk.staff import Staff
-from avilla.core.selector import Selector
+from avilla.core.scheduler import SendScheduler, SendSchedulerConfig
+from avilla.core.selector import FollowsPattern, Selector
 from avilla.core.service import AvillaService
 from avilla.core.utilles import identity
 from avilla.standard.core.activity import ActivityEvent
@@ -42,6 +49,12 @@ class Avilla:
     protocols: list[BaseProtocol]
     accounts: dict[Selector, AccountInfo]
     service: AvillaService
+    recorder: EventRecorder
+    roster: RosterCache
+    metadata_cache: MetadataCache
+    send_scheduler: SendScheduler
+    encode_cache: EncodedResourceCache
+    http: HttpPool
     global_artifacts: dict[Any, Any]
 
     def __init__(
@@ -51,6 +64,12 @@ class Avilla:
         launch_manager: Launart | None = None,
         message_cache_size: int = 300,
         record_send: bool = True,
+        record_config: EventRecordConfig | None = None,
+        roster_config: RosterConfig | None = None,
+        metadata_cache_config: MetadataCacheConfig | None = None,
+        send_config: SendSchedulerConfig | None = None,
+        encode_cache_config: EncodeCacheConfig | None = None,
+        http_config: HttpPoolConfig | None = None,
     ):
         self.broadcast = broadcast or it(Broadcast)
         self.launch_manager = launch_manager or it(Launart)
@@ -59,6 +78,12 @@ class Avilla:
         self.accounts = {}
 
         self.service = AvillaService(self, message_cache_size)
+        self.recorder = EventRecorder(record_config)
+        self.roster = RosterCache(roster_config)
+        self.metadata_cache = MetadataCache(metadata_cache_config)
+        self.send_scheduler = SendScheduler(send_config)
+        self.encode_cache = EncodedResourceCache(encode_cache_config)
+        self.http = HttpPool(http_config)
         self.global_artifacts = {}
 
         self.launch_manager.add_component(MemcacheService())
@@ -66,6 +91,7 @@ class Avilla:
         self.broadcast.finale_dispatchers.append(AvillaBuiltinDispatcher(self))
 
         self.__init_isolate__()
+        self.__init_cache_invalidation__()
 
         if message_cache_size > 0:
             from avilla.core.context import Context
@@ -93,11 +119,15 @@ class Avilla:
 
             @self.broadcast.receiver(MessageSent)
             async def message_sender(context: Context, message: Message):
-                scene = f"{'.'.join(f'{k}({v})' for k, v in context.scene.items())}"
-                logger.info(
-                    f"[{context.account.info.protocol.__class__.__name__.replace('Protocol', '')} "
-                    f"{context.account.route['account']}]: "
-                    f"{scene} <- {str(message.content)!r}"
+                if not self.recorder.allow(MessageSent):
+                    return
+
+                self.recorder.emit(
+                    "INFO",
+                    "[{protocol} {account}]: {scene} <- {content!r}",
+                    **_account_fields(context.account),
+                    scene=lambda: ".".join(f"{k}({v})" for k, v in context.scene.items()),
+                    content=lambda: str(message.content),
                 )
 
             message_sender.__annotations__ = {"context": Context, "message": Message}
@@ -113,66 +143,83 @@ class Avilla:
             MessageSent,
         )
 
+        if isinstance(event, MessageSent) or not self.recorder.allow(type(event)):
+            return
+
+        record = self.recorder.emit
+        event_name = lambda: event.__class__.__name__
+
         if isinstance(event, AccountStatusChanged):
-            logger.debug(
-                f"[{event.account.info.protocol.__class__.__name__.replace('Protocol', '')} "
-                f"{event.account.route['account']}]: "
-                f"{event.__class__.__name__}"
-            )
+            record("DEBUG", "[{protocol} {account}]: {event}", **_account_fields(event.account), event=event_name)
             return
         if isinstance(event, AvillaLifecycleEvent):
-            logger.debug(event.__class__.__name__)
+            record("DEBUG", "{event}", event=event_name)
             return
-        context = event.context
-        client = context.client.display
-        scene = context.scene.display
-        endpoint = context.endpoint.display
 
-        if isinstance(event, MessageSent):
-            return
+        context = event.context
+        fields = _account_fields(context.account)
+        client = lambda: context.client.display
+        scene = lambda: context.scene.display
 
         if type(event) in self.custom_event_recorder:
             self.custom_event_recorder[type(event)](event)
 
         elif isinstance(event, RequestEvent):
-            logger.info(
-                f"[{context.account.info.protocol.__class__.__name__.replace('Protocol', '')} "
-                f"{context.account.route['account']}]: "
-                f"Request {event.request.request_type or event.request.id}"
-                f"{f' with {event.request.message}' if event.request.message else ''} "
-                f"from {client} in {scene}"
+            record(
+                "INFO",
+                "[{protocol} {account}]: Request {request}{comment} from {client} in {scene}",
+                **fields,
+                request=lambda: event.request.request_type or event.request.id,
+                comment=lambda: f" with {event.request.message}" if event.request.message else "",
+                client=client,
+                scene=scene,
             )
         elif isinstance(event, ActivityEvent):
-            logger.info(
-                f"[{context.account.info.protocol.__class__.__name__.replace('Protocol', '')} "
-                f"{context.account.route['account']}]: "
-                f"Activity {event.id}: {event.activity}"
-                f"from {client} in {scene}"
+            record(
+                "INFO",
+                "[{protocol} {account}]: Activity {id}: {activity}from {client} in {scene}",
+                **fields,
+                id=lambda: event.id,
+                activity=lambda: event.activity,
+                client=client,
+                scene=scene,
             )
         elif isinstance(event, MetadataModified):
-            logger.info(
-                f"[{context.account.info.protocol.__class__.__name__.replace('Protocol', '')} "
-                f"{context.account.route['account']}]: "
-                f"Metadata {event.route} Modified: {event.details}"
-                f"from {client} in {scene}"
+            record(
+                "INFO",
+                "[{protocol} {account}]: Metadata {route} Modified: {details}from {client} in {scene}",
+                **fields,
+                route=lambda: event.route,
+                details=lambda: event.details,
+                client=client,
+                scene=scene,
             )
         elif isinstance(event, MessageReceived):
-            logger.info(
-                f"[{context.account.info.protocol.__class__.__name__.replace('Protocol', '')} "
-                f"{context.account.route['account']}]: "
-                f"{scene} -> {str(event.message.content)!r}"
+            record(
+                "INFO",
+                "[{protocol} {account}]: {scene} -> {content!r}",
+                **fields,
+                scene=scene,
+                content=lambda: str(event.message.content),
             )
         elif isinstance(event, MessageEdited):
-            logger.info(
-                f"[{context.account.info.protocol.__class__.__name__.replace('Protocol', '')} "
-                f"{context.account.route['account']}]: "
-                f"{scene} => {str(event.past)!r} -> {str(event.current)!r}"
+            record(
+                "INFO",
+                "[{protocol} {account}]: {scene} => {past!r} -> {current!r}",
+                **fields,
+                scene=scene,
+                past=lambda: str(event.past),
+                current=lambda: str(event.current),
             )
         else:
-            logger.info(
-                f"[{context.account.info.protocol.__class__.__name__.replace('Protocol', '')} "
-                f"{context.account.route['account']}]: "
-                f"{event.__class__.__name__} from {client} to {endpoint} in {scene}"
+            record(
+                "INFO",
+                "[{protocol} {account}]: {event} from {client} to {endpoint} in {scene}",
+                **fields,
+                event=event_name,
+                client=client,
+                endpoint=lambda: context.endpoint.display,
+                scene=scene,
             )
 
     @overload
@@ -196,6 +243,34 @@ class Avilla:
         self.custom_event_recorder[event_type] = recorder  # type: ignore
         return recorder
 
+    def __init_cache_invalidation__(self):
+        from avilla.core.event import MemberCreated, RelationshipDestroyed
+        from avilla.standard.core.account import AccountUnregistered
+
+        @self.broadcast.receiver(RelationshipDestroyed)
+        async def roster_relationship_destroyed(event: RelationshipDestroyed):
+            event.context.account.roster.invalidate(event.context.endpoint, recursive=True)
+            self.metadata_cache.invalidate(event.context.account.route, event.context.endpoint)
+
+        @self.broadcast.receiver(MemberCreated)
+        async def roster_member_created(event: MemberCreated):
+            event.context.account.roster.invalidate(event.context.endpoint)
+
+        @self.broadcast.receiver(MetadataModified)
+        async def roster_metadata_modified(event: MetadataModified):
+            event.context.account.roster.invalidate(event.endpoint)
+            self.metadata_cache.invalidate(event.context.account.route, event.endpoint)
+
+        @self.broadcast.receiver(AccountUnregistered)
+        async def roster_account_unregistered(event: AccountUnregistered):
+            self.roster.forget_account(event.account.route)
+            self.metadata_cache.forget_account(event.account.route)
+
+        roster_relationship_destroyed.__annotations__ = {"event": RelationshipDestroyed}
+        roster_member_created.__annotations__ = {"event": MemberCreated}
+        roster_metadata_modified.__annotations__ = {"event": MetadataModified}
+        roster_account_unregistered.__annotations__ = {"event": AccountUnregistered}
+
     def __init_isolate__(self):
         from avilla.core.builtins.resource_fetch import CoreResourceFetchPerform
 
@@ -217,6 +292,18 @@ class Avilla:
     async def fetch_resource(self, resource: Resource[T]) -> T:
         return await Staff(self.get_staff_artifacts(), self.get_staff_components()).fetch_resource(resource)
 
+    def stream_resource(self, resource: Resource[bytes], chunk_size: int | None = None) -> AsyncIterator[bytes]:
+        return Staff(self.get_staff_artifacts(), self.get_staff_components()).stream_resource(resource, chunk_size)
+
+    async def broadcast_message(
+        self, account: Selector, targets: Iterable[Selector], message: MessageChain | str, *, concurrency: int = 8
+    ) -> list[BroadcastResult]:
+        """以 ``account`` 向多个目标发送同一条消息, 详见 ``avilla.core.multicast.broadcast_message``."""
+
+        if isinstance(message, str):
+            message = MessageChain([Text(message)])
+        return await broadcast_message(self.accounts[account].account.staff, targets, message, concurrency=concurrency)
+
     def get_account(self, target: Selector) -> AccountInfo:
         return self.accounts[target]
 
@@ -247,7 +334,8 @@ class Avilla:
         if land:
             return [account for account in self.accounts.values() if account.platform.land.name == land]
         if pattern:
-            return [account for selector, account in self.accounts.items() if selector.follows(pattern)]
+            follows = FollowsPattern.compile(pattern)
+            return [account for selector, account in self.accounts.items() if follows.matches(selector)]
         if protocol_type:
             return [account for account in self.accounts.values() if isinstance(account.protocol, protocol_type)]
         if account_type:
@@ -291,3 +379,10 @@ class Avilla:
         stop_signal: Iterable[signal.Signals] = (signal.SIGINT,),
     ):
         self.launch_manager.launch_blocking(loop=loop, stop_signal=stop_signal)
+
+
+def _account_fields(account: BaseAccount):
+    return {
+        "protocol": lambda: account.info.protocol.__class__.__name__.replace("Protocol", ""),
+        "account": lambda: account.route["account"],
+    }
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, TypeVar
+from typing import TYPE_CHECKING, Any, AsyncIterator, TypeVar
 
 from typing_extensions import Unpack
 
@@ -41,6 +41,10 @@ class CoreCapability(Capability):
     async def fetch(self, resource: Resource[T]) -> T:
         ...
 
+    @Fn.complex({TypeOverload(): ["resource"]})
+    def stream(self, resource: Resource[bytes], chunk_size: int | None = None) -> AsyncIterator[bytes]:
+        ...
+
     @Fn.complex({TargetOverload(): ["target"]})
     def channel(self, target: Selector) -> str:
         ...
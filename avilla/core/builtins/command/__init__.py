@@ -1,4 +1,6 @@
 import asyncio
+import contextlib
+import re
 from dataclasses import dataclass
 from typing import (
     Any,
@@ -31,6 +33,7 @@ from arclet.alconna import (
 from arclet.alconna.args import TAValue
 from arclet.alconna.argv import Argv, argv_config, set_default_argv_type
 from arclet.alconna.builtin import generate_duplication
+from arclet.alconna.exceptions import SpecialOptionTriggered
 from arclet.alconna.tools.construct import AlconnaString, alconna_from_format
 from creart import it
 from graia.amnesia.message import MessageChain
@@ -41,13 +44,15 @@ from graia.broadcast.entities.dispatcher import BaseDispatcher
 from graia.broadcast.entities.exectarget import ExecTarget
 from graia.broadcast.interfaces.dispatcher import DispatcherInterface
 from graia.broadcast.typing import T_Dispatcher
+from loguru import logger
 from nepattern import DirectPattern
 from pygtrie import CharTrie
 from tarina.generic import generic_isinstance, generic_issubclass, get_origin
-from tarina.string import split_once
 
 from avilla.core import Context, MessageReceived, Notice
 
+from .limit import CommandLimitConfig, CommandLimiter, CommandShed
+
 T = TypeVar("T")
 TCallable = TypeVar("TCallable", bound=Callable[..., Any])
 
@@ -83,6 +88,19 @@ argv_config(
 )
 
 
+_NAMED_GROUP = re.compile(r"\(\?P<\w+>")
+_BACKREF = re.compile(r"\\\d|\(\?P=")
+
+
+def _shortcut_source(key: str) -> str:
+    # 快捷命令的键按正则处理; 合并时去掉组名以免重名.
+    try:
+        re.compile(key)
+    except re.error:
+        return re.escape(key)
+    return _NAMED_GROUP.sub("(?:", key)
+
+
 def _is_tome(message: MessageChain, context: Context):
     if message.content and isinstance(message[0], Notice):
         notice: Notice = message.get_first(Notice)
@@ -143,11 +161,16 @@ class AlconnaDispatcher(BaseDispatcher):
 class AvillaCommands:
     __namespace__ = "Avilla"
 
-    def __init__(self, need_tome: bool = False, remove_tome: bool = False):
+    def __init__(
+        self, need_tome: bool = False, remove_tome: bool = False, *, limit: Optional[CommandLimitConfig] = None
+    ):
         self.trie: CharTrie = CharTrie()
         self.broadcast = it(Broadcast)
         self.need_tome = need_tome
         self.remove_tome = remove_tome
+        self.limiter = CommandLimiter(limit)
+        self._shortcut_pattern: Optional[re.Pattern[str]] = None
+        self._shortcut_entries: Optional[list[tuple[re.Pattern[str], tuple]]] = None
         config.namespaces["Avilla"] = Namespace(self.__namespace__)
 
         @self.broadcast.receiver(MessageReceived)
@@ -157,13 +180,59 @@ class AvillaCommands:
                 await asyncio.gather(*(self.execute(*res.value, event) for res in matches if res.value))  # type: ignore
                 return
             # shortcut
-            head, _ = split_once(msg, (" ",))
-            for value in self.trie.values():
-                try:
-                    command_manager.find_shortcut(value[0], head)  # type: ignore
-                except ValueError:
-                    continue
-                await self.execute(*value, event)  # type: ignore
+            if self._shortcut_entries is None:
+                self.refresh_shortcuts()
+            if self._shortcut_pattern is not None and not self._shortcut_pattern.match(msg):
+                return
+            for pattern, value in self._shortcut_entries or ():
+                if pattern.match(msg):
+                    await self.execute(*value, event)  # type: ignore
+
+    def refresh_shortcuts(self) -> None:
+        """重建快捷命令索引.
+
+        注册命令, 通过 ``AvillaCommands.shortcut`` 或命令的内置选项增删快捷命令时会自动重建;
+        直接调用 ``Alconna.shortcut`` 后需手动调用本方法.
+        """
+        entries: list[tuple[re.Pattern[str], tuple]] = []
+        sources: list[str] = []
+        seen: set[int] = set()
+        combinable = True
+        for value in self.trie.values():
+            command: Alconna = value[0]
+            if id(command) in seen:
+                continue
+            seen.add(id(command))
+            try:
+                keys = list(command_manager.get_shortcut(command))
+            except ValueError:
+                continue
+            if not keys:
+                continue
+            combinable = combinable and not any(_BACKREF.search(i) for i in keys)
+            source = "|".join(f"(?:{_shortcut_source(i)})" for i in keys)
+            try:
+                entries.append((re.compile(source), value))
+            except re.error:
+                entries.append((re.compile(".*"), value))
+                combinable = False
+            sources.append(source)
+
+        self._shortcut_entries = entries
+        self._shortcut_pattern = None
+        if not sources:
+            self._shortcut_pattern = re.compile("(?!)")
+        elif combinable:
+            # 未命中任何快捷命令时只需匹配一次合并后的正则.
+            with contextlib.suppress(re.error):
+                self._shortcut_pattern = re.compile("|".join(f"(?:{i})" for i in sources))
+
+    def shortcut(self, command: Alconna, key: str, **kwargs: Any) -> str:
+        """为 ``command`` 添加或删除快捷命令, 参数同 ``Alconna.shortcut``, 并更新快捷命令索引."""
+        try:
+            return command.shortcut(key, **kwargs)
+        finally:
+            self._shortcut_entries = None
 
     @property
     def all_helps(self) -> str:
@@ -186,10 +255,23 @@ class AvillaCommands:
                 _res = command.parse(msg)
             except Exception as e:
                 _res = Arparma(command.path, event.message.content, False, error_info=e)
+            if isinstance(_res.error_info, SpecialOptionTriggered) and _res.error_info.args[:1] == ("shortcut",):
+                self._shortcut_entries = None
             may_help_text: Optional[str] = cap.get("output", None)
         if _res.matched:
-            await self.broadcast.Executor(target, [event.Dispatcher, AlconnaDispatcher(command)])
-            target.oplog.clear()
+            if self.limiter.cooling(command.path, event.context.scene):
+                return
+            try:
+                async with self.limiter.slot(command.path):
+                    # 取得执行名额后才计入冷却, 被丢弃的调用不占用冷却.
+                    if not self.limiter.charge(command.path, event.context.scene):
+                        return
+                    await self.broadcast.Executor(target, [event.Dispatcher, AlconnaDispatcher(command)])
+                    target.oplog.clear()
+            except CommandShed:
+                logger.warning(f"command {command.path} in {event.context.scene} was shed due to overload")
+                if self.limiter.config.busy_reply:
+                    await event.context.scene.send_message(self.limiter.config.busy_reply)
         elif may_help_text:
             await event.context.scene.send_message(may_help_text)
 
@@ -201,10 +283,21 @@ class AvillaCommands:
         remove_tome: bool = False,
         dispatchers: Optional[list[T_Dispatcher]] = None,
         decorators: Optional[list[Decorator]] = None,
+        *,
+        concurrency: Optional[int] = None,
+        cooldown: Optional[float] = None,
     ):
         class Command(AlconnaString):
             def __call__(_cmd_self, func: TCallable) -> TCallable:
-                return self.on(_cmd_self.build(), need_tome, remove_tome, dispatchers, decorators)(func)
+                return self.on(
+                    _cmd_self.build(),
+                    need_tome,
+                    remove_tome,
+                    dispatchers,
+                    decorators,
+                    concurrency=concurrency,
+                    cooldown=cooldown,
+                )(func)
 
         return Command(command, help_text)
 
@@ -216,6 +309,9 @@ class AvillaCommands:
         remove_tome: bool = False,
         dispatchers: Optional[list[T_Dispatcher]] = None,
         decorators: Optional[list[Decorator]] = None,
+        *,
+        concurrency: Optional[int] = None,
+        cooldown: Optional[float] = None,
     ) -> Callable[[TCallable], TCallable]:
         ...
 
@@ -230,6 +326,8 @@ class AvillaCommands:
         *,
         args: Optional[dict[str, Union[TAValue, Args, Arg]]] = None,
         meta: Optional[CommandMeta] = None,
+        concurrency: Optional[int] = None,
+        cooldown: Optional[float] = None,
     ) -> Callable[[TCallable], TCallable]:
         ...
 
@@ -243,6 +341,8 @@ class AvillaCommands:
         *,
         args: Optional[dict[str, Union[TAValue, Args, Arg]]] = None,
         meta: Optional[CommandMeta] = None,
+        concurrency: Optional[int] = None,
+        cooldown: Optional[float] = None,
     ) -> Callable[[TCallable], TCallable]:
         def wrapper(func: TCallable) -> TCallable:
             target = ExecTarget(func, dispatchers, decorators)
@@ -255,6 +355,7 @@ class AvillaCommands:
                     f" {arg.value.target}" for arg in _command.args if isinstance(arg.value, DirectPattern)
                 )
                 self.trie[key] = (_command, target, need_tome, remove_tome)
+                path = _command.path
             else:
                 if not isinstance(command.command, str):
                     raise TypeError("Command name must be a string.")
@@ -266,9 +367,13 @@ class AvillaCommands:
                     for prefix in cast(list[str], command.prefixes):
                         self.trie[prefix + command.command] = (command, target, need_tome, remove_tome)
                 command.reset_namespace(self.__namespace__)
+                path = command.path
+            if concurrency is not None or cooldown is not None:
+                self.limiter.configure(path, concurrency, cooldown)
+            self._shortcut_entries = None
             return func
 
         return wrapper
 
 
-__all__ = ["AvillaCommands", "Match"]
+__all__ = ["AvillaCommands", "CommandLimitConfig", "Match"]
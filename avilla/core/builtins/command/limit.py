@@ -0,0 +1,165 @@
+import asyncio
+import time
+from collections import OrderedDict, deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Dict, Hashable, Literal, Optional, Tuple
+
+
+@dataclass(frozen=True)
+class CommandLimitConfig:
+    """命令执行的并发限制与过载处理.
+
+    - ``concurrency``: 所有命令同时执行的上限, 为 None 时不作限制;
+    - ``command_concurrency``: 每个命令同时执行的上限, 可在 ``AvillaCommands.on`` 中单独指定;
+    - ``queue_size``: 每个限制上允许排队等待的数量, 为 None 时不限制, 为 0 时不排队;
+    - ``shed``: 队列已满时丢弃最早排队的 (``oldest``) 还是新到达的 (``newest``) 调用;
+    - ``busy_reply``: 被丢弃时回复到消息所在场景的文本, 为 None 时不回复;
+    - ``cooldown``: 同一场景中同一命令两次执行的最小间隔秒数, 可在 ``AvillaCommands.on`` 中单独指定.
+    """
+
+    concurrency: Optional[int] = None
+    command_concurrency: Optional[int] = None
+    queue_size: Optional[int] = 64
+    shed: Literal["oldest", "newest"] = "oldest"
+    busy_reply: Optional[str] = None
+    cooldown: float = 0.0
+
+
+class CommandShed(Exception):
+    """命令调用因过载被丢弃."""
+
+
+class _Gate:
+    __slots__ = ("limit", "queue_size", "shed", "running", "waiters")
+
+    def __init__(self, limit: int, queue_size: Optional[int], shed: str) -> None:
+        self.limit = limit
+        self.queue_size = queue_size
+        self.shed = shed
+        self.running = 0
+        self.waiters: deque[asyncio.Future[None]] = deque()
+
+    async def acquire(self) -> None:
+        if self.running < self.limit and not self.waiters:
+            self.running += 1
+            return
+
+        if self.queue_size is not None and len(self.waiters) >= self.queue_size:
+            if self.shed == "newest" or not self.waiters:
+                raise CommandShed
+            victim = self.waiters.popleft()
+            if not victim.done():
+                victim.set_exception(CommandShed())
+
+        waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self.waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled() and waiter.exception() is None:
+                self.release()
+            else:
+                self._discard(waiter)
+            raise
+
+    def _discard(self, waiter: asyncio.Future[None]) -> None:
+        try:
+            self.waiters.remove(waiter)
+        except ValueError:
+            pass
+
+    def release(self) -> None:
+        while self.waiters:
+            waiter = self.waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self.running -= 1
+
+
+class CommandLimiter:
+    """``AvillaCommands`` 使用的并发限制与冷却记录."""
+
+    config: CommandLimitConfig
+
+    def __init__(self, config: Optional[CommandLimitConfig] = None) -> None:
+        self.config = config or CommandLimitConfig()
+        self._global: Optional[_Gate] = None
+        if self.config.concurrency is not None:
+            self._global = _Gate(self.config.concurrency, self.config.queue_size, self.config.shed)
+        self._commands: Dict[str, Optional[_Gate]] = {}
+        self._overrides: Dict[str, Tuple[Optional[int], Optional[float]]] = {}
+        self._cooldowns: "Dict[float, OrderedDict[Tuple[str, Hashable], float]]" = {}
+        # layout: {冷却秒数: {(命令, 场景): 到期时间}}; 同一冷却时长下, 到期顺序与写入顺序一致.
+
+    def configure(self, command: str, concurrency: Optional[int] = None, cooldown: Optional[float] = None) -> None:
+        self._overrides[command] = (concurrency, cooldown)
+        self._commands.pop(command, None)
+
+    def _gate(self, command: str) -> Optional[_Gate]:
+        if command in self._commands:
+            return self._commands[command]
+        limit = self._overrides.get(command, (None, None))[0]
+        if limit is None:
+            limit = self.config.command_concurrency
+        gate = self._commands[command] = (
+            None if limit is None else _Gate(limit, self.config.queue_size, self.config.shed)
+        )
+        return gate
+
+    def _cooldown(self, command: str) -> float:
+        cooldown = self._overrides.get(command, (None, None))[1]
+        return self.config.cooldown if cooldown is None else cooldown
+
+    def _bucket(self, cooldown: float, now: float) -> "OrderedDict[Tuple[str, Hashable], float]":
+        bucket = self._cooldowns.get(cooldown)
+        if bucket is None:
+            bucket = self._cooldowns[cooldown] = OrderedDict()
+        while bucket:
+            key, expire = next(iter(bucket.items()))
+            if expire > now:
+                break
+            del bucket[key]
+        return bucket
+
+    def cooling(self, command: str, scene: Hashable) -> bool:
+        """是否仍在冷却中, 不记录新的冷却."""
+        cooldown = self._cooldown(command)
+        if cooldown <= 0:
+            return False
+        now = time.monotonic()
+        return self._bucket(cooldown, now).get((command, scene), 0.0) > now
+
+    def charge(self, command: str, scene: Hashable) -> bool:
+        """检查并记录冷却: 仍在冷却中时返回 False, 否则开始新的冷却并返回 True."""
+        cooldown = self._cooldown(command)
+        if cooldown <= 0:
+            return True
+
+        now = time.monotonic()
+        bucket = self._bucket(cooldown, now)
+        key = (command, scene)
+        if bucket.get(key, 0.0) > now:
+            return False
+        bucket[key] = now + cooldown
+        bucket.move_to_end(key)
+        return True
+
+    @asynccontextmanager
+    async def slot(self, command: str):
+        """占用命令与全局的执行名额; 过载时抛出 ``CommandShed``."""
+        gate = self._gate(command)
+        if gate is not None:
+            await gate.acquire()
+        try:
+            if self._global is not None:
+                await self._global.acquire()
+            try:
+                yield
+            finally:
+                if self._global is not None:
+                    self._global.release()
+        finally:
+            if gate is not None:
+                gate.release()
@@ -1,35 +1,41 @@
 from __future__ import annotations
 
+from avilla.core.http import aio, read_file, stream_bytes, stream_file
 from avilla.core.resource import LocalFileResource, RawResource, UrlResource
 from avilla.core.ryanvk.collector.application import ApplicationCollector
 
-try:
-    from aiohttp import ClientSession
-
-    aio = True
-except ImportError:
-    ClientSession = None
-    aio = False
-
 from .capability import CoreCapability
 
 
 class CoreResourceFetchPerform((m := ApplicationCollector())._):
     @m.entity(CoreCapability.fetch, resource=LocalFileResource)
     async def fetch_localfile(self, resource: LocalFileResource):
-        return resource.file.read_bytes()
+        return await read_file(resource.file)
 
     @m.entity(CoreCapability.fetch, resource=RawResource)
     async def fetch_raw(self, resource: RawResource):
         return resource.data
 
+    @m.entity(CoreCapability.stream, resource=LocalFileResource)
+    async def stream_localfile(self, resource: LocalFileResource, chunk_size: int | None = None):
+        async for chunk in stream_file(resource.file, chunk_size or self.avilla.http.config.chunk_size):
+            yield chunk
+
+    @m.entity(CoreCapability.stream, resource=RawResource)
+    async def stream_raw(self, resource: RawResource, chunk_size: int | None = None):
+        async for chunk in stream_bytes(resource.data, chunk_size or self.avilla.http.config.chunk_size):
+            yield chunk
+
     if aio:
 
         @m.entity(CoreCapability.fetch, resource=UrlResource)
         async def fetch_url(self, resource: UrlResource):
-            async with ClientSession() as session:
-                async with session.get(resource.url) as resp:
-                    return await resp.read()
+            return await self.avilla.http.read(resource.url)
+
+        @m.entity(CoreCapability.stream, resource=UrlResource)
+        async def stream_url(self, resource: UrlResource, chunk_size: int | None = None):
+            async for chunk in self.avilla.http.stream(resource.url, chunk_size):
+                yield chunk
 
     else:
 
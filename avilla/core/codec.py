@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Callable, Literal
+
+JsonBackend = Literal["auto", "orjson", "msgspec", "json"]
+
+
+@dataclass(frozen=True)
+class JsonCodec:
+    """协议连接层使用的 JSON 编解码器.
+
+    ``loads`` 接受 ``str`` 或 ``bytes``, ``dumps`` 总是返回 ``str``,
+    以便直接传给 aiohttp 的 ``send_json(dumps=...)`` / ``ClientSession(json_serialize=...)``.
+    """
+
+    name: str
+    loads: Callable[[str | bytes], Any]
+    dumps: Callable[[Any], str]
+
+
+def _stdlib_codec() -> JsonCodec:
+    return JsonCodec("json", json.loads, json.dumps)
+
+
+def _orjson_codec() -> JsonCodec:
+    import orjson
+
+    option = orjson.OPT_NON_STR_KEYS
+
+    def dumps(obj: Any) -> str:
+        return orjson.dumps(obj, option=option).decode()
+
+    return JsonCodec("orjson", orjson.loads, dumps)
+
+
+def _msgspec_codec() -> JsonCodec:
+    import msgspec
+
+    encoder = msgspec.json.Encoder()
+    decoder = msgspec.json.Decoder()
+
+    def dumps(obj: Any) -> str:
+        return encoder.encode(obj).decode()
+
+    return JsonCodec("msgspec", decoder.decode, dumps)
+
+
+_BACKENDS: dict[str, Callable[[], JsonCodec]] = {
+    "orjson": _orjson_codec,
+    "msgspec": _msgspec_codec,
+    "json": _stdlib_codec,
+}
+
+
+@lru_cache(maxsize=None)
+def get_json_codec(backend: JsonBackend = "auto") -> JsonCodec:
+    """获取指定后端的编解码器; ``auto`` 会按 orjson, msgspec, json 的顺序选用第一个可用的实现."""
+
+    if backend != "auto":
+        return _BACKENDS[backend]()
+
+    for factory in (_orjson_codec, _msgspec_codec):
+        try:
+            return factory()
+        except ImportError:
+            continue
+
+    return _stdlib_codec()
+
+
+DEFAULT_JSON_CODEC = get_json_codec("json")
+# 默认使用标准库, 以免安装了无关的 orjson / msgspec 就改变线上的编码结果; 可通过 ``ProtocolConfig.json_codec`` 选用.
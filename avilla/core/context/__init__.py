@@ -1,13 +1,15 @@
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import AsyncIterator, Callable, Iterable
 from typing import Any, TypedDict, TypeVar, cast, overload
 
+from graia.amnesia.message import MessageChain, Text
 from typing_extensions import ParamSpec, Unpack
 
 from avilla.core._runtime import cx_context
 from avilla.core.account import BaseAccount
 from avilla.core.metadata import Metadata, MetadataRoute
+from avilla.core.multicast import BroadcastResult, broadcast_message
 from avilla.core.platform import Land
 from avilla.core.resource import Resource
 from avilla.core.ryanvk import Fn
@@ -36,16 +38,36 @@ class ContextCache(TypedDict):
 
 
 class Context:
-    account: BaseAccount
-
-    client: ContextClientSelector
-    endpoint: ContextEndpointSelector
-    scene: ContextSceneSelector
-    self: ContextSelfSelector
-    mediums: list[ContextMedium]
+    __slots__ = (
+        "account",
+        "cache",
+        "_origins",
+        "_medium_origins",
+        "_client",
+        "_endpoint",
+        "_scene",
+        "_self",
+        "_mediums",
+        "_artifacts",
+        "_staff",
+        "__weakref__",
+    )
+    # client / endpoint / scene / self / mediums / artifacts / staff 均在首次访问时才构造,
+    # 大部分事件在第一个监听器处就被过滤掉了, 不必为它们付出这些开销.
 
+    account: BaseAccount
     cache: ContextCache | dict[str, Any]
 
+    _origins: tuple[Selector, Selector, Selector, Selector]
+    _medium_origins: list[Selector] | None
+    _client: ContextClientSelector
+    _endpoint: ContextEndpointSelector
+    _scene: ContextSceneSelector
+    _self: ContextSelfSelector
+    _mediums: list[ContextMedium]
+    _artifacts: list[dict[Any, Any]]
+    _staff: Staff
+
     def __init__(
         self,
         account: BaseAccount,
@@ -56,23 +78,78 @@ class Context:
         mediums: list[Selector] | None = None,
         prelude_metadatas: dict[Selector, dict[type[Metadata] | MetadataRoute, Metadata]] | None = None,
     ) -> None:
-        self.artifacts = [
-            account.info.artifacts,
-            account.info.protocol.artifacts,
-            account.avilla.global_artifacts,
-        ]
+        self.account = account
+        self.cache = {"meta": prelude_metadatas or {}}
+        self._origins = (client, endpoint, scene, selft)
+        self._medium_origins = mediums
+
+    @property
+    def client(self) -> ContextClientSelector:
+        try:
+            return self._client
+        except AttributeError:
+            self._client = ContextClientSelector.from_selector(self, self._origins[0])
+            return self._client
+
+    @property
+    def endpoint(self) -> ContextEndpointSelector:
+        try:
+            return self._endpoint
+        except AttributeError:
+            self._endpoint = ContextEndpointSelector.from_selector(self, self._origins[1])
+            return self._endpoint
+
+    @property
+    def scene(self) -> ContextSceneSelector:
+        try:
+            return self._scene
+        except AttributeError:
+            self._scene = ContextSceneSelector.from_selector(self, self._origins[2])
+            return self._scene
+
+    @property
+    def self(self) -> ContextSelfSelector:
+        try:
+            return self._self
+        except AttributeError:
+            self._self = ContextSelfSelector.from_selector(self, self._origins[3])
+            return self._self
+
+    @property
+    def mediums(self) -> list[ContextMedium]:
+        try:
+            return self._mediums
+        except AttributeError:
+            self._mediums = [
+                ContextMedium(ContextSelector.from_selector(self, medium)) for medium in self._medium_origins or []
+            ]
+            return self._mediums
+
+    @property
+    def artifacts(self) -> list[dict[Any, Any]]:
         # 这里是为了能在 Context 层级进行修改
+        try:
+            return self._artifacts
+        except AttributeError:
+            info = self.account.info
+            self._artifacts = [info.artifacts, info.protocol.artifacts, self.account.avilla.global_artifacts]
+            return self._artifacts
 
-        self.account = account
+    @artifacts.setter
+    def artifacts(self, value: list[dict[Any, Any]]) -> None:
+        self._artifacts = value
 
-        self.client = ContextClientSelector.from_selector(self, client)
-        self.endpoint = ContextEndpointSelector.from_selector(self, endpoint)
-        self.scene = ContextSceneSelector.from_selector(self, scene)
-        self.self = ContextSelfSelector.from_selector(self, selft)
-        self.mediums = [ContextMedium(ContextSelector.from_selector(self, medium)) for medium in mediums or []]
+    @property
+    def staff(self) -> Staff:
+        try:
+            return self._staff
+        except AttributeError:
+            self._staff = Staff(self.get_staff_artifacts(), self.get_staff_components())
+            return self._staff
 
-        self.cache = {"meta": prelude_metadatas or {}}
-        self.staff = Staff(self.get_staff_artifacts(), self.get_staff_components())
+    @staff.setter
+    def staff(self, value: Staff) -> None:
+        self._staff = value
 
     @property
     def protocol(self):
@@ -114,12 +191,22 @@ class Context:
     def get_staff_artifacts(self):
         return self.artifacts
 
-    def query(self, pattern: str, **predicators: FollowsPredicater):
-        return self.staff.query_entities(pattern, **predicators)
+    def query(self, pattern: str, *, concurrency: int = 1, **predicators: FollowsPredicater):
+        return self.staff.query_entities(pattern, concurrency=concurrency, **predicators)
 
     async def fetch(self, resource: Resource[_T]) -> _T:
         return await self.staff.fetch_resource(resource)
 
+    def stream(self, resource: Resource[bytes], chunk_size: int | None = None) -> AsyncIterator[bytes]:
+        return self.staff.stream_resource(resource, chunk_size)
+
+    async def broadcast_message(
+        self, targets: Iterable[Selector], message: MessageChain | str, *, concurrency: int = 8
+    ) -> list[BroadcastResult]:
+        if isinstance(message, str):
+            message = MessageChain([Text(message)])
+        return await broadcast_message(self.staff, targets, message, concurrency=concurrency)
+
     async def pull(
         self,
         route: type[_MetadataT] | MetadataRoute[Unpack[tuple[Any, ...]], _MetadataT],
@@ -138,7 +225,9 @@ class Context:
             if not route.has_params():
                 return cast("_MetadataT", meta)
 
-        return await self.staff.pull_metadata(target, route)
+        return await self.account.avilla.metadata_cache.pull(
+            self.account.route, target, route, lambda: self.staff.pull_metadata(target, route), flush=flush
+        )
 
     @overload
     def __getitem__(self, closure: Selector) -> ContextSelector:
@@ -150,7 +239,7 @@ class Context:
 
     def __getitem__(self, closure: Selector | Fn[P, Any]):
         if isinstance(closure, Selector):
-            return ContextSelector(self, closure.pattern)
+            return ContextSelector.from_selector(self, closure)
 
         def run(*args: P.args, **kwargs: P.kwargs):
             return self.staff.call_fn(closure, *args, **kwargs)
@@ -30,13 +30,20 @@ class ContextSelector(Selector):
     def modify(self, pattern: Mapping[str, str]):
         return self.__class__(self.context, pattern)
 
+    def _derive(self, items: tuple[tuple[str, str], ...], hash_: int | None = None):
+        instance = self._from_items(items, hash_)
+        instance.context = self.context
+        return instance
+
     def __deepcopy__(self, memo):
         data = {**self.pattern}
         return self.__class__(copy(self.context), deepcopy(data, memo))
 
     @classmethod
-    def from_selector(cls, cx: Context, selector: Selector) -> Self:
-        return cls(cx, selector.pattern)
+    def from_selector(cls, cx: Context, selector: Selector) -> Self:  # type: ignore[override]
+        instance = super().from_selector(selector)
+        instance.context = cx
+        return instance
 
     @overload
     def __getitem__(self, item: str) -> str:
@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import asyncio
+import base64
+import hashlib
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Hashable
+
+ENCODE_CACHE_BUDGET = 64 * 1024 * 1024
+ENCODE_OFFLOAD_THRESHOLD = 256 * 1024
+
+
+@dataclass(frozen=True)
+class EncodeCacheConfig:
+    """资源 base64 编码缓存的配置.
+
+    - ``budget``: 缓存的编码结果的总字节数上限, 超出时淘汰最久未使用的条目, 设为 0 则不缓存;
+    - ``offload_threshold``: 不小于该字节数的读取与编码交给线程池进行, 以免阻塞事件循环.
+    """
+
+    budget: int = ENCODE_CACHE_BUDGET
+    offload_threshold: int = ENCODE_OFFLOAD_THRESHOLD
+
+
+def _encode(data: bytes) -> str:
+    return base64.b64encode(data).decode("utf-8")
+
+
+def _digest(data: bytes) -> bytes:
+    return hashlib.blake2b(data, digest_size=20).digest()
+
+
+class EncodedResourceCache:
+    """消息序列化时使用的 base64 编码缓存.
+
+    本地文件以 ``(路径, 修改时间, 大小)`` 为键, 文件被修改后自然失效; 其余数据以内容摘要为键.
+    同一键上并发的编码会合并为一次.
+    """
+
+    config: EncodeCacheConfig
+
+    _entries: OrderedDict[Hashable, str]
+    _size: int
+    _pending: dict[Hashable, asyncio.Task[str]]
+
+    def __init__(self, config: EncodeCacheConfig | None = None) -> None:
+        self.config = config or EncodeCacheConfig()
+        self._entries = OrderedDict()
+        self._size = 0
+        self._pending = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    async def read_file(self, path: Path) -> bytes:
+        if path.stat().st_size < self.config.offload_threshold:
+            return path.read_bytes()
+        return await asyncio.to_thread(path.read_bytes)
+
+    async def b64encode_file(self, path: Path) -> str:
+        stat = path.stat()
+        key = ("file", str(path.resolve()), stat.st_mtime_ns, stat.st_size)
+        if stat.st_size < self.config.offload_threshold:
+            return self._lookup(key, lambda: _encode(path.read_bytes()))
+        return await self._run(key, lambda: _encode(path.read_bytes()))
+
+    async def b64encode_bytes(self, data: bytes) -> str:
+        if len(data) < self.config.offload_threshold:
+            # 小数据直接编码比计算摘要并查找更快.
+            return _encode(data)
+        key = ("data", await asyncio.to_thread(_digest, data))
+        return await self._run(key, lambda: _encode(data))
+
+    def _lookup(self, key: Hashable, encode: Callable[[], str]) -> str:
+        value = self._entries.get(key)
+        if value is not None:
+            self._entries.move_to_end(key)
+            return value
+        value = encode()
+        self._store(key, value)
+        return value
+
+    async def _run(self, key: Hashable, encode: Callable[[], str]) -> str:
+        value = self._entries.get(key)
+        if value is not None:
+            self._entries.move_to_end(key)
+            return value
+
+        task = self._pending.get(key)
+        if task is None:
+            task = self._pending[key] = asyncio.create_task(self._encode(key, encode))
+            task.add_done_callback(lambda t: self._release(key, t))
+        return await asyncio.shield(task)
+
+    def _release(self, key: Hashable, task: asyncio.Task):
+        if self._pending.get(key) is task:
+            del self._pending[key]
+
+    async def _encode(self, key: Hashable, encode: Callable[[], str]) -> str:
+        value = await asyncio.to_thread(encode)
+        self._store(key, value)
+        return value
+
+    def _store(self, key: Hashable, value: str):
+        if len(value) > self.config.budget:
+            return
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self._size -= len(previous)
+        self._entries[key] = value
+        self._size += len(value)
+        while self._size > self.config.budget:
+            _, evicted = self._entries.popitem(last=False)
+            self._size -= len(evicted)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._size = 0
@@ -32,7 +32,8 @@ class AvillaEvent(Dispatchable):
             if interface.depth < 1:
                 interface.local_storage["avilla_context"] = interface.event.context
                 interface.local_storage["_context_token"] = cx_context.set(interface.event.context)
-            await interface.event.context.staff.exit_stack.__aenter__()
+            # context.staff 是延迟构造的, 而 AsyncExitStack.__aenter__ 什么也不做,
+            # 因此这里不再进入 exit_stack, 只在 afterExecution 中对已构造的 staff 退出.
 
         @staticmethod
         async def catch(interface: DispatcherInterface[AvillaEvent]):
@@ -57,7 +58,9 @@ class AvillaEvent(Dispatchable):
         async def afterExecution(interface: DispatcherInterface[AvillaEvent], exc, tb):
             if interface.depth < 1:
                 cx_context.reset(interface.local_storage["_context_token"])
-            await interface.event.context.staff.exit_stack.__aexit__(type(exc), exc, tb)
+            staff = getattr(interface.event.context, "_staff", None)
+            if staff is not None:
+                await staff.exit_stack.__aexit__(type(exc), exc, tb)
 
 
 @dataclass
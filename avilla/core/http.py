@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+from pathlib import Path
+from tempfile import SpooledTemporaryFile
+from typing import TYPE_CHECKING, AsyncIterator
+
+try:
+    import aiohttp
+
+    aio = True
+except ImportError:
+    aio = False
+
+if TYPE_CHECKING:
+    from aiohttp import ClientSession
+
+CHUNK_SIZE = 64 * 1024
+FILE_OFFLOAD_THRESHOLD = 256 * 1024
+
+
+@dataclass(frozen=True)
+class HttpPoolConfig:
+    """资源下载使用的共享 HTTP 连接池的配置.
+
+    - ``limit`` / ``limit_per_host``: 总连接数与单个主机的连接数上限;
+    - ``keepalive_timeout``: 空闲连接保留的秒数;
+    - ``timeout``: 单次请求的总超时秒数, 为 None 时不限制;
+    - ``chunk_size``: 流式读取时每块的字节数;
+    - ``spool_max_memory``: ``HttpPool.spool`` 在内存中保留的最大字节数, 超出部分写入临时文件.
+    """
+
+    limit: int = 100
+    limit_per_host: int = 8
+    keepalive_timeout: float = 30.0
+    timeout: float | None = 60.0
+    chunk_size: int = CHUNK_SIZE
+    spool_max_memory: int = 1024 * 1024
+
+
+class HttpPool:
+    """各协议下载资源时共用的 ``aiohttp.ClientSession``, 通过 ``Avilla.http`` 获取.
+
+    会话在首次使用时于当前事件循环中创建, 由 ``AvillaService`` 在退出时关闭.
+    """
+
+    config: HttpPoolConfig
+    _session: ClientSession | None
+    _loop: asyncio.AbstractEventLoop | None
+
+    def __init__(self, config: HttpPoolConfig | None = None) -> None:
+        self.config = config or HttpPoolConfig()
+        self._session = None
+        self._loop = None
+
+    @property
+    def session(self) -> ClientSession:
+        if not aio:
+            raise RuntimeError("aiohttp is not installed")
+
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._loop is not loop:
+            self._discard()
+            config = self.config
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=config.limit,
+                    limit_per_host=config.limit_per_host,
+                    keepalive_timeout=config.keepalive_timeout,
+                ),
+                timeout=aiohttp.ClientTimeout(total=config.timeout),
+            )
+            self._loop = loop
+        return self._session
+
+    def _discard(self) -> None:
+        # 事件循环更换时, 旧会话属于旧循环, 不能在当前循环中等待其关闭.
+        session, loop = self._session, self._loop
+        self._session = None
+        self._loop = None
+        if session is None or session.closed or loop is None:
+            return
+
+        if loop.is_closed():
+            # 旧循环上的连接已无法关闭, 仅与会话分离以释放引用.
+            session.detach()
+        else:
+            # 交给旧循环关闭; 旧循环已停止时, 在其再次运行时关闭.
+            asyncio.run_coroutine_threadsafe(session.close(), loop)
+
+    async def read(self, url: str) -> bytes:
+        async with self.session.get(url) as resp:
+            return await resp.read()
+
+    async def stream(self, url: str, chunk_size: int | None = None) -> AsyncIterator[bytes]:
+        async with self.session.get(url) as resp:
+            async for chunk in resp.content.iter_chunked(chunk_size or self.config.chunk_size):
+                yield chunk
+
+    async def spool(self, url: str, max_memory: int | None = None) -> SpooledTemporaryFile[bytes]:
+        """下载到 ``SpooledTemporaryFile``, 较大的资源不会整体驻留内存; 返回的文件已定位到开头, 由调用者关闭."""
+
+        file = SpooledTemporaryFile(max_size=max_memory or self.config.spool_max_memory)
+        try:
+            async for chunk in self.stream(url):
+                file.write(chunk)
+        except BaseException:
+            file.close()
+            raise
+        file.seek(0)
+        return file
+
+    async def close(self) -> None:
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        self._loop = None
+
+
+async def read_file(path: Path) -> bytes:
+    if path.stat().st_size < FILE_OFFLOAD_THRESHOLD:
+        return path.read_bytes()
+    return await asyncio.to_thread(path.read_bytes)
+
+
+async def stream_file(path: Path, chunk_size: int = CHUNK_SIZE) -> AsyncIterator[bytes]:
+    with path.open("rb") as f:
+        while chunk := await asyncio.to_thread(f.read, chunk_size):
+            yield chunk
+
+
+async def stream_bytes(data: bytes, chunk_size: int = CHUNK_SIZE) -> AsyncIterator[bytes]:
+    view = memoryview(data)
+    for i in range(0, len(view), chunk_size):
+        yield bytes(view[i : i + chunk_size])
@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Mapping, TypeVar, Union
+
+from avilla.core.metadata import Metadata, MetadataRoute
+from avilla.core.selector import Selector
+
+T = TypeVar("T")
+
+_Route = Union[type[Metadata], MetadataRoute]
+_Key = tuple[Selector, Selector, Any]
+
+
+@dataclass
+class MetadataCacheConfig:
+    """账号级元信息缓存的配置.
+
+    - ``ttl``: 按 Metadata 类型 (对于 MetadataRoute, 也可按完整的 route 或其最后一项) 设定的过期秒数,
+      设为 0 则该类型不进入缓存;
+    - ``default_ttl``: 未在 ``ttl`` 中列出的类型使用的过期秒数, 默认为 0, 即不缓存;
+    - ``max_size``: 条目上限, 超出时淘汰最久未使用的条目.
+
+    缓存需按类型显式启用, 仅适合变化不频繁的元信息, 如
+    ``MetadataCacheConfig(ttl={Nick: 60, Avatar: 60, Summary: 60})``.
+    """
+
+    ttl: Mapping[Any, float] = field(default_factory=dict)
+    default_ttl: float = 0
+    max_size: int = 16384
+
+
+class MetadataCache:
+    """``Context.pull`` 使用的元信息缓存, 以 ``(账号, 目标, route)`` 为键.
+
+    同一键上并发的拉取会合并为一次请求; 带有参数的 route 不进入缓存.
+    拉取期间发生的失效会使这次拉取的结果不被写入缓存.
+    """
+
+    config: MetadataCacheConfig
+
+    _entries: OrderedDict[_Key, tuple[float, Any]]
+    _routes: dict[tuple[Selector, Selector], set[Any]]
+    _pending: dict[_Key, asyncio.Task]
+
+    def __init__(self, config: MetadataCacheConfig | None = None) -> None:
+        self.config = config or MetadataCacheConfig()
+        self._entries = OrderedDict()
+        self._routes = {}
+        self._pending = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def ttl_of(self, route: _Route) -> float:
+        ttl = self.config.ttl
+        if route in ttl:
+            return ttl[route]
+        if isinstance(route, MetadataRoute) and route.cells[-1] in ttl:
+            return ttl[route.cells[-1]]
+        return self.config.default_ttl
+
+    def get(self, account: Selector, target: Selector, route: _Route, default: Any = None) -> Any:
+        key = (account, target.as_key(), route)
+        entry = self._entries.get(key)
+        if entry is None:
+            return default
+
+        expire, value = entry
+        if expire < time.monotonic():
+            self._remove(key)
+            return default
+
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, account: Selector, target: Selector, route: _Route, value: Any) -> None:
+        ttl = self.ttl_of(route)
+        if ttl <= 0:
+            return
+
+        key = (account, target.as_key(), route)
+        if key in self._entries:
+            self._entries.move_to_end(key)
+        else:
+            self._routes.setdefault(key[:2], set()).add(route)
+        self._entries[key] = (time.monotonic() + ttl, value)
+
+        while len(self._entries) > self.config.max_size:
+            self._remove(next(iter(self._entries)))
+
+    async def pull(
+        self,
+        account: Selector,
+        target: Selector,
+        route: _Route,
+        fetch: Callable[[], Awaitable[T]],
+        *,
+        flush: bool = False,
+    ) -> T:
+        if route.has_params() or self.ttl_of(route) <= 0:
+            return await fetch()
+
+        target = target.as_key()
+        key = (account, target, route)
+        if flush:
+            self._remove(key)
+        else:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] >= time.monotonic():
+                self._entries.move_to_end(key)
+                return entry[1]
+
+        task = self._pending.get(key)
+        if task is None:
+            task = self._pending[key] = asyncio.create_task(self._fetch(key, fetch))
+            task.add_done_callback(lambda t: self._release(key, t))
+        return await asyncio.shield(task)
+
+    def _release(self, key: _Key, task: asyncio.Task):
+        if self._pending.get(key) is task:
+            del self._pending[key]
+
+    async def _fetch(self, key: _Key, fetch: Callable[[], Awaitable[T]]) -> T:
+        value = await fetch()
+        if self._pending.get(key) is asyncio.current_task():
+            self.set(*key, value)
+        return value
+
+    def invalidate(self, account: Selector, target: Selector, route: _Route | None = None) -> None:
+        target = target.as_key()
+        for key in [i for i in self._pending if i[:2] == (account, target) and route in (None, i[2])]:
+            del self._pending[key]
+
+        if route is not None:
+            self._remove((account, target, route))
+            return
+
+        for i in list(self._routes.get((account, target), ())):
+            self._remove((account, target, i))
+
+    def forget_account(self, account: Selector) -> None:
+        for key in [i for i in self._pending if i[0] == account]:
+            del self._pending[key]
+        for key in [i for i in self._entries if i[0] == account]:
+            self._remove(key)
+
+    def _remove(self, key: _Key):
+        if self._entries.pop(key, None) is None:
+            return
+        routes = self._routes.get(key[:2])
+        if routes is not None:
+            routes.discard(key[2])
+            if not routes:
+                del self._routes[key[:2]]
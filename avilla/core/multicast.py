@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import asyncio
+from contextvars import ContextVar
+from copy import copy
+from dataclasses import dataclass
+from functools import wraps
+from typing import TYPE_CHECKING, Awaitable, Callable, Iterable, TypeVar
+
+from avilla.core.scheduler import cx_send_lane
+from avilla.core.selector import Selector
+
+if TYPE_CHECKING:
+    from graia.amnesia.message import MessageChain
+
+    from avilla.core.ryanvk.staff import Staff
+
+T = TypeVar("T")
+S = TypeVar("S")
+
+cx_serialization_memo: ContextVar[dict[tuple[type, int], asyncio.Future] | None] = ContextVar(
+    "cx_serialization_memo", default=None
+)
+
+
+def memoize_serialization(func: Callable[[S, MessageChain], Awaitable[T]]) -> Callable[[S, MessageChain], Awaitable[T]]:
+    """用于各协议的消息链序列化方法: 在 ``broadcast_message`` 期间, 同一个 MessageChain 只序列化一次.
+
+    序列化过程中的资源上传 (如 Red 的图片上传) 也因此只进行一次.
+    返回值为缓存结果的浅拷贝, 以便发送实现在其上添加字段.
+    """
+
+    @wraps(func)
+    async def wrapper(self: S, chain: MessageChain) -> T:
+        memo = cx_serialization_memo.get()
+        if memo is None:
+            return await func(self, chain)
+
+        key = (type(self), id(chain))
+        future = memo.get(key)
+        if future is None:
+            future = memo[key] = asyncio.ensure_future(func(self, chain))
+        result = await asyncio.shield(future)
+        return copy(result) if isinstance(result, (dict, list)) else result  # type: ignore
+
+    return wrapper
+
+
+@dataclass
+class BroadcastResult:
+    target: Selector
+    message: Selector | None = None
+    error: BaseException | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+async def broadcast_message(
+    staff: Staff,
+    targets: Iterable[Selector],
+    message: MessageChain,
+    *,
+    concurrency: int = 8,
+    lane: str | None = "broadcast",
+) -> list[BroadcastResult]:
+    """向多个目标发送同一条消息, 按 ``targets`` 的顺序返回每个目标的结果, 单个目标的失败不会中断其他目标.
+
+    消息链在每个协议中只序列化一次; 发送经由 ``Avilla.send_scheduler`` 的 ``lane`` 通道,
+    同时进行的发送不超过 ``concurrency`` 个.
+    """
+
+    from avilla.standard.core.message import MessageSend
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def send(target: Selector) -> BroadcastResult:
+        async with semaphore:
+            try:
+                return BroadcastResult(target, await staff.call_fn(MessageSend.send, target, message))
+            except Exception as e:
+                return BroadcastResult(target, error=e)
+
+    memo_token = cx_serialization_memo.set({})
+    lane_token = cx_send_lane.set(lane) if lane is not None else None
+    try:
+        tasks: list[asyncio.Task[BroadcastResult]] = [asyncio.create_task(send(i)) for i in targets]
+    finally:
+        cx_serialization_memo.reset(memo_token)
+        if lane_token is not None:
+            cx_send_lane.reset(lane_token)
+
+    try:
+        return list(await asyncio.gather(*tasks))
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        raise
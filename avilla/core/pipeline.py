@@ -0,0 +1,189 @@
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Hashable, Literal
+
+from loguru import logger
+
+OverflowPolicy = Literal["block", "drop", "drop_oldest", "overflow"]
+EventHandler = Callable[[], Awaitable[Any]]
+
+_EWMA_WEIGHT = 0.1
+
+
+@dataclass(frozen=True)
+class EventPipelineConfig:
+    """事件接收管线的配置.
+
+    - ``workers``: 同时处理事件的最大 worker 数.
+    - ``max_queue``: 等待处理的事件上限.
+    - ``overflow``: 队列满时的策略, 默认为不丢弃事件的 ``overflow``:
+        - ``overflow``: 越过 worker 池, 直接创建任务处理 (即旧行为), 此时不保证 ``ordered``, 也不限制任务数;
+        - ``block``: 阻塞接收循环, 直到队列有空位. 注意, 若 handler 需要等待同一连接上的响应
+          (如 OneBot 的 echo), 所有 worker 都在等待且队列已满时会形成死锁;
+          ``max_queue`` 应大于突发事件数, ``workers`` 应大于同时等待响应的 handler 数;
+        - ``drop``: 丢弃新到达的事件, 需显式启用;
+        - ``drop_oldest``: 丢弃队列中最早的事件, 需显式启用.
+    - ``ordered``: 对带有 key 的事件, 保证同一 key 下的事件按到达顺序依次处理.
+      各协议以事件的场景 (与 ``Context.scene`` 一致) 作为 key, 不同场景之间仍并发处理.
+    """
+
+    workers: int = 32
+    max_queue: int = 4096
+    overflow: OverflowPolicy = "overflow"
+    ordered: bool = False
+
+
+@dataclass
+class EventPipelineMetrics:
+    submitted: int = 0
+    completed: int = 0
+    failed: int = 0
+    dropped: int = 0
+    overflowed: int = 0
+    peak_depth: int = 0
+    queue_latency: float = 0.0
+    handle_latency: float = 0.0
+    # 两项 latency 均为以秒计的指数加权平均值.
+
+
+@dataclass
+class _PipelineJob:
+    handler: EventHandler
+    key: Hashable | None
+    enqueued_at: float = 0.0
+
+
+class EventPipeline:
+    """协议连接层共用的事件接收管线: 有界队列 + worker 池, 以替代逐帧 ``asyncio.create_task``."""
+
+    config: EventPipelineConfig
+    metrics: EventPipelineMetrics
+
+    _queue: deque[_PipelineJob]
+    _deferred: dict[Hashable, deque[_PipelineJob]]
+    _active_keys: set[Hashable]
+    _workers: set[asyncio.Task]
+    _tasks: set[asyncio.Task]
+    _pending: int
+    _space: asyncio.Event | None
+    _saturated: bool
+
+    def __init__(self, config: EventPipelineConfig | None = None) -> None:
+        self.config = config or EventPipelineConfig()
+        self.metrics = EventPipelineMetrics()
+        self._queue = deque()
+        self._deferred = {}
+        self._active_keys = set()
+        self._workers = set()
+        self._tasks = set()
+        self._pending = 0
+        self._space = None
+        self._saturated = False
+
+    @property
+    def depth(self) -> int:
+        return self._pending
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._workers) + len(self._tasks)
+
+    async def submit(self, handler: EventHandler, key: Hashable | None = None) -> bool:
+        self.metrics.submitted += 1
+
+        if self._pending >= self.config.max_queue:
+            policy = self.config.overflow
+            if not self._saturated:
+                self._saturated = True
+                logger.warning(f"event pipeline is saturated ({self._pending} pending), applying {policy!r} policy")
+            if policy == "block":
+                if self._space is None:
+                    self._space = asyncio.Event()
+                while self._pending >= self.config.max_queue:
+                    self._space.clear()
+                    await self._space.wait()
+            elif policy == "drop":
+                self.metrics.dropped += 1
+                return False
+            elif policy == "drop_oldest":
+                if not self._queue:
+                    self.metrics.dropped += 1
+                    return False
+                self._take(self._queue.popleft())
+                self.metrics.dropped += 1
+            else:
+                self.metrics.overflowed += 1
+                task = asyncio.create_task(self._run(_PipelineJob(handler, None)))
+                self._tasks.add(task)
+                task.add_done_callback(self._tasks.discard)
+                return True
+
+        job = _PipelineJob(handler, key if self.config.ordered else None, asyncio.get_running_loop().time())
+        self._pending += 1
+        self.metrics.peak_depth = max(self.metrics.peak_depth, self._pending)
+        if self._saturated and self._pending <= self.config.max_queue // 2:
+            self._saturated = False
+
+        if job.key is None:
+            self._queue.append(job)
+        elif job.key in self._active_keys:
+            self._deferred.setdefault(job.key, deque()).append(job)
+        else:
+            self._active_keys.add(job.key)
+            self._queue.append(job)
+
+        if self._queue and len(self._workers) < self.config.workers:
+            worker = asyncio.create_task(self._work())
+            self._workers.add(worker)
+            worker.add_done_callback(self._workers.discard)
+
+        return True
+
+    def _take(self, job: _PipelineJob):
+        self._pending -= 1
+        if self._space is not None:
+            self._space.set()
+        if job.key is not None:
+            self._release(job.key)
+
+    def _release(self, key: Hashable):
+        deferred = self._deferred.get(key)
+        if not deferred:
+            self._active_keys.discard(key)
+            return
+
+        self._queue.append(deferred.popleft())
+        if not deferred:
+            del self._deferred[key]
+
+    async def _run(self, job: _PipelineJob):
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        if job.enqueued_at:
+            self.metrics.queue_latency += (start - job.enqueued_at - self.metrics.queue_latency) * _EWMA_WEIGHT
+
+        try:
+            await job.handler()
+        except Exception:
+            self.metrics.failed += 1
+            logger.exception("unhandled exception in event pipeline")
+        else:
+            self.metrics.completed += 1
+        finally:
+            self.metrics.handle_latency += (loop.time() - start - self.metrics.handle_latency) * _EWMA_WEIGHT
+
+    async def _work(self):
+        while self._queue:
+            job = self._queue.popleft()
+            self._pending -= 1
+            if self._space is not None:
+                self._space.set()
+
+            try:
+                await self._run(job)
+            finally:
+                if job.key is not None:
+                    self._release(job.key)
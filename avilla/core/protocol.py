@@ -6,7 +6,10 @@ from typing import TYPE_CHECKING, Any, ClassVar
 from typing_extensions import Self
 
 from avilla.core._runtime import cx_avilla, cx_context, cx_protocol
+from avilla.core.codec import DEFAULT_JSON_CODEC, JsonCodec
 from avilla.core.event import AvillaEvent
+from avilla.core.pipeline import EventPipelineConfig
+from avilla.core.singleflight import SingleFlightConfig
 
 if TYPE_CHECKING:
     from avilla.core.application import Avilla
@@ -14,7 +17,31 @@ if TYPE_CHECKING:
 
 
 class ProtocolConfig:
-    ...
+    """各协议配置的基类.
+
+    以下选项会作为带默认值的字段追加在子类 (dataclass) 自身的字段之后, 构造时以关键字传入,
+    如 ``OneBot11ForwardConfig(endpoint, event_pipeline=EventPipelineConfig(workers=8))``:
+
+    - ``event_pipeline``: 连接层事件接收管线的配置;
+    - ``json_codec``: 连接层收发帧所用的编解码器, 如 ``get_json_codec("orjson")``;
+    - ``single_flight``: 合并同时进行的相同只读调用, 如 ``SingleFlightConfig(frozenset({"get_*"}))``.
+    """
+
+    event_pipeline: EventPipelineConfig = EventPipelineConfig()
+    json_codec: JsonCodec = DEFAULT_JSON_CODEC
+    single_flight: SingleFlightConfig = SingleFlightConfig()
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        # 在 @dataclass 处理之前写入子类自身的注解, 使这些字段排在子类无默认值的字段之后.
+        annotations = cls.__dict__.get("__annotations__")
+        if annotations is None:
+            annotations = {}
+            cls.__annotations__ = annotations
+        for name in ("event_pipeline", "json_codec", "single_flight"):
+            if name not in annotations:
+                annotations[name] = ProtocolConfig.__annotations__[name]
+                setattr(cls, name, getattr(cls, name))
 
 
 class BaseProtocol:
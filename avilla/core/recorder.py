@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import random
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Mapping
+
+from loguru import logger
+
+
+@dataclass
+class EventRecordConfig:
+    """事件记录的配置.
+
+    - ``sample``: 按事件类型 (包括其子类) 设定的采样比例, 取值 0 ~ 1;
+    - ``rate_limit``: 按事件类型 (包括其子类) 设定的每秒最多记录条数.
+    """
+
+    sample: Mapping[type, float] = field(default_factory=dict)
+    rate_limit: Mapping[type, float] = field(default_factory=dict)
+
+
+class _TokenBucket:
+    __slots__ = ("rate", "tokens", "updated_at")
+
+    def __init__(self, rate: float) -> None:
+        self.rate = rate
+        self.tokens = rate
+        self.updated_at = time.monotonic()
+
+    def take(self) -> bool:
+        now = time.monotonic()
+        self.tokens = min(self.rate, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+        if self.tokens < 1:
+            return False
+        self.tokens -= 1
+        return True
+
+
+class EventRecorder:
+    """结构化的事件记录器.
+
+    字段均以无参 callable 传入, 交由 loguru 的 ``lazy`` 模式在确有 sink 接收时才求值,
+    求值后的字段同时出现在 ``record["extra"]`` 中, 便于结构化的 sink 使用.
+    如需将格式化与写出移出事件循环, 请以 ``logger.add(..., enqueue=True)`` 添加 sink.
+    """
+
+    config: EventRecordConfig
+
+    _policies: dict[type, tuple[float | None, _TokenBucket | None]]
+
+    def __init__(self, config: EventRecordConfig | None = None) -> None:
+        self.config = config or EventRecordConfig()
+        self._policies = {}
+
+    def _resolve_policy(self, event_type: type) -> tuple[float | None, _TokenBucket | None]:
+        sample = next((self.config.sample[i] for i in event_type.__mro__ if i in self.config.sample), None)
+        rate = next((self.config.rate_limit[i] for i in event_type.__mro__ if i in self.config.rate_limit), None)
+        return sample, _TokenBucket(rate) if rate is not None else None
+
+    def allow(self, event_type: type) -> bool:
+        policy = self._policies.get(event_type)
+        if policy is None:
+            policy = self._policies[event_type] = self._resolve_policy(event_type)
+
+        sample, bucket = policy
+        if sample is not None and random.random() >= sample:
+            return False
+        return bucket is None or bucket.take()
+
+    def emit(self, level: str, template: str, **fields: Callable[[], Any]) -> None:
+        logger.opt(lazy=True, depth=1).log(level, template, **fields)
@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Iterable, Mapping
+
+from avilla.core.selector import Selector
+
+ROSTER_TTL = 300.0
+
+
+@dataclass
+class RosterConfig:
+    """联系人资料缓存的配置.
+
+    - ``ttl``: 按 Selector 的最后一个键 (如 ``group``, ``friend``, ``member``) 设定的过期秒数;
+    - ``default_ttl``: 未在 ``ttl`` 中列出的种类使用的过期秒数;
+    - ``max_size``: 条目上限, 超出时淘汰最久未使用的条目.
+    """
+
+    ttl: Mapping[str, float] = field(default_factory=dict)
+    default_ttl: float = ROSTER_TTL
+    max_size: int = 65536
+
+
+def _parent(selector: Selector) -> Selector | None:
+    pairs = selector.pairs
+    if len(pairs) <= 1:
+        return None
+    return Selector.from_pairs(pairs[:-1])
+
+
+class RosterCache:
+    """各协议共用的群组, 好友, 成员等原始资料缓存.
+
+    以 ``(账号, 目标)`` 两个 Selector 为键, 所有操作都是同步的;
+    批量写入只需一次调用, 同时按父级维护索引, 以便在群解散等情况下连同其成员一并失效.
+    """
+
+    config: RosterConfig
+
+    _entries: OrderedDict[tuple[Selector, Selector], tuple[float, Any]]
+    _children: dict[tuple[Selector, Selector], set[Selector]]
+    _scopes: dict[Selector, AccountRoster]
+
+    def __init__(self, config: RosterConfig | None = None) -> None:
+        self.config = config or RosterConfig()
+        self._entries = OrderedDict()
+        self._children = {}
+        self._scopes = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def scope(self, account: Selector) -> AccountRoster:
+        view = self._scopes.get(account)
+        if view is None:
+            view = self._scopes[account] = AccountRoster(self, account)
+        return view
+
+    def ttl_of(self, target: Selector) -> float:
+        return self.config.ttl.get(target.last_key, self.config.default_ttl)
+
+    def get(self, account: Selector, target: Selector, default: Any = None) -> Any:
+        key = (account, target.as_key())
+        entry = self._entries.get(key)
+        if entry is None:
+            return default
+
+        expire, value = entry
+        if expire < time.monotonic():
+            self._remove(key)
+            return default
+
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, account: Selector, target: Selector, value: Any, ttl: float | None = None) -> None:
+        target = target.as_key()
+        self._insert((account, target), value, time.monotonic() + (self.ttl_of(target) if ttl is None else ttl))
+        self._evict()
+
+    def set_many(self, account: Selector, items: Iterable[tuple[Selector, Any]], ttl: float | None = None) -> None:
+        now = time.monotonic()
+        for target, value in items:
+            target = target.as_key()
+            self._insert((account, target), value, now + (self.ttl_of(target) if ttl is None else ttl))
+        self._evict()
+
+    def invalidate(self, account: Selector, target: Selector, *, recursive: bool = False) -> None:
+        key = (account, target.as_key())
+        self._remove(key)
+        if recursive:
+            for child in list(self._children.get(key, ())):
+                self.invalidate(account, child, recursive=True)
+
+    def forget_account(self, account: Selector) -> None:
+        for key in [i for i in self._entries if i[0] == account]:
+            self._remove(key)
+        self._scopes.pop(account, None)
+
+    def _insert(self, key: tuple[Selector, Selector], value: Any, expire: float):
+        entries = self._entries
+        if key in entries:
+            entries.move_to_end(key)
+        else:
+            parent = _parent(key[1])
+            if parent is not None:
+                self._children.setdefault((key[0], parent), set()).add(key[1])
+        entries[key] = (expire, value)
+
+    def _remove(self, key: tuple[Selector, Selector]):
+        if self._entries.pop(key, None) is None:
+            return
+        parent = _parent(key[1])
+        if parent is None:
+            return
+        siblings = self._children.get((key[0], parent))
+        if siblings is not None:
+            siblings.discard(key[1])
+            if not siblings:
+                del self._children[(key[0], parent)]
+
+    def _evict(self):
+        while len(self._entries) > self.config.max_size:
+            self._remove(next(iter(self._entries)))
+
+
+class AccountRoster:
+    """绑定到单个账号的 ``RosterCache`` 视图, 通过 ``BaseAccount.roster`` 获取."""
+
+    __slots__ = ("cache", "account")
+
+    cache: RosterCache
+    account: Selector
+
+    def __init__(self, cache: RosterCache, account: Selector) -> None:
+        self.cache = cache
+        self.account = account
+
+    def get(self, target: Selector, default: Any = None) -> Any:
+        return self.cache.get(self.account, target, default)
+
+    def set(self, target: Selector, value: Any, ttl: float | None = None) -> None:
+        self.cache.set(self.account, target, value, ttl)
+
+    def set_many(self, items: Iterable[tuple[Selector, Any]], ttl: float | None = None) -> None:
+        self.cache.set_many(self.account, items, ttl)
+
+    def invalidate(self, target: Selector, *, recursive: bool = False) -> None:
+        self.cache.invalidate(self.account, target, recursive=recursive)
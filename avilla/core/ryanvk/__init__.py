@@ -4,6 +4,7 @@ from avilla.core.ryanvk.collector.context import (
 from avilla.core.ryanvk.collector.context import ContextCollector as ContextCollector
 from avilla.core.ryanvk.descriptor.query import QueryRecord as QueryRecord
 from avilla.core.ryanvk.descriptor.query import QuerySchema as QuerySchema
+from avilla.core.ryanvk.fn import ScheduledFn as ScheduledFn
 from avilla.core.ryanvk.overload.metadata import MetadataOverload as MetadataOverload
 from avilla.core.ryanvk.overload.target import TargetOverload as TargetOverload
 from graia.ryanvk.capability import Capability as Capability
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Callable
+
+from typing_extensions import Concatenate, ParamSpec, TypeVar
+
+from graia.ryanvk import Fn, OverloadBehavior
+
+if TYPE_CHECKING:
+    from graia.ryanvk import BaseCollector, Staff
+
+P = ParamSpec("P")
+R = TypeVar("R", covariant=True)
+
+
+class SyncFallbackBehavior(OverloadBehavior):
+    """异步 Fn 上没有对应实现时, 回落到同步 Fn ``fallback`` 上注册的实现, 并将其结果包装为协程.
+
+    用于 ``deserialize_element`` 等拆分出同步快速路径的 Fn: 无需等待的常见元素注册在 ``fallback`` 上,
+    直接调用异步 Fn 的代码不受影响. 分派总是先在异步 Fn 上进行, 因此注册在异步 Fn 上的覆写优先于同步实现.
+    """
+
+    fallback: Fn
+    adapters: dict[Callable, Callable]
+
+    def __init__(self, fallback: Fn) -> None:
+        super().__init__()
+        self.fallback = fallback
+        self.adapters = {}
+
+    def harvest_with_fallback(
+        self, staff: Staff, fn: Fn[P, R], *args: P.args, **kwargs: P.kwargs
+    ) -> tuple[BaseCollector, Callable[..., Any], bool]:
+        """分派并返回 ``(collector, entity, is_sync)``; ``is_sync`` 为 True 时 entity 来自 ``fallback``, 未经包装."""
+        try:
+            return (*super().harvest_overload(staff, fn, *args, **kwargs), False)
+        except NotImplementedError:
+            return (*self.fallback.behavior.harvest_overload(staff, self.fallback, *args, **kwargs), True)
+
+    def harvest_overload(
+        self, staff: Staff, fn: Fn[P, R], *args: P.args, **kwargs: P.kwargs
+    ) -> tuple[BaseCollector, Callable[Concatenate[Any, P], R]]:
+        collector, entity, is_sync = self.harvest_with_fallback(staff, fn, *args, **kwargs)
+        if not is_sync:
+            return collector, entity
+
+        adapter = self.adapters.get(entity)
+        if adapter is None:
+
+            async def adapter(perform, *args, **kwargs):
+                return entity(perform, *args, **kwargs)
+
+            self.adapters[entity] = adapter
+
+        return collector, adapter  # type: ignore
@@ -3,7 +3,7 @@ from __future__ import annotations
 from typing import Any, Callable, TypedDict
 
 from avilla.core.ryanvk.descriptor.query import QueryRecord, find_querier_steps
-from avilla.core.selector import FollowsPredicater, _parse_follows
+from avilla.core.selector import FollowsPattern, FollowsPredicater
 from graia.ryanvk import FnOverload, OverloadBehavior
 from graia.ryanvk.collector import BaseCollector
 
@@ -38,7 +38,7 @@ class QueryOverload(FnOverload):
         scope: dict[QueryRecord, set[tuple[BaseCollector, Callable[..., Any]]]],
         args: QueryCallArgs,
     ):
-        items = _parse_follows(args["pattern"], **args["predicators"])
+        items = FollowsPattern.compile(args["pattern"], **args["predicators"]).items
         steps = find_querier_steps(scope, items)
 
         if steps is None:
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
+import asyncio
 from collections import deque
 from dataclasses import dataclass
-from typing import Any, AsyncGenerator, Callable, Container, Protocol, overload
+from typing import Any, AsyncGenerator, Callable, Container, Protocol, Sequence, overload
 
 from avilla.core.selector import Selector, _FollowItem
 from graia.ryanvk import BaseCollector
@@ -16,6 +17,17 @@ class QueryRecord:
     into: str
 
 
+@dataclass(unsafe_hash=True)
+class QueryPointRecord:
+    """点查询实现的记录: 当该层仅有一项且为字面量时, 以字面量 (str) 作为 predicate 调用, 替代完整扫描.
+
+    点查询不参与路径计算, 因此同一层必须同时注册有常规的 (扫描) 实现.
+    """
+
+    previous: str | None
+    into: str
+
+
 class QueryHandlerPerform(Protocol):
     def __call__(
         fself, self: Any, predicate: Callable[[str, str], bool] | str, previous: Selector | None = None
@@ -40,19 +52,21 @@ class QueryHandlerPerformPrev(Protocol):
 class QuerySchema:
     @overload
     def collect(
-        self, collector: BaseCollector, target: str, previous: None = None
+        self, collector: BaseCollector, target: str, previous: None = None, *, point: bool = False
     ) -> Callable[[QueryHandlerPerformNoPrev], QueryHandlerPerformNoPrev]:
         ...
 
     @overload
     def collect(
-        self, collector: BaseCollector, target: str, previous: str
+        self, collector: BaseCollector, target: str, previous: str, *, point: bool = False
     ) -> Callable[[QueryHandlerPerformPrev], QueryHandlerPerformPrev]:
         ...
 
-    def collect(self, collector: BaseCollector, target: str, previous: ... = None) -> ...:
+    def collect(self, collector: BaseCollector, target: str, previous: ... = None, *, point: bool = False) -> ...:
+        record = QueryPointRecord(previous, target) if point else QueryRecord(previous, target)
+
         def receive(entity: QueryHandlerPerform):
-            collector.artifacts[QueryRecord(previous, target)] = (collector, entity)
+            collector.artifacts[record] = (collector, entity)
             return entity
 
         return receive
@@ -65,19 +79,59 @@ class QueryHandler(Protocol):
         ...
 
 
+_DONE = object()
+
+
 # 使用 functools.reduce.
 async def query_depth_generator(
     handler: QueryHandler,
     predicate: Callable[[str, str], bool] | str,
     previous_generator: AsyncGenerator[Selector, None] | None = None,
+    concurrency: int = 1,
 ):
-    if previous_generator is not None:
+    if previous_generator is None:
+        async for current in handler(predicate):
+            yield current
+        return
+
+    if concurrency <= 1:
         async for previous in previous_generator:
             async for current in handler(predicate, previous):
                 yield current
-    else:
-        async for current in handler(predicate):
+        return
+
+    # 对上一层的每个结果并发地展开下一层, 同时进行的子查询不超过 concurrency 个; 结果按完成顺序产出.
+    queue: asyncio.Queue[Any] = asyncio.Queue()
+    limiter = asyncio.Semaphore(concurrency)
+
+    async def expand(previous: Selector):
+        try:
+            async for current in handler(predicate, previous):
+                queue.put_nowait(current)
+        finally:
+            limiter.release()
+
+    async def fan_out():
+        children: list[asyncio.Task] = []
+        try:
+            async for previous in previous_generator:
+                await limiter.acquire()
+                children.append(asyncio.create_task(expand(previous)))
+            await asyncio.gather(*children)
+        except BaseException:
+            for child in children:
+                child.cancel()
+            raise
+        finally:
+            queue.put_nowait(_DONE)
+
+    producer = asyncio.create_task(fan_out())
+    try:
+        while (current := await queue.get()) is not _DONE:
             yield current
+        await producer
+    finally:
+        producer.cancel()
 
 
 @dataclass
@@ -89,7 +143,7 @@ class _MatchStep:
 
 def find_querier_steps(
     artifacts: Container[Any],
-    frags: list[_FollowItem],
+    frags: Sequence[_FollowItem],
 ) -> list[tuple[tuple[_FollowItem, ...], QueryRecord]] | None:
     result: list[tuple[tuple[_FollowItem, ...], QueryRecord]] | None = None
     queue: deque[_MatchStep] = deque([_MatchStep("", 0, ())])
@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Callable
+
+from typing_extensions import Concatenate, ParamSpec, TypeVar
+
+from avilla.core.selector import Selector
+from graia.ryanvk import BaseCollector, Fn
+
+if TYPE_CHECKING:
+    from graia.ryanvk import Staff
+
+P = ParamSpec("P")
+R = TypeVar("R", covariant=True)
+
+
+class ScheduledFn(Fn[P, R]):
+    """执行前经过 ``Avilla.send_scheduler`` 排队的 Fn, 用于 ``MessageSend.send`` 等出站操作.
+
+    以参数 ``target`` 作为发送目标, 带有 ``reply`` 时进入 reply 通道; staff 中缺少账号时直接执行.
+    """
+
+    def execute(
+        self,
+        staff: Staff,
+        collector: BaseCollector,
+        entity: Callable[Concatenate[Any, P], R],
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> R:
+        result = super().execute(staff, collector, entity, *args, **kwargs)
+
+        avilla = staff.components.get("avilla")
+        account = staff.components.get("account")
+        target = kwargs.get("target", args[0] if args else None)
+        if avilla is None or account is None or not isinstance(target, Selector):
+            return result
+        if not avilla.send_scheduler.config.enabled:
+            return result
+
+        return avilla.send_scheduler.schedule(  # type: ignore
+            account.route, target, result, reply=kwargs.get("reply") is not None
+        )
@@ -38,6 +38,9 @@ class MetadataOverload(FnOverload):
 
         return sets.pop().intersection(*sets)
 
+    def get_dispatch_key(self, args: dict[str, Route]) -> tuple | None:
+        return tuple(args.values())
+
     def merge_scopes(self, *scopes: dict[Any, Any]):
         # layout: {param_name: {route: set()}}
         result = {}
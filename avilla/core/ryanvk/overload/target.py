@@ -1,14 +1,19 @@
 from __future__ import annotations
 
+from collections import OrderedDict
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Any, Callable
+from typing import TYPE_CHECKING, Any, Callable, FrozenSet
 
 from typing_extensions import TypeAlias
 
-from avilla.core.selector import FollowsPredicater, Selector, _parse_follows
+from avilla.core.selector import FollowsPattern, FollowsPredicater, Selector
+from graia.ryanvk.behavior import get_dispatch_generation
 from graia.ryanvk.collector import BaseCollector
 from graia.ryanvk.overload import FnOverload
 
+PATH_CACHE_SIZE = 256
+MATCHER_CACHE_SIZE = 64
+
 
 @dataclass
 class LookupBranchMetadata:
@@ -53,7 +58,119 @@ def _merge_lookup_collection(current: LookupCollection, other: LookupCollection)
     current |= other
 
 
+BindSet: TypeAlias = "FrozenSet[tuple[BaseCollector, Callable]]"
+
+
+@dataclass(frozen=True)
+class CompiledNode:
+    levels: dict[str, CompiledBranches]
+    bind: BindSet
+
+
+@dataclass(frozen=True)
+class CompiledBranches:
+    literals: dict[str, CompiledNode]
+    predicates: tuple[tuple[FollowsPredicater, CompiledNode], ...]
+    default: CompiledNode | None
+    wildcard: BindSet | None
+    keyed_only: bool
+    # keyed_only: 该层没有 literal 与 predicate 分支, 命中结果仅取决于 key.
+
+
+def _compile_levels(levels: LookupCollection) -> dict[str, CompiledBranches]:
+    return {key: _compile_branches(branches) for key, branches in levels.items()}
+
+
+def _compile_branches(branches: LookupBranches) -> CompiledBranches:
+    default_branch = branches.get(None)
+    literals: dict[str, CompiledNode] = {}
+    predicates: list[tuple[FollowsPredicater, CompiledNode]] = []
+
+    for header, branch in branches.items():
+        if header is None:
+            continue
+
+        levels = branch.levels if default_branch is None else default_branch.levels | branch.levels
+        node = CompiledNode(_compile_levels(levels), frozenset(branch.bind))
+
+        if callable(header):
+            predicates.append((header, node))
+        else:
+            literals[header] = node
+
+    return CompiledBranches(
+        literals,
+        tuple(predicates),
+        None
+        if default_branch is None
+        else CompiledNode(_compile_levels(default_branch.levels), frozenset(default_branch.bind)),
+        literals["*"].bind if "*" in literals else None,
+        not literals and not predicates,
+    )
+
+
+class TargetMatcher:
+    """由 LookupCollection 编译而来的不可变匹配器, 附带对 literal-free 路径的 LRU 缓存."""
+
+    root: dict[str, CompiledBranches]
+    path_cache: OrderedDict[str, BindSet]
+
+    def __init__(self, collection: LookupCollection) -> None:
+        self.root = _compile_levels(collection)
+        self.path_cache = OrderedDict()
+
+    def lookup(self, selector: Selector) -> BindSet:
+        path = selector.path
+        if (cached := self.path_cache.get(path)) is not None:
+            self.path_cache.move_to_end(path)
+            return cached
+
+        levels = self.root
+        node = None
+        keyed_only = True
+
+        for key, value in selector.pattern.items():
+            if (branches := levels.get(key)) is None:
+                raise NotImplementedError
+
+            keyed_only = keyed_only and branches.keyed_only
+            node = branches.literals.get(value)
+            if node is None:
+                for predicate, predicate_node in branches.predicates:
+                    if predicate(value):
+                        node = predicate_node  # hit predicate
+                        break
+                else:
+                    if branches.default is not None:
+                        node = branches.default  # hit default
+                    elif branches.wildcard is not None:
+                        return branches.wildcard  # hit wildcard
+                    else:
+                        raise NotImplementedError
+
+            levels = node.levels
+
+        if node is None or not node.bind:
+            raise NotImplementedError
+
+        if keyed_only:
+            self.path_cache[path] = node.bind
+            if len(self.path_cache) > PATH_CACHE_SIZE:
+                self.path_cache.popitem(last=False)
+
+        return node.bind
+
+
 class TargetOverload(FnOverload):
+    matchers: dict[int, tuple[LookupCollection, TargetMatcher]]
+    # layout: {id(collection): (collection, matcher)}
+    # collection 被强引用, 以保证缓存存活期间 id 不会被复用; 分派缓存失效或超出上限时整体清空.
+    generation: int
+
+    def __init__(self) -> None:
+        self.matchers = {}
+        self.generation = get_dispatch_generation()
+
     def collect_entity(
         self,
         collector: BaseCollector,
@@ -69,7 +186,7 @@ class TargetOverload(FnOverload):
             if isinstance(pattern, str):
                 pattern = TargetOverloadConfig(pattern)
 
-            pattern_items = _parse_follows(pattern.pattern, **pattern.predicators)
+            pattern_items = FollowsPattern.compile(pattern.pattern, **pattern.predicators).items
             if not pattern_items:
                 raise ValueError("invalid target pattern")
 
@@ -93,48 +210,35 @@ class TargetOverload(FnOverload):
 
             branch.bind.add(record)
 
+    def get_matcher(self, collection: LookupCollection) -> TargetMatcher:
+        generation = get_dispatch_generation()
+        if self.generation != generation:
+            self.matchers.clear()
+            self.generation = generation
+
+        cached = self.matchers.get(id(collection))
+        if cached is not None and cached[0] is collection:
+            return cached[1]
+
+        if len(self.matchers) >= MATCHER_CACHE_SIZE:
+            self.matchers.clear()
+        matcher = TargetMatcher(collection)
+        self.matchers[id(collection)] = (collection, matcher)
+        return matcher
+
     def get_entities(self, scope: dict[Any, Any], args: dict[str, Selector]) -> set[tuple[BaseCollector, Callable]]:
-        bind_sets: list[set] = []
+        bind_sets: list[BindSet] = []
 
         for arg_name, selector in args.items():
             if arg_name not in scope:
                 raise NotImplementedError
 
-            def get_bind_set():
-                processing_scope: LookupCollection = scope[arg_name]
-                branch = None
-                for key, value in selector.pattern.items():
-                    if (branches := processing_scope.get(key)) is None:
-                        raise NotImplementedError
+            bind_sets.append(self.get_matcher(scope[arg_name]).lookup(selector))
 
-                    if value in branches:
-                        header = value
-                    else:
-                        for _key, branch in branches.items():
-                            if callable(_key) and _key(value):
-                                header = _key
-                                break  # hit predicate
-                        else:
-                            if None in branches:
-                                header = None  # hit default
-                            elif "*" in branches:
-                                return branches["*"].bind  # hit wildcard
-                            else:
-                                raise NotImplementedError
-
-                    branch = branches[header]
-                    processing_scope = branch.levels
-
-                    if header is not None and None in branches:
-                        processing_scope = branches[None].levels | processing_scope
-                if branch is not None and branch.bind:
-                    # branch has bind
-                    return branch.bind
-
-                raise NotImplementedError
+        if len(bind_sets) == 1:
+            return bind_sets[0]  # type: ignore
 
-            bind_sets.append(get_bind_set())
-        return bind_sets.pop().intersection(*bind_sets)
+        return bind_sets.pop().intersection(*bind_sets)  # type: ignore
 
     def merge_scopes(self, *scopes: dict[Any, Any]):
         # scope layout: {
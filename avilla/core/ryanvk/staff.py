@@ -1,24 +1,27 @@
 from __future__ import annotations
 
-from functools import reduce
-from typing import TYPE_CHECKING, Any, Callable, ChainMap, overload
+from functools import partial, reduce
+from typing import TYPE_CHECKING, Any, AsyncIterator, Awaitable, Callable, ChainMap, Hashable, Iterable, overload
 
 from typing_extensions import ParamSpec, TypeVar, Unpack
 
 from avilla.core.builtins.capability import CoreCapability
 from avilla.core.metadata import MetadataRoute
 from avilla.core.selector import (
+    FollowsPattern,
     FollowsPredicater,
     Selector,
     _FollowItem,
-    _parse_follows,
 )
-from graia.ryanvk import BaseCollector
+from graia.ryanvk import BaseCollector, Fn
 from graia.ryanvk import Staff as BaseStaff
 
-from .descriptor.query import find_querier_steps, query_depth_generator
+from .behavior.fallback import SyncFallbackBehavior
+from .descriptor.query import QueryPointRecord, find_querier_steps, query_depth_generator
 
 if TYPE_CHECKING:
+    from graia.amnesia.message import Element
+
     from avilla.core.metadata import Metadata
     from avilla.core.resource import Resource
 
@@ -43,6 +46,16 @@ class Staff(BaseStaff):
     async def fetch_resource(self, resource: Resource[T]) -> T:
         return await self.get_fn_call(CoreCapability.fetch)(resource)
 
+    async def stream_resource(self, resource: Resource[bytes], chunk_size: int | None = None) -> AsyncIterator[bytes]:
+        try:
+            chunks = self.call_fn(CoreCapability.stream, resource, chunk_size)
+        except NotImplementedError:
+            # 未实现流式读取的资源, 退回到一次性获取.
+            yield await self.fetch_resource(resource)
+            return
+        async for chunk in chunks:
+            yield chunk
+
     @overload
     async def pull_metadata(
         self,
@@ -66,8 +79,40 @@ class Staff(BaseStaff):
     ):
         return await self.call_fn(CoreCapability.pull, target, route)
 
-    async def query_entities(self, pattern: str, **predicators: FollowsPredicater):
-        items = _parse_follows(pattern, **predicators)
+    async def deserialize_elements(
+        self,
+        raw_elements: Iterable[T],
+        key: Callable[[T], Hashable],
+        fn: Fn[[T], Awaitable[Element]],
+    ) -> list[Element]:
+        """批量反序列化消息元素.
+
+        每种元素 (由 ``key`` 区分, 需与 ``fn`` 的 overload 一致) 只分派一次.
+        ``fn`` 使用 ``SyncFallbackBehavior`` 时, 分派回落到同步快速路径的元素直接同步解码, 不再经过协程.
+        """
+
+        behavior = fn.behavior
+        decoders: dict[Hashable, tuple[bool, Callable[[T], Any]]] = {}
+        elements: list[Element] = []
+
+        for raw_element in raw_elements:
+            k = key(raw_element)
+            decoder = decoders.get(k)
+            if decoder is None:
+                if isinstance(behavior, SyncFallbackBehavior):
+                    collector, entity, is_sync = behavior.harvest_with_fallback(self, fn, raw_element)
+                    executor = behavior.fallback if is_sync else fn
+                    decoder = decoders[k] = (is_sync, partial(executor.execute, self, collector, entity))
+                else:
+                    decoder = decoders[k] = (False, self.bind_fn(fn, raw_element))
+
+            is_sync, decode = decoder
+            elements.append(decode(raw_element) if is_sync else await decode(raw_element))
+
+        return elements
+
+    async def query_entities(self, pattern: str, *, concurrency: int = 1, **predicators: FollowsPredicater):
+        items = FollowsPattern.compile(pattern, **predicators).items
         artifact_map = ChainMap(*self.artifact_collections)
         steps = find_querier_steps(artifact_map, items)
 
@@ -108,10 +153,15 @@ class Staff(BaseStaff):
 
         handlers = []
         for follow_item, query_record in steps:
-            handlers.append((follow_item, build_handler(artifact_map[query_record])))
+            # 该层仅有一项且为字面量时, 优先使用点查询实现, 以字面量本身作为 predicate.
+            point_record = QueryPointRecord(query_record.previous, query_record.into)
+            if len(follow_item) == 1 and follow_item[0].literal is not None and point_record in artifact_map:
+                handlers.append((follow_item[0].literal, build_handler(artifact_map[point_record])))
+            else:
+                handlers.append((build_predicate(follow_item), build_handler(artifact_map[query_record])))
 
         r = reduce(
-            lambda previous, current: query_depth_generator(current[1], build_predicate(current[0]), previous),
+            lambda previous, current: query_depth_generator(current[1], current[0], previous, concurrency),
             handlers,
             None,
         )
@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict, deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Awaitable, TypeVar
+
+from avilla.core.selector import Selector
+
+T = TypeVar("T")
+
+SEND_LANES = ("reply", "normal", "broadcast")
+
+cx_send_lane: ContextVar[str | None] = ContextVar("cx_send_lane", default=None)
+
+
+@dataclass(frozen=True)
+class SendSchedulerConfig:
+    """出站发送调度的配置, 速率均以 "条/秒" 计, 为 None 时不作限制.
+
+    - ``account_rate`` / ``account_burst``: 每个账号的令牌桶;
+    - ``scene_rate`` / ``scene_burst``: 每个账号下, 每个发送目标 (群, 好友, 频道等) 的令牌桶;
+    - ``lanes``: 优先级从高到低的发送通道. 带有 ``reply`` 的发送进入 ``reply``, 其余进入 ``normal``,
+      也可以通过 ``SendScheduler.lane`` 指定, 如群发时使用 ``broadcast``.
+
+    同一通道内, 各发送目标之间轮流放行, 避免单个目标的突发挤占其他目标.
+    """
+
+    account_rate: float | None = None
+    account_burst: int = 5
+    scene_rate: float | None = None
+    scene_burst: int = 3
+    lanes: tuple[str, ...] = SEND_LANES
+
+    @property
+    def enabled(self) -> bool:
+        return self.account_rate is not None or self.scene_rate is not None
+
+
+class _Bucket:
+    __slots__ = ("rate", "burst", "tokens", "updated_at")
+
+    def __init__(self, rate: float, burst: int, now: float) -> None:
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated_at = now
+
+    def wait_time(self, now: float) -> float:
+        self.tokens = min(self.burst, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+        return 0.0 if self.tokens >= 1 else (1 - self.tokens) / self.rate
+
+    def take(self):
+        self.tokens -= 1
+
+
+@dataclass
+class _AccountState:
+    bucket: _Bucket | None
+    lanes: dict[str, OrderedDict[Selector, deque[asyncio.Future[None]]]]
+    scene_buckets: dict[Selector, _Bucket] = field(default_factory=dict)
+    wakeup: asyncio.Event = field(default_factory=asyncio.Event)
+    dispatcher: asyncio.Task | None = None
+
+
+class SendScheduler:
+    """按账号与发送目标限速的出站调度器, 由 ``MessageSend.send`` 等 ``ScheduledFn`` 在执行前经过.
+
+    调度器只决定每次发送何时开始, 发送本身仍在调用者的任务中执行.
+    """
+
+    config: SendSchedulerConfig
+    _accounts: dict[Selector, _AccountState]
+
+    def __init__(self, config: SendSchedulerConfig | None = None) -> None:
+        self.config = config or SendSchedulerConfig()
+        self._accounts = {}
+
+    @contextmanager
+    def lane(self, name: str):
+        if name not in self.config.lanes:
+            raise ValueError(f"unknown send lane: {name}")
+        token = cx_send_lane.set(name)
+        try:
+            yield
+        finally:
+            cx_send_lane.reset(token)
+
+    def pending(self, account: Selector) -> int:
+        state = self._accounts.get(account)
+        if state is None:
+            return 0
+        return sum(len(i) for lane in state.lanes.values() for i in lane.values())
+
+    async def schedule(self, account: Selector, scene: Selector, awaitable: Awaitable[T], *, reply: bool = False) -> T:
+        if not self.config.enabled:
+            return await awaitable
+
+        lane = cx_send_lane.get() or ("reply" if reply else "normal")
+        if lane not in self.config.lanes:
+            lane = self.config.lanes[-1]
+
+        try:
+            await self._acquire(account, scene if scene.__class__ is Selector else Selector(scene.pattern), lane)
+        except BaseException:
+            if asyncio.iscoroutine(awaitable):
+                awaitable.close()
+            raise
+
+        return await awaitable
+
+    async def _acquire(self, account: Selector, scene: Selector, lane: str):
+        loop = asyncio.get_running_loop()
+        state = self._accounts.get(account)
+        if state is None:
+            bucket = None
+            if self.config.account_rate is not None:
+                bucket = _Bucket(self.config.account_rate, self.config.account_burst, loop.time())
+            state = self._accounts[account] = _AccountState(bucket, {i: OrderedDict() for i in self.config.lanes})
+
+        waiter: asyncio.Future[None] = loop.create_future()
+        state.lanes[lane].setdefault(scene, deque()).append(waiter)
+        state.wakeup.set()
+        if state.dispatcher is None:
+            state.dispatcher = asyncio.create_task(self._dispatch(account, state))
+
+        await waiter
+
+    def _grant(self, state: _AccountState, now: float) -> float | None:
+        # 放行一个等待者并返回 0; 否则返回最短的等待时间, 没有等待者时返回 None.
+        delay: float | None = None
+        if state.bucket is not None and (wait := state.bucket.wait_time(now)) > 0:
+            delay = wait
+
+        for lane in state.lanes.values():
+            for scene, waiters in list(lane.items()):
+                while waiters and waiters[0].done():
+                    waiters.popleft()
+                if not waiters:
+                    del lane[scene]
+                    continue
+                if state.bucket is not None and state.bucket.tokens < 1:
+                    return delay
+
+                bucket = state.scene_buckets.get(scene)
+                if bucket is None and self.config.scene_rate is not None:
+                    bucket = state.scene_buckets[scene] = _Bucket(self.config.scene_rate, self.config.scene_burst, now)
+                if bucket is not None and (wait := bucket.wait_time(now)) > 0:
+                    delay = wait if delay is None else min(delay, wait)
+                    continue
+
+                if bucket is not None:
+                    bucket.take()
+                if state.bucket is not None:
+                    state.bucket.take()
+                waiters.popleft().set_result(None)
+                if waiters:
+                    lane.move_to_end(scene)
+                else:
+                    del lane[scene]
+                return 0.0
+
+        return delay
+
+    async def _dispatch(self, account: Selector, state: _AccountState):
+        loop = asyncio.get_running_loop()
+        try:
+            while True:
+                state.wakeup.clear()
+                delay = self._grant(state, loop.time())
+                if delay is None:
+                    break
+                if delay > 0:
+                    try:
+                        await asyncio.wait_for(state.wakeup.wait(), delay)
+                    except asyncio.TimeoutError:
+                        pass
+        finally:
+            state.dispatcher = None
+            now = loop.time()
+            for scene, bucket in list(state.scene_buckets.items()):
+                if bucket.wait_time(now) == 0 and bucket.tokens >= bucket.burst:
+                    del state.scene_buckets[scene]
+            if state.bucket is None and not state.scene_buckets:
+                self._accounts.pop(account, None)
@@ -4,7 +4,7 @@ import re
 from collections.abc import Callable, Mapping
 from copy import deepcopy
 from dataclasses import dataclass
-from itertools import filterfalse
+from functools import lru_cache
 from types import MappingProxyType
 from typing import Protocol, runtime_checkable
 
@@ -17,9 +17,12 @@ ESCAPE = {")": "\\)", "(": "\\(", "]": "\\]", "[": "\\[", "}": "\\}", "{": "\\{"
 
 _follows_pattern = re.compile(r"(?P<name>(\w+?|[*~]))(#(?P<predicate>\w+))?(\((?P<literal>[^#]+?)\))?")
 FollowsPredicater: TypeAlias = "Callable[[str], bool]"
+FOLLOWS_CACHE_SIZE = 1024
 
+_HASH_SEED = hash("Selector")
 
-@dataclass
+
+@dataclass(frozen=True)
 class _FollowItem:
     name: str
     literal: str | None = None
@@ -74,12 +77,104 @@ def _parse_follows(pattern: str, **kwargs: FollowsPredicater) -> list[_FollowIte
     return list(items.values())
 
 
+class FollowsPattern:
+    """预解析的 follows pattern, 可被多个 Selector 重复匹配."""
+
+    __slots__ = ("pattern", "items", "_checks")
+
+    pattern: str
+    items: tuple[_FollowItem, ...]
+
+    def __init__(self, pattern: str, items: tuple[_FollowItem, ...]) -> None:
+        self.pattern = pattern
+        self.items = items
+        self._checks = tuple((i.name, i.literal, i.predicate) for i in items)
+
+    @classmethod
+    def compile(cls, pattern: str, **predicates: FollowsPredicater) -> FollowsPattern:
+        if predicates:
+            # predicates 通常是临时的 callable, 不进入缓存.
+            return cls(pattern, tuple(_parse_follows(pattern, **predicates)))
+
+        return _compile_follows(pattern)
+
+    def matches(self, selector: Selector) -> bool:
+        pattern = selector._items
+        index = 0
+        for index, ((name, literal, predicate), (key, value)) in enumerate(zip(self._checks, pattern)):
+            if name == "*":
+                return True
+            if name != key:
+                return False
+            if predicate is not None and not predicate(value):
+                return False
+            if literal is not None and value != literal:
+                return False
+        return index + 1 == len(pattern)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.pattern!r})"
+
+
+@lru_cache(maxsize=FOLLOWS_CACHE_SIZE)
+def _compile_follows(pattern: str) -> FollowsPattern:
+    return FollowsPattern(pattern, tuple(_parse_follows(pattern)))
+
+
+def _fold_hash(items: tuple[tuple[str, str], ...]) -> int:
+    # 逐项折叠, 使 appendix 可以在父 Selector 的 hash 上增量计算.
+    result = _HASH_SEED
+    for key, value in items:
+        result = hash((result, key, value))
+    return result
+
+
 class Selector:
-    pattern: Mapping[str, str]
+    __slots__ = ("_items", "_hash", "_pattern", "_path", "__weakref__")
+
+    _items: tuple[tuple[str, str], ...]
+    _hash: int | None
+    _pattern: Mapping[str, str] | None
+    _path: str | None
 
     def __init__(self, pattern: Mapping[str, str] = EMPTY_MAP) -> None:
-        self.pattern = MappingProxyType({k: str(v) for k, v in pattern.items()})
-        self._hash = hash(("Selector", *self.pattern.items()))
+        self._items = tuple([(k, str(v)) for k, v in pattern.items()])
+        self._hash = None
+        self._pattern = None
+        self._path = None
+
+    @classmethod
+    def _from_items(cls, items: tuple[tuple[str, str], ...], hash_: int | None = None) -> Self:
+        instance = cls.__new__(cls)
+        instance._items = items
+        instance._hash = hash_
+        instance._pattern = None
+        instance._path = None
+        return instance
+
+    @classmethod
+    def from_pairs(cls, pairs: tuple[tuple[str, str], ...]) -> Self:
+        """由 ``pairs`` 形式的 ``(key, value)`` 元组直接构造, 值需已是 str."""
+        return cls._from_items(pairs)
+
+    @classmethod
+    def from_selector(cls, selector: Selector) -> Self:
+        """以另一 Selector 的内容构造 ``cls`` 的实例, 沿用其已计算的 hash."""
+        return cls._from_items(selector._items, selector._hash)
+
+    def _derive(self, items: tuple[tuple[str, str], ...], hash_: int | None = None) -> Self:
+        # hash_ 为增量计算得到的 hash, 未知时留空, 首次 __hash__ 时再折叠计算.
+        if self.__class__.modify is not Selector.modify:
+            # 子类自定义了 modify, 交由其构造.
+            return self.modify(dict(items))
+
+        return self._from_items(items, hash_)
+
+    @property
+    def pattern(self) -> Mapping[str, str]:
+        if self._pattern is None:
+            self._pattern = MappingProxyType(dict(self._items))
+        return self._pattern
 
     def modify(self, pattern: Mapping[str, str]) -> Self:
         return self.__class__(pattern=pattern)
@@ -89,80 +184,108 @@ class Selector:
             return super().__getattribute__(name)  # type: ignore
 
         def wrapper(content: str) -> Self:
-            return self.modify({**self.pattern, name: str(content)})
+            return self.appendix(name, content)
 
         return wrapper
 
     def __hash__(self) -> int:
+        if self._hash is None:
+            self._hash = _fold_hash(self._items)
         return self._hash
 
     def __eq__(self, o: object) -> bool:
-        return isinstance(o, self.__class__) and o._hash == self._hash
+        return o is self or (isinstance(o, self.__class__) and o._items == self._items)
 
     def __contains__(self, key: str) -> bool:
-        return key in self.pattern
+        for k, _ in self._items:
+            if k == key:
+                return True
+        return False
 
     def __getitem__(self, key: str) -> str:
-        return self.pattern[key]
+        for k, v in self._items:
+            if k == key:
+                return v
+        raise KeyError(key)
 
     def __repr__(self) -> str:
-        return f"{self.__class__.__name__}().{'.'.join(f'{k}({v})' for k, v in self.pattern.items())}"
+        return f"{self.__class__.__name__}().{'.'.join(f'{k}({v})' for k, v in self._items)}"
 
     def __copy__(self):
-        return self.modify({**self.pattern})
+        return self._derive(self._items, self._hash)
 
     def __deepcopy__(self, memo):
-        data = {**self.pattern}
+        data = dict(self._items)
         return self.__class__(deepcopy(data, memo))
 
     @property
     def empty(self) -> bool:
-        return not self.pattern
+        return not self._items
 
     @property
     def path(self) -> str:
-        return ".".join(self.pattern)
+        if self._path is None:
+            self._path = ".".join([k for k, _ in self._items])
+        return self._path
 
     @property
     def path_without_land(self) -> str:
-        return ".".join(filterfalse(lambda x: x == "land", self.pattern))
+        return ".".join([k for k, _ in self._items if k != "land"])
 
     @property
     def display(self) -> str:
-        return ".".join(f"{k}({v})" for k, v in self.pattern.items())
+        return ".".join([f"{k}({v})" for k, v in self._items])
 
     @property
     def display_without_land(self) -> str:
-        return ".".join(f"{k}({v})" for k, v in self.pattern.items() if k != "land")
+        return ".".join([f"{k}({v})" for k, v in self._items if k != "land"])
 
     @property
     def last_key(self) -> str:
-        return next(reversed(self.pattern.keys()))
+        return self._items[-1][0]
 
     @property
     def last_value(self) -> str:
-        return next(reversed(self.pattern.values()))
+        return self._items[-1][1]
 
     def items(self):
         return self.pattern.items()
 
+    @property
+    def pairs(self) -> tuple[tuple[str, str], ...]:
+        """按顺序排列的 ``(key, value)`` 元组, 不经过 ``pattern`` 的映射."""
+        return self._items
+
+    def as_key(self) -> Selector:
+        """用作缓存键的形式: ContextSelector 等子类与 Selector 不相等, 统一为 Selector."""
+        return self if self.__class__ is Selector else Selector.from_selector(self)
+
     def appendix(self, key: str, value: str):
-        return self.modify({**self.pattern, key: str(value)})
+        value = str(value)
+        items = self._items
+
+        for index, (k, _) in enumerate(items):
+            if k == key:
+                return self._derive((*items[:index], (key, value), *items[index + 1 :]))
+
+        return self._derive(
+            (*items, (key, value)),
+            None if self._hash is None else hash((self._hash, key, value)),
+        )
 
     def land(self, land: Land | str):
         if isinstance(land, Land):
             land = land.name
 
-        return self.modify({"land": land, **{k: v for k, v in self.pattern.items() if k != "land"}})
+        return self._derive((("land", str(land)), *((k, v) for k, v in self._items if k != "land")))
 
     def to_selector(self):
         return self
 
     @classmethod
     def from_follows(cls, pattern: str):
-        items = _parse_follows(pattern)
         mapping = {}
-        for i in items:
+        for i in FollowsPattern.compile(pattern).items:
             if i.literal is None:
                 raise ValueError("literal expected")
             mapping[i.name] = i.literal
@@ -170,22 +293,15 @@ class Selector:
 
     from_follows_pattern = from_follows
 
-    def follows(self, pattern: str, **kwargs: FollowsPredicater) -> bool:
-        items = _parse_follows(pattern, **kwargs)
-        index = 0
-        for index, (item, name, value) in enumerate(zip(items, self.pattern.keys(), self.pattern.values())):
-            if item.name == "*":
-                return True
-            if item.name != name:
-                return False
-            if item.predicate is not None and not item.predicate(value):
-                return False
-            if item.literal is not None and value != item.literal:
-                return False
-        return index + 1 == len(self.pattern)
+    def follows(self, pattern: str | FollowsPattern, **kwargs: FollowsPredicater) -> bool:
+        if isinstance(pattern, str):
+            pattern = FollowsPattern.compile(pattern, **kwargs)
+        elif kwargs:
+            raise TypeError("predicates cannot be applied to a precompiled FollowsPattern")
+        return pattern.matches(self)
 
     def into(self, pattern: str, **kwargs: str) -> Self:
-        items = _parse_follows(pattern)
+        items = FollowsPattern.compile(pattern).items
         new_patterns = {}
         iterator = iter(self.pattern)
         if items and items[0].name == "~":
@@ -208,13 +324,15 @@ class Selector:
 
     def expects(
         self,
-        pattern: str,
+        pattern: str | FollowsPattern,
         *,
         exception_type: type[Exception] = ValueError,
         **kwargs: FollowsPredicater,
     ) -> Self:
         if not self.follows(pattern, **kwargs):
-            raise exception_type(f"Selector {self} does not follow {pattern}")
+            raise exception_type(
+                f"Selector {self} does not follow {pattern if isinstance(pattern, str) else pattern.pattern}"
+            )
 
         return self
 
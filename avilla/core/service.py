@@ -67,5 +67,6 @@ class AvillaService(Service):
 
         async with self.stage("cleanup"):
             await self.avilla.broadcast.postEvent(ApplicationClosing(self.avilla))
+            await self.avilla.http.close()
 
         await self.avilla.broadcast.postEvent(ApplicationClosed(self.avilla))
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from dataclasses import dataclass
+from fnmatch import fnmatchcase
+from typing import Any, Awaitable, Callable, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class SingleFlightConfig:
+    """只读调用合并的配置.
+
+    ``actions`` 为允许合并的 action 名称, 支持 ``fnmatch`` 风格的通配 (如 ``get_*``); 为空时不启用.
+    仅应列出只读的 action: 合并后各调用者拿到的是同一个结果对象, 请勿就地修改.
+    """
+
+    actions: frozenset[str] = frozenset()
+
+
+def _freeze(params: Any) -> str:
+    return json.dumps(params, sort_keys=True, separators=(",", ":"), default=str)
+
+
+class SingleFlight:
+    """按 ``(action, params)`` 合并同时进行的相同调用, 由首个调用者发起请求, 其余调用者共享其结果或异常."""
+
+    config: SingleFlightConfig
+    _accepts: dict[str, bool]
+    _inflight: dict[Hashable, asyncio.Task]
+
+    def __init__(self, config: SingleFlightConfig | None = None) -> None:
+        self.config = config or SingleFlightConfig()
+        self._accepts = {}
+        self._inflight = {}
+
+    def accepts(self, action: str) -> bool:
+        accepted = self._accepts.get(action)
+        if accepted is None:
+            accepted = self._accepts[action] = any(fnmatchcase(action, i) for i in self.config.actions)
+        return accepted
+
+    async def run(self, key: tuple[Any, ...], params: dict | None, call: Callable[[], Awaitable[T]]) -> T:
+        flight_key = (*key, _freeze(params))
+        task = self._inflight.get(flight_key)
+        if task is None:
+            task = self._inflight[flight_key] = asyncio.create_task(call())
+            task.add_done_callback(lambda _: self._inflight.pop(flight_key, None))
+        return await asyncio.shield(task)
@@ -1,10 +1,13 @@
 from __future__ import annotations
 
+from operator import itemgetter
 from typing import TYPE_CHECKING, Any
 
 from graia.amnesia.message import Element, MessageChain
 
 from avilla.core.event import AvillaEvent
+from avilla.core.multicast import memoize_serialization
+from avilla.core.ryanvk.behavior.fallback import SyncFallbackBehavior
 from avilla.core.ryanvk.collector.application import ApplicationCollector
 from graia.ryanvk import Fn, PredicateOverload, TypeOverload
 
@@ -18,6 +21,13 @@ class ElizabethCapability((m := ApplicationCollector())._):
         ...
 
     @Fn.complex({PredicateOverload(lambda _, raw: raw["type"]): ["raw_element"]})
+    def deserialize_element_sync(self, raw_element: dict) -> Element:  # type: ignore
+        ...
+
+    @Fn.complex(
+        {PredicateOverload(lambda _, raw: raw["type"]): ["raw_element"]},
+        behavior=SyncFallbackBehavior(deserialize_element_sync),
+    )
     async def deserialize_element(self, raw_element: dict) -> Element:  # type: ignore
         ...
 
@@ -26,13 +36,14 @@ class ElizabethCapability((m := ApplicationCollector())._):
         ...
 
     async def deserialize_chain(self, chain: list[dict]):
-        elements = []
-
-        for raw_element in chain:
-            elements.append(await self.deserialize_element(raw_element))
-
+        elements = await self.staff.deserialize_elements(
+            chain,
+            itemgetter("type"),
+            ElizabethCapability.deserialize_element,
+        )
         return MessageChain(elements)
 
+    @memoize_serialization
     async def serialize_chain(self, chain: MessageChain):
         elements = []
 
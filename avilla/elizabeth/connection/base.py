@@ -2,20 +2,24 @@ from __future__ import annotations
 
 import asyncio
 from contextlib import suppress
+from functools import partial
 from typing import TYPE_CHECKING, AsyncIterator, Literal, TypeVar
 
 from loguru import logger
 from typing_extensions import Self
 
 from avilla.core.exceptions import InvalidAuthentication
+from avilla.core.pipeline import EventPipeline
 from avilla.core.ryanvk.staff import Staff
 from avilla.core.selector import Selector
+from avilla.core.singleflight import SingleFlight
 from avilla.elizabeth.capability import ElizabethCapability
 from avilla.standard.core.account import AccountAvailable
 
 from .util import validate_response
 
 if TYPE_CHECKING:
+    from avilla.core.protocol import ProtocolConfig
     from avilla.elizabeth.protocol import ElizabethProtocol
 
 
@@ -27,15 +31,21 @@ class ElizabethNetworking:
     protocol: ElizabethProtocol
     response_waiters: dict[str, asyncio.Future]
     close_signal: asyncio.Event
+    event_pipeline: EventPipeline
+    single_flight: SingleFlight
+    _staff: Staff | None
 
     account_id: int
     session_key: str | None = None
 
-    def __init__(self, protocol: ElizabethProtocol):
+    def __init__(self, protocol: ElizabethProtocol, config: ProtocolConfig):
         super().__init__()
         self.protocol = protocol
         self.response_waiters = {}
         self.close_signal = asyncio.Event()
+        self.event_pipeline = EventPipeline(config.event_pipeline)
+        self.single_flight = SingleFlight(config.single_flight)
+        self._staff = None
 
     def get_staff_components(self):
         return {"connection": self, "protocol": self.protocol, "avilla": self.protocol.avilla}
@@ -45,7 +55,8 @@ class ElizabethNetworking:
 
     @property
     def staff(self):
-        return Staff(self.get_staff_artifacts(), self.get_staff_components())
+        self._staff = Staff.reuse(self._staff, self.get_staff_artifacts(), self.get_staff_components)
+        return self._staff
 
     def message_receive(self) -> AsyncIterator[tuple[Self, dict]]:
         ...
@@ -60,6 +71,19 @@ class ElizabethNetworking:
     async def send(self, payload: dict) -> None:
         ...
 
+    def get_scene_key(self, data: dict) -> Selector | None:
+        if "sender" in data:
+            sender = data["sender"]
+            if "group" in sender:
+                return Selector().land("qq").group(str(sender["group"]["id"]))
+            return Selector().land("qq").friend(str(sender["id"]))
+        if "group" in data:
+            return Selector().land("qq").group(str(data["group"]["id"]))
+        if "member" in data:
+            return Selector().land("qq").group(str(data["member"]["group"]["id"]))
+        if "friend" in data:
+            return Selector().land("qq").friend(str(data["friend"]["id"]))
+
     async def message_handle(self):
         async for connection, data in self.message_receive():
             if "code" in data:
@@ -95,7 +119,8 @@ class ElizabethNetworking:
 
                 logger.warning(f"received unsupported event {event_type}: {data}")
 
-            asyncio.create_task(event_parse_task(body))
+            key = self.get_scene_key(body) if self.event_pipeline.config.ordered else None
+            await self.event_pipeline.submit(partial(event_parse_task, body), key)
 
     async def connection_closed(self):
         self.session_key = None
@@ -108,6 +133,21 @@ class ElizabethNetworking:
         params: dict | None = None,
         *,
         session: bool = True,
+    ) -> dict:
+        # 同名的 action 可能同时有读取 (fetch) 与修改 (update) 两种用法, 仅合并读取.
+        if method in {"get", "fetch"} and self.single_flight.accepts(action):
+            return await self.single_flight.run(
+                (method, action, session), params, partial(self._call, method, action, params, session=session)
+            )
+        return await self._call(method, action, params, session=session)
+
+    async def _call(
+        self,
+        method: CallMethod,
+        action: str,
+        params: dict | None = None,
+        *,
+        session: bool = True,
     ) -> dict:
         if not self.alive:
             raise RuntimeError("connection is not established")
@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import asyncio
-import json
 from contextlib import suppress
 from typing import TYPE_CHECKING, cast
 
@@ -34,7 +33,7 @@ class ElizabethWsClientNetworking(ElizabethNetworking, Service):
     session: aiohttp.ClientSession
 
     def __init__(self, protocol: ElizabethProtocol, config: ElizabethConfig) -> None:
-        super().__init__(protocol)
+        super().__init__(protocol, config)
         self.config = config
         self.account_id = self.config.qq
 
@@ -51,7 +50,7 @@ class ElizabethWsClientNetworking(ElizabethNetworking, Service):
                 self.close_signal.set()
                 break
             elif msg.type == aiohttp.WSMsgType.TEXT:
-                data: dict = json.loads(cast(str, msg.data))
+                data: dict = self.config.json_codec.loads(cast(str, msg.data))
                 yield self, data
         else:
             await self.connection_closed()
@@ -60,18 +59,18 @@ class ElizabethWsClientNetworking(ElizabethNetworking, Service):
         if self.connection is None:
             raise RuntimeError("connection is not established")
 
-        await self.connection.send_json(payload)
+        await self.connection.send_json(payload, dumps=self.config.json_codec.dumps)
 
     async def call_http(self, method: CallMethod, action: str, params: dict | None = None) -> dict:
         action = action.replace("_", "/")
         if method in {"get", "fetch"}:
             async with self.session.get((self.config.base_url / action).with_query(params or {})) as resp:
-                result = await resp.json()
+                result = await resp.json(loads=self.config.json_codec.loads)
                 return validate_response(result)
 
         if method in {"post", "update"}:
             async with self.session.post((self.config.base_url / action), json=params or {}) as resp:
-                result = await resp.json()
+                result = await resp.json(loads=self.config.json_codec.loads)
                 return validate_response(result)
 
         if method == "multipart":
@@ -85,7 +84,7 @@ class ElizabethWsClientNetworking(ElizabethNetworking, Service):
                     data.add_field(k, v)
 
             async with self.session.post((self.config.base_url / action), data=data) as resp:
-                result = await resp.json()
+                result = await resp.json(loads=self.config.json_codec.loads)
                 return validate_response(result)
 
         raise ValueError(f"Unknown method {method}")
@@ -164,7 +163,7 @@ class ElizabethWsClientNetworking(ElizabethNetworking, Service):
 
     async def launch(self, manager: Launart):
         async with self.stage("preparing"):
-            self.session = aiohttp.ClientSession()
+            self.session = aiohttp.ClientSession(json_serialize=self.config.json_codec.dumps)
 
         async with self.stage("blocking"):
             await self.connection_daemon(manager, self.session)
@@ -2,8 +2,6 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from graia.amnesia.builtins.memcache import Memcache, MemcacheService
-
 from avilla.core.ryanvk.collector.account import AccountCollector
 from avilla.core.selector import Selector
 from avilla.standard.core.profile import Avatar, Nick, Summary
@@ -24,10 +22,7 @@ class ElizabethFriendActionPerform((m := AccountCollector["ElizabethProtocol", "
 
     @m.pull("land.friend", Nick)
     async def get_friend_nick(self, target: Selector, route: ...) -> Nick:
-        cache: Memcache = self.protocol.avilla.launch_manager.get_component(MemcacheService).cache
-        if raw := await cache.get(
-            f"elizabeth/account({self.account.route['account']}).friend({target.pattern['friend']})"
-        ):
+        if raw := self.account.roster.get(target):
             return Nick(raw["nickname"], raw["remark"] or raw["nickname"], None)
         result = await self.account.connection.call(
             "fetch",
@@ -40,10 +35,7 @@ class ElizabethFriendActionPerform((m := AccountCollector["ElizabethProtocol", "
 
     @m.pull("land.friend", Summary)
     async def get_friend_summary(self, target: Selector, route: ...) -> Summary:
-        cache: Memcache = self.protocol.avilla.launch_manager.get_component(MemcacheService).cache
-        if raw := await cache.get(
-            f"elizabeth/account({self.account.route['account']}).friend({target.pattern['friend']})"
-        ):
+        if raw := self.account.roster.get(target):
             return Summary(raw["nickname"], "a friend contact assigned to this account")
         result = await self.account.connection.call(
             "fetch",
@@ -2,8 +2,6 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from graia.amnesia.builtins.memcache import Memcache, MemcacheService
-
 from avilla.core.exceptions import permission_error_message
 from avilla.core.ryanvk.collector.account import AccountCollector
 from avilla.core.selector import Selector
@@ -27,10 +25,7 @@ class ElizabethGroupActionPerform((m := AccountCollector["ElizabethProtocol", "E
 
     @m.pull("land.group", Nick)
     async def get_group_nick(self, target: Selector, route: ...) -> Nick:
-        cache: Memcache = self.protocol.avilla.launch_manager.get_component(MemcacheService).cache
-        if raw := await cache.get(
-            f"elizabeth/account({self.account.route['account']}).group({target.pattern['group']})"
-        ):
+        if raw := self.account.roster.get(target):
             return Nick(raw["name"], raw["name"], None)
         result = await self.account.connection.call(
             "fetch",
@@ -43,10 +38,7 @@ class ElizabethGroupActionPerform((m := AccountCollector["ElizabethProtocol", "E
 
     @m.pull("land.group", Summary)
     async def get_group_summary(self, target: Selector, route: ...) -> Summary:
-        cache: Memcache = self.protocol.avilla.launch_manager.get_component(MemcacheService).cache
-        if raw := await cache.get(
-            f"elizabeth/account({self.account.route['account']}).group({target.pattern['group']})"
-        ):
+        if raw := self.account.roster.get(target):
             return Summary(raw["name"], None)
         result = await self.account.connection.call(
             "fetch",
@@ -3,8 +3,6 @@ from __future__ import annotations
 from datetime import timedelta
 from typing import TYPE_CHECKING
 
-from graia.amnesia.builtins.memcache import Memcache, MemcacheService
-
 from avilla.core.exceptions import permission_error_message
 from avilla.core.ryanvk.collector.account import AccountCollector
 from avilla.core.selector import Selector
@@ -33,12 +31,7 @@ class ElizabethGroupMemberActionPerform((m := AccountCollector["ElizabethProtoco
 
     @m.pull("land.group.member", Nick)
     async def get_group_member_nick(self, target: Selector, route: ...) -> Nick:
-        cache: Memcache = self.protocol.avilla.launch_manager.get_component(MemcacheService).cache
-        if not (
-            result := await cache.get(
-                f"elizabeth/account({self.account.route['account']}).group({target.pattern['group']}).member({target.pattern['member']})"
-            )
-        ):
+        if not (result := self.account.roster.get(target)):
             result = await self.account.connection.call(
                 "fetch",
                 "memberInfo",
@@ -105,12 +98,7 @@ class ElizabethGroupMemberActionPerform((m := AccountCollector["ElizabethProtoco
 
     @m.pull("land.group.member", MuteInfo)
     async def get_group_member_mute_info(self, target: Selector, route: ...) -> MuteInfo:
-        cache = self.protocol.avilla.launch_manager.get_component(MemcacheService).cache
-        if not (
-            result := await cache.get(
-                f"elizabeth/account({self.account.route['account']}).group({target.pattern['group']}).member({target.pattern['member']})"
-            )
-        ):
+        if not (result := self.account.roster.get(target)):
             result = await self.account.connection.call(
                 "fetch",
                 "memberInfo",
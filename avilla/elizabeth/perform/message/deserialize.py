@@ -44,22 +44,22 @@ class ElizabethMessageDeserializePerform((m := ApplicationCollector())._):
 
     # LINK: https://github.com/microsoft/pyright/issues/5409
 
-    @m.entity(ElizabethCapability.deserialize_element, raw_element="Plain")
-    async def text(self, raw_element: dict) -> Text:
+    @m.entity(ElizabethCapability.deserialize_element_sync, raw_element="Plain")
+    def text(self, raw_element: dict) -> Text:
         return Text(raw_element["text"])
 
-    @m.entity(ElizabethCapability.deserialize_element, raw_element="At")
-    async def at(self, raw_element: dict) -> Notice:
+    @m.entity(ElizabethCapability.deserialize_element_sync, raw_element="At")
+    def at(self, raw_element: dict) -> Notice:
         if self.context:
             return Notice(self.context.scene.member(raw_element["target"]))
         return Notice(Selector().land("qq").member(raw_element["target"]))
 
-    @m.entity(ElizabethCapability.deserialize_element, raw_element="AtAll")
-    async def at_all(self, raw_element: dict) -> NoticeAll:
+    @m.entity(ElizabethCapability.deserialize_element_sync, raw_element="AtAll")
+    def at_all(self, raw_element: dict) -> NoticeAll:
         return NoticeAll()
 
-    @m.entity(ElizabethCapability.deserialize_element, raw_element="Face")
-    async def face(self, raw_element: dict) -> Face:
+    @m.entity(ElizabethCapability.deserialize_element_sync, raw_element="Face")
+    def face(self, raw_element: dict) -> Face:
         return Face(raw_element["faceId"], raw_element["name"])
 
     @m.entity(ElizabethCapability.deserialize_element, raw_element="MarketFace")
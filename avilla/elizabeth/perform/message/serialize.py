@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import base64
 from dataclasses import asdict
 from typing import TYPE_CHECKING
 
@@ -94,14 +93,16 @@ class ElizabethMessageSerializePerform((m := AccountCollector["ElizabethProtocol
                 "url": element.resource.url,
             }
         elif isinstance(element.resource, LocalFileResource):
-            return {"type": "Image", "base64": base64.b64encode(element.resource.file.read_bytes()).decode("utf-8")}
+            data = await self.account.avilla.encode_cache.b64encode_file(element.resource.file)
+            return {"type": "Image", "base64": data}
         elif isinstance(element.resource, RawResource):
-            return {"type": "Image", "base64": base64.b64encode(element.resource.data).decode("utf-8")}
+            data = await self.account.avilla.encode_cache.b64encode_bytes(element.resource.data)
+            return {"type": "Image", "base64": data}
         else:
-            return {
-                "type": "Image",
-                "base64": base64.b64encode(await self.account.staff.fetch_resource(element.resource)).decode("utf-8"),
-            }
+            data = await self.account.avilla.encode_cache.b64encode_bytes(
+                await self.account.staff.fetch_resource(element.resource)
+            )
+            return {"type": "Image", "base64": data}
 
     @m.entity(ElizabethCapability.serialize_element, element=FlashImage)
     async def flash_image(self, element: FlashImage):
@@ -123,14 +124,16 @@ class ElizabethMessageSerializePerform((m := AccountCollector["ElizabethProtocol
                 "url": element.resource.url,
             }
         elif isinstance(element.resource, LocalFileResource):
-            return {"type": "Voice", "base64": base64.b64encode(element.resource.file.read_bytes()).decode("utf-8")}
+            data = await self.account.avilla.encode_cache.b64encode_file(element.resource.file)
+            return {"type": "Voice", "base64": data}
         elif isinstance(element.resource, RawResource):
-            return {"type": "Voice", "base64": base64.b64encode(element.resource.data).decode("utf-8")}
+            data = await self.account.avilla.encode_cache.b64encode_bytes(element.resource.data)
+            return {"type": "Voice", "base64": data}
         else:
-            return {
-                "type": "Voice",
-                "base64": base64.b64encode(await self.account.staff.fetch_resource(element.resource)).decode("utf-8"),
-            }
+            data = await self.account.avilla.encode_cache.b64encode_bytes(
+                await self.account.staff.fetch_resource(element.resource)
+            )
+            return {"type": "Voice", "base64": data}
 
     @m.entity(ElizabethCapability.serialize_element, element=Video)
     async def video(self, element: Video):
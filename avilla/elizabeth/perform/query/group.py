@@ -1,11 +1,9 @@
 from __future__ import annotations
 
-from datetime import timedelta
 from typing import TYPE_CHECKING, Callable, cast
 
-from graia.amnesia.builtins.memcache import Memcache, MemcacheService
-
 from avilla.core.builtins.capability import CoreCapability
+from avilla.core.exceptions import UnknownTarget
 from avilla.core.ryanvk.collector.account import AccountCollector
 from avilla.core.selector import Selector
 
@@ -20,20 +18,18 @@ class ElizabethGroupQueryPerform((m := AccountCollector["ElizabethProtocol", "El
 
     @CoreCapability.query.collect(m, "land.group")
     async def query_group(self, predicate: Callable[[str, str], bool] | str, previous: None):
-        cache: Memcache = self.protocol.avilla.launch_manager.get_component(MemcacheService).cache
         result = await self.account.connection.call("fetch", "groupList", {})
         result = cast(list, result)
-        for i in result:
-            group_id = str(i["id"])
-            await cache.set(
-                f"elizabeth/account({self.account.route['account']}).group({group_id})", i, timedelta(minutes=5)
-            )
+        land = Selector().land(self.account.route["land"])
+        groups = [(land.group(str(i["id"])), i) for i in result]
+        self.account.roster.set_many(groups)
+        for group, _ in groups:
+            group_id = group.last_value
             if callable(predicate) and predicate("group", group_id) or group_id == predicate:
-                yield Selector().land(self.account.route["land"]).group(group_id)
+                yield group
 
     @CoreCapability.query.collect(m, "member", "land.group")
     async def query_group_members(self, predicate: Callable[[str, str], bool] | str, previous: Selector):
-        cache = self.protocol.avilla.launch_manager.get_component(MemcacheService).cache
         result = await self.account.connection.call(
             "fetch", "latestMemberList", {"target": int(previous["group"]), "memberIds": []}
         )
@@ -41,12 +37,31 @@ class ElizabethGroupQueryPerform((m := AccountCollector["ElizabethProtocol", "El
             yield previous.member(predicate)  # bot self not in memberList
             return
         result = cast(list, result)
-        for i in result:
-            member_id = str(i["id"])
-            await cache.set(
-                f"elizabeth/account({self.account.route['account']}).group({i['group']['id']}).member({member_id})",
-                i,
-                timedelta(minutes=5),
-            )
+        members = [(previous.member(str(i["id"])), i) for i in result]
+        self.account.roster.set_many(members)
+        for member, _ in members:
+            member_id = member.last_value
             if callable(predicate) and predicate("member", member_id) or member_id == predicate:
-                yield previous.member(member_id)
+                yield member
+
+    @CoreCapability.query.collect(m, "member", "land.group", point=True)
+    async def query_group_member(self, predicate: str, previous: Selector):
+        if predicate == str(self.account.route["account"]):
+            yield previous.member(predicate)  # bot self not in memberList
+            return
+        try:
+            member_id = int(predicate)
+        except ValueError:
+            # 非数字的字面量无法点查, 回落到列表扫描.
+            async for i in self.query_group_members(predicate, previous):
+                yield i
+            return
+        try:
+            result = await self.account.connection.call(
+                "fetch", "memberInfo", {"target": int(previous["group"]), "memberId": member_id}
+            )
+        except UnknownTarget:
+            return
+        member = previous.member(predicate)
+        self.account.roster.set(member, result)
+        yield member
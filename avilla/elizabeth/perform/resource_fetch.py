@@ -1,8 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
-
-from aiohttp import ClientSession
+from typing import TYPE_CHECKING, AsyncIterator
 
 from avilla.core.builtins.capability import CoreCapability
 from avilla.core.exceptions import UnknownTarget
@@ -27,6 +25,13 @@ class ElizabethResourceFetchPerform((m := ProtocolCollector["ElizabethProtocol"]
     async def fetch_resource(self, resource: ElizabethResource) -> bytes:
         if resource.url is None:
             raise UnknownTarget
-        async with ClientSession() as session:
-            async with session.get(resource.url) as resp:
-                return await resp.read()
+        return await self.protocol.avilla.http.read(resource.url)
+
+    @m.entity(CoreCapability.stream, resource=ElizabethResource)
+    @m.entity(CoreCapability.stream, resource=ElizabethImageResource)
+    @m.entity(CoreCapability.stream, resource=ElizabethVoiceResource)
+    async def stream_resource(self, resource: ElizabethResource, chunk_size: int | None = None) -> AsyncIterator[bytes]:
+        if resource.url is None:
+            raise UnknownTarget
+        async for chunk in self.protocol.avilla.http.stream(resource.url, chunk_size):
+            yield chunk
@@ -10,7 +10,7 @@ from graia.ryanvk.typing import RecordTwin
 from ..reference.event import Event
 
 if TYPE_CHECKING:
-    ...
+    from graia.ryanvk.staff import Staff
 
 E = TypeVar("E", bound=AvillaEvent)
 
@@ -28,3 +28,20 @@ class NoneEventTranslate:
             return entity
 
         return wrapper
+
+    @classmethod
+    def execute(
+        cls,
+        staff: Staff,
+        collector: BaseCollector,
+        entity: Callable[[Any, E], Coroutine[None, None, Event | None]],
+        event: E,
+    ) -> Coroutine[None, None, Event | None]:
+        # 与 Fn.execute 一致: 按 staff 缓存 perform 实例, 且只支持静态 perform.
+        perform_type = collector.cls
+        instance = staff.instances.get(perform_type)
+        if instance is None:
+            if not perform_type.__static__:
+                raise ValueError("common staff can only works with static perform")
+            instance = staff.instances[perform_type] = perform_type(staff)
+        return entity(instance, event)
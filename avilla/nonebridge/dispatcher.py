@@ -1,29 +1,51 @@
 from __future__ import annotations
 
-from asyncio import Queue
-from typing import Generic, TypeVar
+from asyncio import Queue, QueueFull
+from typing import Callable, Generic, TypeVar
 
 from graia.broadcast.entities.dispatcher import BaseDispatcher
 from graia.broadcast.entities.event import Dispatchable
 from graia.broadcast.interfaces.dispatcher import (
     DispatcherInterface as DispatcherInterface,
 )
+from loguru import logger
 
 T = TypeVar("T", bound=Dispatchable)
 
 
 class AllEventQueue(BaseDispatcher, Generic[T]):
+    """将经过 Broadcast 的事件交给 NoneBridge 的转换任务.
+
+    入队不会等待: 队列已满时丢弃最早的事件, 以免转换跟不上时阻塞所有事件的执行.
+    ``accepts`` 返回 False 的事件不会入队.
+    """
+
     queue: Queue[T]
+    accepts: Callable[[T], bool] | None
+    dropped: int
 
-    def __init__(self, *, maxsize=20) -> None:
+    def __init__(self, *, maxsize=256, accepts: Callable[[T], bool] | None = None) -> None:
         self.queue = Queue(maxsize=maxsize)
+        self.accepts = accepts
+        self.dropped = 0
 
     async def beforeExecution(self, interface: DispatcherInterface[T]):
-        if interface.event.__dict__.get("$queued"):
+        event = interface.event
+        if event.__dict__.get("$queued"):
+            return
+
+        event.__dict__["$queued"] = True
+        if self.accepts is not None and not self.accepts(event):
             return
 
-        interface.event.__dict__["$queued"] = True
-        await self.queue.put(interface.event)
+        try:
+            self.queue.put_nowait(event)
+        except QueueFull:
+            self.queue.get_nowait()
+            self.queue.put_nowait(event)
+            self.dropped += 1
+            if self.dropped % 100 == 1:
+                logger.warning(f"nonebridge event queue is full, {self.dropped} events dropped so far")
 
     async def catch(self, interface: DispatcherInterface):
         return
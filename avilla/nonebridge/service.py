@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import asyncio
-import json
 from contextlib import suppress
 from typing import TYPE_CHECKING, Any, ClassVar
 
@@ -9,18 +8,22 @@ import nonebot
 from graia.broadcast.utilles import run_always_await
 from launart import Launart, Service, any_completed
 from loguru import logger
+from nonebot.matcher import matchers
 from nonebot.message import handle_event
 
 from avilla.core.account import BaseAccount
 from avilla.core.event import AvillaEvent
 from avilla.core.ryanvk.staff import Staff
+from avilla.core.selector import Selector
 from avilla.core.utilles import identity
 from avilla.standard.core.account import AccountRegistered, AccountUnregistered
+from avilla.standard.core.message import MessageReceived
 from graia.ryanvk import merge, ref
 from graia.ryanvk.aio import queue_task
 
 from .adapter import NoneBridgeAdapter
 from .bot import NoneBridgeBot
+from .descriptor.event import NoneEventTranslate, NoneEventTranslateSign
 from .dispatcher import AllEventQueue
 from .driver import NoneBridgeDriver
 
@@ -38,22 +41,30 @@ class NoneBridgeService(Service):
     driver: NoneBridgeDriver
     adapter: NoneBridgeAdapter
     staff: Staff
-    bots: dict[str, NoneBridgeBot]  # key 是 Selector.pattern 的 json
+    bots: dict[Selector, NoneBridgeBot]  # key 是账号的 route
     queuer: AllEventQueue[AvillaEvent]
+    workers: int
 
     artifacts: ClassVar[dict[Any, Any]] = {
         **ref("avilla.protocol/onebot_v11::message", "serialize"),
         **ref("avilla.protocol/onebot_v11::message", "deserialize"),
     }
+    # 转换后 nonebot 事件的类型 (即 Matcher.type), 用于跳过没有 matcher 关心的事件; 未列出的事件总是转换.
+    post_types: ClassVar[dict[type[AvillaEvent], str]] = {
+        MessageReceived: "message",
+    }
 
-    def __init__(self, avilla: Avilla) -> None:
+    def __init__(self, avilla: Avilla, *, workers: int = 4, queue_size: int = 256) -> None:
         super().__init__()
         self.avilla = avilla
         self.driver = NoneBridgeDriver(self)
         self.adapter = NoneBridgeAdapter(self)
         self.staff = Staff([self.artifacts], {"avilla": avilla, "nonebridge.service": self})
         self.bots = {}
-        self.queuer = AllEventQueue()
+        self.workers = workers
+        self.queuer = AllEventQueue(maxsize=queue_size, accepts=self.accepts_event)
+        self._translatable: dict[type, bool] = {}
+        self._interest: tuple[int, frozenset[str]] = (-1, frozenset())
 
         avilla.broadcast.receiver(AccountRegistered)(self.on_account_registered)
         avilla.broadcast.receiver(AccountUnregistered)(self.on_account_unregistered)
@@ -66,20 +77,48 @@ class NoneBridgeService(Service):
         nonebot._driver = self.driver
 
     async def on_account_registered(self, event: AccountRegistered):
-        key = json.dumps({**event.account.route.pattern})
-        self.bots[key] = NoneBridgeBot(self, event.account)
+        self.bots[event.account.route] = NoneBridgeBot(self, event.account)
 
     async def on_account_unregistered(self, event: AccountUnregistered):
-        key = json.dumps({**event.account.route.pattern})
-        if key not in self.bots:
+        if self.bots.pop(event.account.route, None) is None:
             logger.warning(f"nonebridge cannot unregister account {event.account.route}")
-        del self.bots[key]
 
     on_account_registered.__annotations__ = {"event": AccountRegistered}
     on_account_unregistered.__annotations__ = {"event": AccountUnregistered}
 
     def get_mapped_bot(self, account: BaseAccount) -> NoneBridgeBot:
-        return self.bots[json.dumps({**account.route.pattern})]
+        return self.bots[account.route]
+
+    def _interested_types(self) -> frozenset[str]:
+        # matcher 的总数变化时才重新收集; 含有 "" 表示存在接受任意类型的 matcher.
+        count = sum(len(i) for i in matchers.values())
+        if count != self._interest[0]:
+            self._interest = (count, frozenset(m.type for i in matchers.values() for m in i))
+        return self._interest[1]
+
+    def accepts_event(self, event: AvillaEvent) -> bool:
+        event_type = type(event)
+        translatable = self._translatable.get(event_type)
+        if translatable is None:
+            translatable = NoneEventTranslateSign(event_type) in self.staff.artifact_map
+            self._translatable[event_type] = translatable
+        if not translatable:
+            return False
+
+        post_type = self.post_types.get(event_type)
+        if post_type is None:
+            return True
+        interested = self._interested_types()
+        return "" in interested or post_type in interested
+
+    async def translate_event(self, event: AvillaEvent):
+        record = self.staff.artifact_map.get(NoneEventTranslateSign(type(event)))
+        if record is None:
+            return
+
+        collector, entity = record
+        staff = self.staff.ext(event.context.get_staff_components())
+        return await NoneEventTranslate.execute(staff, collector, entity, event)
 
     async def event_translater(self):
         assert self.manager is not None
@@ -93,13 +132,18 @@ class NoneBridgeService(Service):
             if event is None:
                 continue
 
-            translated_event = await self.staff.translate_event(event)
+            try:
+                translated_event = await self.translate_event(event)
+            except Exception as e:
+                logger.exception(f"failed to translate {identity(event)} to nonebot event: {e}")
+                continue
             if translated_event is None:
                 logger.warning(f"{identity(event)} cannot translate to nonebot event!")
                 continue
 
-            cx = event.context
-            bot = self.get_mapped_bot(cx.account)
+            bot = self.bots.get(event.context.account.route)
+            if bot is None:
+                continue
 
             queue_task(handle_event(bot, translated_event))
 
@@ -111,7 +155,9 @@ class NoneBridgeService(Service):
                 await run_always_await(i)
 
         async with self.stage("blocking"):
-            await any_completed(manager.status.wait_for_sigexit(), self.event_translater())
+            await any_completed(
+                manager.status.wait_for_sigexit(), *(self.event_translater() for _ in range(self.workers))
+            )
 
         async with self.stage("cleanup"):
             for i in self.driver.lifespan_agent._shutdown_funcs:
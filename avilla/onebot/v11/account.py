@@ -7,6 +7,7 @@ from avilla.core.account import AccountStatus, BaseAccount
 from avilla.core.selector import Selector
 
 from .net.base import OneBot11Networking
+from .roles import GroupRoleIndex
 
 if TYPE_CHECKING:
     from .protocol import OneBot11Protocol
@@ -18,11 +19,13 @@ class OneBot11Account(BaseAccount):
     status: AccountStatus
 
     connection: OneBot11Networking
+    group_roles: GroupRoleIndex
 
     def __init__(self, route: Selector, protocol: OneBot11Protocol):
         super().__init__(route, protocol.avilla)
         self.protocol = protocol
         self.status = AccountStatus()
+        self.group_roles = GroupRoleIndex()
 
     # @contextmanager
     # def _status_update(self):
@@ -1,12 +1,15 @@
 from __future__ import annotations
 
+from operator import itemgetter
 from typing import Any
 
 from graia.amnesia.message import Element, MessageChain
 
 from avilla.core import Selector
 from avilla.core.event import AvillaEvent
+from avilla.core.multicast import memoize_serialization
 from avilla.core.ryanvk import TargetOverload
+from avilla.core.ryanvk.behavior.fallback import SyncFallbackBehavior
 from avilla.core.ryanvk.collector.application import ApplicationCollector
 from avilla.standard.core.application import AvillaLifecycleEvent
 from avilla.standard.qq.elements import Forward
@@ -29,6 +32,13 @@ class OneBot11Capability((m := ApplicationCollector())._):
         ...
 
     @Fn.complex({PredicateOverload(lambda _, raw: raw["type"]): ["raw_element"]})
+    def deserialize_element_sync(self, raw_element: dict) -> Element:  # type: ignore
+        ...
+
+    @Fn.complex(
+        {PredicateOverload(lambda _, raw: raw["type"]): ["raw_element"]},
+        behavior=SyncFallbackBehavior(deserialize_element_sync),
+    )
     async def deserialize_element(self, raw_element: dict) -> Element:  # type: ignore
         ...
 
@@ -42,13 +52,14 @@ class OneBot11Capability((m := ApplicationCollector())._):
         ...
 
     async def deserialize_chain(self, chain: list[dict]):
-        elements = []
-
-        for raw_element in chain:
-            elements.append(await self.deserialize_element(raw_element))
-
+        elements = await self.staff.deserialize_elements(
+            chain,
+            itemgetter("type"),
+            OneBot11Capability.deserialize_element,
+        )
         return MessageChain(elements)
 
+    @memoize_serialization
     async def serialize_chain(self, chain: MessageChain):
         elements = []
 
@@ -2,16 +2,21 @@ from __future__ import annotations
 
 import asyncio
 from contextlib import suppress
+from functools import partial
 from typing import TYPE_CHECKING, AsyncIterator
 
 from loguru import logger
 from typing_extensions import Self
 
 from avilla.core.exceptions import ActionFailed
+from avilla.core.pipeline import EventPipeline
 from avilla.core.ryanvk.staff import Staff
+from avilla.core.selector import Selector
+from avilla.core.singleflight import SingleFlight
 from avilla.onebot.v11.capability import OneBot11Capability
 
 if TYPE_CHECKING:
+    from avilla.core.protocol import ProtocolConfig
     from avilla.onebot.v11.account import OneBot11Account
     from avilla.onebot.v11.protocol import OneBot11Protocol
 
@@ -21,13 +26,19 @@ class OneBot11Networking:
     accounts: dict[int, OneBot11Account]
     response_waiters: dict[str, asyncio.Future]
     close_signal: asyncio.Event
+    event_pipeline: EventPipeline
+    single_flight: SingleFlight
+    _staff: Staff | None
 
-    def __init__(self, protocol: OneBot11Protocol):
+    def __init__(self, protocol: OneBot11Protocol, config: ProtocolConfig):
         super().__init__()
         self.protocol = protocol
         self.accounts = {}
         self.response_waiters = {}
         self.close_signal = asyncio.Event()
+        self.event_pipeline = EventPipeline(config.event_pipeline)
+        self.single_flight = SingleFlight(config.single_flight)
+        self._staff = None
 
     def get_staff_components(self):
         return {"connection": self, "protocol": self.protocol, "avilla": self.protocol.avilla}
@@ -37,7 +48,8 @@ class OneBot11Networking:
 
     @property
     def staff(self):
-        return Staff(self.get_staff_artifacts(), self.get_staff_components())
+        self._staff = Staff.reuse(self._staff, self.get_staff_artifacts(), self.get_staff_components)
+        return self._staff
 
     def message_receive(self) -> AsyncIterator[tuple[Self, dict]]:
         ...
@@ -52,6 +64,12 @@ class OneBot11Networking:
     async def send(self, payload: dict) -> None:
         ...
 
+    def get_scene_key(self, data: dict) -> Selector | None:
+        if "group_id" in data:
+            return Selector().land("qq").group(str(data["group_id"]))
+        if "user_id" in data:
+            return Selector().land("qq").friend(str(data["user_id"]))
+
     async def message_handle(self):
         async for connection, data in self.message_receive():
             if echo := data.get("echo"):
@@ -66,12 +84,18 @@ class OneBot11Networking:
 
                 logger.warning(f"received unsupported event: {data}")
 
-            asyncio.create_task(event_parse_task(data))
+            key = self.get_scene_key(data) if self.event_pipeline.config.ordered else None
+            await self.event_pipeline.submit(partial(event_parse_task, data), key)
 
     async def connection_closed(self):
         self.close_signal.set()
 
     async def call(self, action: str, params: dict | None = None) -> dict | None:
+        if self.single_flight.accepts(action):
+            return await self.single_flight.run((action,), params, partial(self._call, action, params))
+        return await self._call(action, params)
+
+    async def _call(self, action: str, params: dict | None = None) -> dict | None:
         if not self.alive:
             raise RuntimeError("connection is not established")
 
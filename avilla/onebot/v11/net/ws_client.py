@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import asyncio
-import json
 from contextlib import suppress
 from typing import TYPE_CHECKING, cast
 
@@ -28,7 +27,7 @@ class OneBot11WsClientNetworking(OneBot11Networking, Service):
     session: aiohttp.ClientSession
 
     def __init__(self, protocol: OneBot11Protocol, config: OneBot11ForwardConfig) -> None:
-        super().__init__(protocol)
+        super().__init__(protocol, config)
         self.config = config
 
     @property
@@ -44,7 +43,7 @@ class OneBot11WsClientNetworking(OneBot11Networking, Service):
                 self.close_signal.set()
                 break
             elif msg.type == aiohttp.WSMsgType.TEXT:
-                data: dict = json.loads(cast(str, msg.data))
+                data: dict = self.config.json_codec.loads(cast(str, msg.data))
                 yield self, data
         else:
             await self.connection_closed()
@@ -53,7 +52,7 @@ class OneBot11WsClientNetworking(OneBot11Networking, Service):
         if self.connection is None:
             raise RuntimeError("connection is not established")
 
-        await self.connection.send_json(payload)
+        await self.connection.send_json(payload, dumps=self.config.json_codec.dumps)
 
     async def wait_for_available(self):
         await self.status.wait_for_available()
@@ -120,7 +119,7 @@ class OneBot11WsClientNetworking(OneBot11Networking, Service):
 
     async def launch(self, manager: Launart):
         async with self.stage("preparing"):
-            self.session = aiohttp.ClientSession()
+            self.session = aiohttp.ClientSession(json_serialize=self.config.json_codec.dumps)
 
         async with self.stage("blocking"):
             await self.connection_daemon(manager, self.session)
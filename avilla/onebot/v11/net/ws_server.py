@@ -11,6 +11,7 @@ from starlette.applications import Starlette
 from starlette.routing import WebSocketRoute
 from starlette.websockets import WebSocket
 
+from avilla.core.codec import JsonCodec
 from avilla.onebot.v11.net.base import OneBot11Networking
 from avilla.standard.core.account import AccountUnregistered
 
@@ -21,10 +22,12 @@ if TYPE_CHECKING:
 
 class OneBot11WsServerConnection(OneBot11Networking):
     connection: WebSocket
+    json_codec: JsonCodec
 
-    def __init__(self, connection: WebSocket, protocol: OneBot11Protocol):
+    def __init__(self, connection: WebSocket, protocol: OneBot11Protocol, config: OneBot11ReverseConfig):
         self.connection = connection
-        super().__init__(protocol)
+        super().__init__(protocol, config)
+        self.json_codec = config.json_codec
 
     @property
     def id(self):
@@ -35,8 +38,8 @@ class OneBot11WsServerConnection(OneBot11Networking):
         return not self.close_signal.is_set()
 
     async def message_receive(self):
-        async for msg in self.connection.iter_json():
-            yield self, msg
+        async for msg in self.connection.iter_text():
+            yield self, self.json_codec.loads(msg)
         else:
             await self.connection_closed()
 
@@ -44,7 +47,7 @@ class OneBot11WsServerConnection(OneBot11Networking):
         return
 
     async def send(self, payload: dict) -> None:
-        return await self.connection.send_json(payload)
+        return await self.connection.send_text(self.json_codec.dumps(payload))
 
     async def unregister_account(self):
         avilla = self.protocol.avilla
@@ -82,7 +85,7 @@ class OneBot11WsServerNetworking(Service):
         account_id = ws.headers["X-Self-ID"]
 
         await ws.accept()
-        connection = OneBot11WsServerConnection(ws, self.protocol)
+        connection = OneBot11WsServerConnection(ws, self.protocol, self.config)
         self.connections[account_id] = connection
 
         try:
@@ -98,6 +98,8 @@ class OneBot11EventMessagePerform((m := ConnectionCollector())._):
             return
         group = Selector().land(account.route["land"]).group(str(raw_event["group_id"]))
         member = group.member(str(raw_event["sender"]["user_id"]))
+        sender = raw_event["sender"]
+        account.group_roles.observe(raw_event["group_id"], sender["user_id"], sender.get("role"))
         context = Context(
             account,
             member,
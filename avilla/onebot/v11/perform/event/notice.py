@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from datetime import timedelta
-from typing import cast
+from functools import partial
 
 from loguru import logger
 
@@ -36,11 +36,13 @@ class OneBot11EventNoticePerform((m := ConnectionCollector())._):
             return
         group = Selector().land("qq").group(str(raw_event["group_id"]))
         endpoint = group.member(str(raw_event["user_id"]))
+        account.group_roles.observe(raw_event["group_id"], raw_event["user_id"], "admin")
 
         # get operator(group owner)
-        members = await self.connection.call("get_group_member_list", {"group": raw_event["group_id"]})
-        members = cast("list[dict]", members)
-        operator_id = next((d["id"] for d in members if d["role"] == "owner"), None)
+        operator_id = await account.group_roles.get_owner(
+            raw_event["group_id"],
+            partial(self.connection.call, "get_group_member_list", {"group_id": raw_event["group_id"]}),  # type: ignore
+        )
         operator = group.member(str(operator_id)) if operator_id else group
         context = Context(account, operator, endpoint, group, group.member(str(self_id)))
         return MetadataModified(
@@ -64,11 +66,13 @@ class OneBot11EventNoticePerform((m := ConnectionCollector())._):
             return
         group = Selector().land("qq").group(str(raw_event["group_id"]))
         endpoint = group.member(str(raw_event["user_id"]))
+        account.group_roles.observe(raw_event["group_id"], raw_event["user_id"], "member")
 
         # get operator(group owner)
-        members = await self.connection.call("get_group_member_list", {"group": raw_event["group_id"]})
-        members = cast("list[dict]", members)
-        operator_id = next((d["id"] for d in members if d["role"] == "owner"), None)
+        operator_id = await account.group_roles.get_owner(
+            raw_event["group_id"],
+            partial(self.connection.call, "get_group_member_list", {"group_id": raw_event["group_id"]}),  # type: ignore
+        )
         operator = group.member(str(operator_id)) if operator_id else group
         context = Context(account, operator, endpoint, group, group.member(str(self_id)))
         return MetadataModified(
@@ -90,6 +94,7 @@ class OneBot11EventNoticePerform((m := ConnectionCollector())._):
         if account is None:
             logger.warning(f"Unknown account {self_id} received message {raw_event}")
             return
+        account.group_roles.remove_member(raw_event["group_id"], raw_event["user_id"])
         group = Selector().land("qq").group(str(raw_event["group_id"]))
         endpoint = group.member(str(raw_event["user_id"]))
         operator = group.member(str(raw_event["operator_id"]))
@@ -103,6 +108,7 @@ class OneBot11EventNoticePerform((m := ConnectionCollector())._):
         if account is None:
             logger.warning(f"Unknown account {self_id} received message {raw_event}")
             return
+        account.group_roles.remove_member(raw_event["group_id"], raw_event["user_id"])
         group = Selector().land("qq").group(str(raw_event["group_id"]))
         endpoint = group.member(str(raw_event["user_id"]))
         operator = group.member(str(raw_event["operator_id"]))
@@ -116,6 +122,7 @@ class OneBot11EventNoticePerform((m := ConnectionCollector())._):
         if account is None:
             logger.warning(f"Unknown account {self_id} received message {raw_event}")
             return
+        account.group_roles.forget_group(raw_event["group_id"])
         group = Selector().land("qq").group(str(raw_event["group_id"]))
         endpoint = group.member(str(raw_event["user_id"]))
         operator = group.member(str(raw_event["operator_id"]))
@@ -33,12 +33,12 @@ class OneBot11MessageDeserializePerform((m := ApplicationCollector())._):
     account: OptionalAccess[OneBot11Account] = OptionalAccess()
     # LINK: https://github.com/microsoft/pyright/issues/5409
 
-    @m.entity(OneBot11Capability.deserialize_element, raw_element="text")
-    async def text(self, raw_element: dict) -> Text:
+    @m.entity(OneBot11Capability.deserialize_element_sync, raw_element="text")
+    def text(self, raw_element: dict) -> Text:
         return Text(raw_element["data"]["text"])
 
-    @m.entity(OneBot11Capability.deserialize_element, raw_element="face")
-    async def face(self, raw_element: dict) -> Face:
+    @m.entity(OneBot11Capability.deserialize_element_sync, raw_element="face")
+    def face(self, raw_element: dict) -> Face:
         return Face(raw_element["data"]["id"])
 
     @m.entity(OneBot11Capability.deserialize_element, raw_element="image")
@@ -51,16 +51,16 @@ class OneBot11MessageDeserializePerform((m := ApplicationCollector())._):
         resource = OneBot11ImageResource(id_, data["file"], data["url"])
         return FlashImage(resource) if raw_element.get("type") == "flash" else Picture(resource)
 
-    @m.entity(OneBot11Capability.deserialize_element, raw_element="at")
-    async def at(self, raw_element: dict) -> Notice | NoticeAll:
+    @m.entity(OneBot11Capability.deserialize_element_sync, raw_element="at")
+    def at(self, raw_element: dict) -> Notice | NoticeAll:
         if raw_element["data"]["qq"] == "all":
             return NoticeAll()
         if self.context:
             return Notice(self.context.scene.member(raw_element["data"]["qq"]))
         return Notice(Selector().land("qq").member(raw_element["data"]["qq"]))
 
-    @m.entity(OneBot11Capability.deserialize_element, raw_element="reply")
-    async def reply(self, raw_element: dict):
+    @m.entity(OneBot11Capability.deserialize_element_sync, raw_element="reply")
+    def reply(self, raw_element: dict):
         if self.context:
             return Reference(self.context.scene.message(raw_element["data"]["id"]))
         return Reference(Selector().land("qq").message(raw_element["data"]["id"]))
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import base64
 from typing import TYPE_CHECKING, cast
 
 from avilla.core.elements import Face, Notice, NoticeAll, Picture, Text, Reference
@@ -57,7 +56,7 @@ class OneBot11MessageSerializePerform((m := AccountCollector["OneBot11Protocol",
                 },
             }
         elif isinstance(element.resource, LocalFileResource):
-            data = base64.b64encode(element.resource.file.read_bytes()).decode("utf-8")
+            data = await self.account.avilla.encode_cache.b64encode_file(element.resource.file)
             return {
                 "type": "image",
                 "data": {
@@ -65,7 +64,7 @@ class OneBot11MessageSerializePerform((m := AccountCollector["OneBot11Protocol",
                 },
             }
         elif isinstance(element.resource, RawResource):
-            data = base64.b64encode(element.resource.data).decode("utf-8")
+            data = await self.account.avilla.encode_cache.b64encode_bytes(element.resource.data)
             return {
                 "type": "image",
                 "data": {
@@ -73,13 +72,13 @@ class OneBot11MessageSerializePerform((m := AccountCollector["OneBot11Protocol",
                 },
             }
         else:
+            data = await self.account.avilla.encode_cache.b64encode_bytes(
+                cast(bytes, await self.account.staff.fetch_resource(element.resource))
+            )
             return {
                 "type": "image",
                 "data": {
-                    "file": "base64://"
-                    + base64.b64encode(cast(bytes, await self.account.staff.fetch_resource(element.resource))).decode(
-                        "utf-8"
-                    ),
+                    "file": "base64://" + data,
                 },
             }
 
@@ -3,6 +3,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Callable, cast
 
 from avilla.core.builtins.capability import CoreCapability
+from avilla.core.exceptions import ActionFailed
 from avilla.core.ryanvk.collector.account import AccountCollector
 from avilla.core.selector import Selector
 
@@ -32,3 +33,21 @@ class OneBot11GroupQueryPerform((m := AccountCollector["OneBot11Protocol", "OneB
             member_id = str(i["user_id"])
             if callable(predicate) and predicate("member", member_id) or member_id == predicate:
                 yield previous.member(member_id)
+
+    @CoreCapability.query.collect(m, "member", "land.group", point=True)
+    async def query_group_member(self, predicate: str, previous: Selector):
+        try:
+            member_id = int(predicate)
+        except ValueError:
+            # 非数字的字面量无法点查, 回落到列表扫描.
+            async for i in self.query_group_members(predicate, previous):
+                yield i
+            return
+        try:
+            result = await self.account.connection.call(
+                "get_group_member_info", {"group_id": int(previous["group"]), "user_id": member_id}
+            )
+        except ActionFailed:
+            return
+        if result:
+            yield previous.member(str(result["user_id"]))
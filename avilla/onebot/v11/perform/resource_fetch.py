@@ -1,8 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
-
-from aiohttp import ClientSession
+from typing import TYPE_CHECKING, AsyncIterator
 
 from avilla.core.builtins.capability import CoreCapability
 from avilla.core.ryanvk.collector.protocol import ProtocolCollector
@@ -27,6 +25,13 @@ class OneBot11ResourceFetchPerform((m := ProtocolCollector["OneBot11Protocol"]()
     @m.entity(CoreCapability.fetch, resource=OneBot11ImageResource)
     @m.entity(CoreCapability.fetch, resource=OneBot11VideoResource)
     async def fetch_resource(self, resource: OneBot11Resource) -> bytes:
-        async with ClientSession() as session:
-            async with session.get(resource.url) as resp:
-                return await resp.read()
+        return await self.protocol.avilla.http.read(resource.url)
+
+    @m.entity(CoreCapability.stream, resource=OneBot11Resource)
+    @m.entity(CoreCapability.stream, resource=OneBot11RecordResource)
+    @m.entity(CoreCapability.stream, resource=OneBot11FileResource)
+    @m.entity(CoreCapability.stream, resource=OneBot11ImageResource)
+    @m.entity(CoreCapability.stream, resource=OneBot11VideoResource)
+    async def stream_resource(self, resource: OneBot11Resource, chunk_size: int | None = None) -> AsyncIterator[bytes]:
+        async for chunk in self.protocol.avilla.http.stream(resource.url, chunk_size):
+            yield chunk
@@ -5,7 +5,7 @@ from dataclasses import dataclass
 from yarl import URL
 
 from avilla.core.application import Avilla
-from avilla.core.protocol import BaseProtocol
+from avilla.core.protocol import BaseProtocol, ProtocolConfig
 from graia.ryanvk import merge, ref
 
 from .net.ws_client import OneBot11WsClientNetworking
@@ -14,13 +14,13 @@ from .service import OneBot11Service
 
 
 @dataclass
-class OneBot11ForwardConfig:
+class OneBot11ForwardConfig(ProtocolConfig):
     endpoint: URL
     access_token: str | None = None
 
 
 @dataclass
-class OneBot11ReverseConfig:
+class OneBot11ReverseConfig(ProtocolConfig):
     endpoint: str
     access_token: str | None = None
 
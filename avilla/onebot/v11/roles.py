@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable
+
+ROLES_TTL = 600.0
+
+
+@dataclass
+class GroupRoles:
+    owner: int | None = None
+    admins: set[int] = field(default_factory=set)
+    refreshed_at: float = 0.0
+    # 仅完整拉取成员列表或直接观察到群主时更新 refreshed_at.
+
+
+class GroupRoleIndex:
+    """按账号维护的群主/管理员索引.
+
+    由消息中的 ``sender.role`` 及管理员/成员变动通知增量维护;
+    仅在群主未知或记录超过 ``ttl`` 时才拉取完整的成员列表, 同一群的并发拉取会被合并.
+    """
+
+    ttl: float
+    groups: dict[int, GroupRoles]
+    _refreshing: dict[int, asyncio.Task[GroupRoles]]
+
+    def __init__(self, ttl: float = ROLES_TTL) -> None:
+        self.ttl = ttl
+        self.groups = {}
+        self._refreshing = {}
+
+    def observe(self, group_id: int, user_id: int, role: str | None):
+        roles = self.groups.get(group_id)
+        if roles is None:
+            if role not in {"owner", "admin"}:
+                return
+            roles = self.groups[group_id] = GroupRoles()
+
+        if role == "owner":
+            roles.owner = user_id
+            roles.admins.discard(user_id)
+            roles.refreshed_at = time.monotonic()
+        elif role == "admin":
+            roles.admins.add(user_id)
+        elif role == "member":
+            roles.admins.discard(user_id)
+
+    def remove_member(self, group_id: int, user_id: int):
+        roles = self.groups.get(group_id)
+        if roles is None:
+            return
+        roles.admins.discard(user_id)
+        if roles.owner == user_id:
+            roles.owner = None
+
+    def forget_group(self, group_id: int):
+        self.groups.pop(group_id, None)
+
+    async def get_owner(self, group_id: int, fetch_members: Callable[[], Awaitable[list[dict] | None]]) -> int | None:
+        roles = self.groups.get(group_id)
+        if roles is None or roles.owner is None or time.monotonic() - roles.refreshed_at > self.ttl:
+            roles = await self.refresh(group_id, fetch_members)
+        return roles.owner
+
+    async def refresh(self, group_id: int, fetch_members: Callable[[], Awaitable[list[dict] | None]]) -> GroupRoles:
+        task = self._refreshing.get(group_id)
+        if task is None:
+            task = self._refreshing[group_id] = asyncio.create_task(self._refresh(group_id, fetch_members))
+            task.add_done_callback(lambda _: self._refreshing.pop(group_id, None))
+        return await asyncio.shield(task)
+
+    async def _refresh(self, group_id: int, fetch_members: Callable[[], Awaitable[list[dict] | None]]) -> GroupRoles:
+        members = await fetch_members() or []
+        roles = GroupRoles(refreshed_at=time.monotonic())
+        for member in members:
+            if member["role"] == "owner":
+                roles.owner = member["user_id"]
+            elif member["role"] == "admin":
+                roles.admins.add(member["user_id"])
+
+        self.groups[group_id] = roles
+        return roles
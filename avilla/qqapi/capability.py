@@ -1,10 +1,13 @@
 from __future__ import annotations
 
+from operator import itemgetter
 from typing import Any, Literal
 
 from graia.amnesia.message import Element, MessageChain
 
 from avilla.core.event import AvillaEvent
+from avilla.core.multicast import memoize_serialization
+from avilla.core.ryanvk.behavior.fallback import SyncFallbackBehavior
 from avilla.core.ryanvk.collector.application import ApplicationCollector
 from avilla.core.ryanvk.overload.target import TargetOverload
 from avilla.core.selector import Selector
@@ -20,6 +23,13 @@ class QQAPICapability((m := ApplicationCollector())._):
         ...
 
     @Fn.complex({PredicateOverload(lambda _, raw: raw["type"]): ["raw_element"]})
+    def deserialize_element_sync(self, raw_element: dict) -> Element:
+        ...
+
+    @Fn.complex(
+        {PredicateOverload(lambda _, raw: raw["type"]): ["raw_element"]},
+        behavior=SyncFallbackBehavior(deserialize_element_sync),
+    )
     async def deserialize_element(self, raw_element: dict) -> Element:
         ...
 
@@ -45,26 +55,29 @@ class QQAPICapability((m := ApplicationCollector())._):
         ...
 
     async def deserialize(self, event: dict):
-        elements = []
+        raw_elements = []
 
         if message_reference := event.get("message_reference"):
-            elements.append(await self.deserialize_element({"type": "message_reference", **message_reference}))
+            raw_elements.append({"type": "message_reference", **message_reference})
         if event.get("mention_everyone", False):
-            elements.append(await self.deserialize_element({"type": "mention_everyone"}))
+            raw_elements.append({"type": "mention_everyone"})
         if "content" in event:
-            for i in handle_text(event["content"]):
-                elements.append(await self.deserialize_element(i))
+            raw_elements.extend(handle_text(event["content"]))
         if attachments := event.get("attachments"):
-            for i in attachments:
-                elements.append(await self.deserialize_element({"type": "attachment", **i}))
+            raw_elements.extend({"type": "attachment", **i} for i in attachments)
         if embeds := event.get("embeds"):
-            for i in embeds:
-                elements.append(await self.deserialize_element({"type": "embed", **i}))
+            raw_elements.extend({"type": "embed", **i} for i in embeds)
         if ark := event.get("ark"):
-            elements.append(await self.deserialize_element({"type": "ark", **ark}))
+            raw_elements.append({"type": "ark", **ark})
 
+        elements = await self.staff.deserialize_elements(
+            raw_elements,
+            itemgetter("type"),
+            QQAPICapability.deserialize_element,
+        )
         return MessageChain(elements)
 
+    @memoize_serialization
     async def serialize(self, message: MessageChain):
         res = {}
         content = ""
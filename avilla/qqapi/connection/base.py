@@ -3,18 +3,23 @@ from __future__ import annotations
 import asyncio
 from contextlib import suppress
 from datetime import datetime
+from functools import partial
 from typing import TYPE_CHECKING, AsyncIterator, Literal
 
 from loguru import logger
 from typing_extensions import Self
 
+from avilla.core.pipeline import EventPipeline
 from avilla.core.ryanvk.staff import Staff
+from avilla.core.selector import Selector
+from avilla.core.singleflight import SingleFlight
 from avilla.qqapi.audit import MessageAudited, audit_result
 from avilla.qqapi.capability import QQAPICapability
 
 from .util import Opcode, Payload
 
 if TYPE_CHECKING:
+    from avilla.core.protocol import ProtocolConfig
     from avilla.qqapi.protocol import QQAPIProtocol
 
 CallMethod = Literal["get", "post", "fetch", "update", "multipart", "put", "delete", "patch"]
@@ -24,6 +29,9 @@ class QQAPINetworking:
     protocol: QQAPIProtocol
     response_waiters: dict[str, asyncio.Future]
     close_signal: asyncio.Event
+    event_pipeline: EventPipeline
+    single_flight: SingleFlight
+    _staff: Staff | None
 
     account_id: str
     self_info: dict
@@ -32,11 +40,14 @@ class QQAPINetworking:
     _access_token: str | None
     _expires_in: datetime | None
 
-    def __init__(self, protocol: QQAPIProtocol):
+    def __init__(self, protocol: QQAPIProtocol, config: ProtocolConfig):
         super().__init__()
         self.protocol = protocol
         self.response_waiters = {}
         self.close_signal = asyncio.Event()
+        self.event_pipeline = EventPipeline(config.event_pipeline)
+        self.single_flight = SingleFlight(config.single_flight)
+        self._staff = None
         self.session_id = None
         self.sequence = None
         self._access_token = None
@@ -50,7 +61,8 @@ class QQAPINetworking:
 
     @property
     def staff(self):
-        return Staff(self.get_staff_artifacts(), self.get_staff_components())
+        self._staff = Staff.reuse(self._staff, self.get_staff_artifacts(), self.get_staff_components)
+        return self._staff
 
     def message_receive(self, shard: tuple[int, int]) -> AsyncIterator[tuple[Self, dict]]:
         ...
@@ -65,6 +77,16 @@ class QQAPINetworking:
     async def send(self, payload: dict, shard: tuple[int, int]) -> None:
         ...
 
+    def get_scene_key(self, data: dict) -> Selector | None:
+        if "group_openid" in data or "group_id" in data:
+            return Selector().land("qq").group(data.get("group_openid", data.get("group_id")))
+        if "guild_id" in data:
+            guild = Selector().land("qq").guild(data["guild_id"])
+            return guild.channel(data["channel_id"]) if "channel_id" in data else guild
+        if "author" in data:
+            author = data["author"]
+            return Selector().land("qq").friend(author.get("user_openid", author.get("id")))
+
     async def message_handle(self, shard: tuple[int, int]):
         async for connection, data in self.message_receive(shard):
             if data["op"] != Opcode.DISPATCH:
@@ -87,7 +109,10 @@ class QQAPINetworking:
                 logger.warning(f"received unsupported event {event_type.lower()}: {_data.data}")
                 return
 
-            asyncio.create_task(event_parse_task(payload))
+            key = None
+            if self.event_pipeline.config.ordered and isinstance(payload.data, dict):
+                key = self.get_scene_key(payload.data)
+            await self.event_pipeline.submit(partial(event_parse_task, payload), key)
 
     async def connection_closed(self):
         self.session_id = None
@@ -1,11 +1,11 @@
 from __future__ import annotations
 
 import asyncio
-import json
 import sys
 from contextlib import suppress
 from dataclasses import asdict
 from datetime import datetime, timedelta, timezone
+from functools import partial
 from typing import TYPE_CHECKING, cast
 
 import aiohttp
@@ -46,7 +46,7 @@ class QQAPIWsClientNetworking(QQAPINetworking, Service):
         return f"qqapi/connection/client#{self.config.id}"
 
     def __init__(self, protocol: QQAPIProtocol, config: QQAPIConfig) -> None:
-        super().__init__(protocol)
+        super().__init__(protocol, config)
         self.config = config
         if any([not config.id, not config.token, not config.secret]):
             raise ValueError("config is not complete")
@@ -67,7 +67,7 @@ class QQAPIWsClientNetworking(QQAPINetworking, Service):
                     raise NetworkError(
                         f"Get authorization failed with status code {resp.status}." " Please check your config."
                     )
-                data = await resp.json()
+                data = await resp.json(loads=self.config.json_codec.loads)
             self._access_token = cast(str, data["access_token"])
             self._expires_in = datetime.now(timezone.utc) + timedelta(seconds=int(data["expires_in"]))
         return self._access_token
@@ -96,7 +96,7 @@ class QQAPIWsClientNetworking(QQAPINetworking, Service):
                 self.close_signal.set()
                 break
             elif msg.type == aiohttp.WSMsgType.TEXT:
-                data: dict = json.loads(cast(str, msg.data))
+                data: dict = self.config.json_codec.loads(cast(str, msg.data))
                 if data["op"] == Opcode.RECONNECT:
                     logger.warning("Received reconnect event from server, will reconnect in 5 seconds...")
                     break
@@ -120,7 +120,7 @@ class QQAPIWsClientNetworking(QQAPINetworking, Service):
         if (connection := self.connections.get(shard)) is None:
             raise RuntimeError("connection is not established")
 
-        await connection.send_json(payload)
+        await connection.send_json(payload, dumps=self.config.json_codec.dumps)
 
     async def _call_http(
         self, method: CallMethod, action: str, headers: dict[str, str] | None = None, params: dict | None = None
@@ -185,6 +185,13 @@ class QQAPIWsClientNetworking(QQAPINetworking, Service):
         raise ValueError(f"unknown method {method}")
 
     async def call_http(self, method: CallMethod, action: str, params: dict | None = None) -> dict:
+        if method in {"get", "fetch"} and self.single_flight.accepts(action):
+            return await self.single_flight.run(
+                (method, action), params, partial(self._call_http_auth, method, action, params)
+            )
+        return await self._call_http_auth(method, action, params)
+
+    async def _call_http_auth(self, method: CallMethod, action: str, params: dict | None = None) -> dict:
         headers = await self.get_authorization_header()
         try:
             return await self._call_http(method, action, headers, params)
@@ -222,7 +229,7 @@ class QQAPIWsClientNetworking(QQAPINetworking, Service):
         if not (connection := self.connections.get(shard)):
             raise RuntimeError("connection is not established")
         try:
-            payload = Payload(**await connection.receive_json())
+            payload = Payload(**await connection.receive_json(loads=self.config.json_codec.loads))
             assert payload.opcode == Opcode.HELLO, f"Received unexpected payload: {payload!r}"
             return payload.data["heartbeat_interval"]
         except Exception as e:
@@ -268,7 +275,7 @@ class QQAPIWsClientNetworking(QQAPINetworking, Service):
         if not self.session_id:
             # https://bot.q.qq.com/wiki/develop/api/gateway/reference.html#_2-%E9%89%B4%E6%9D%83%E8%BF%9E%E6%8E%A5
             # 鉴权成功之后，后台会下发一个 Ready Event
-            payload = Payload(**await connection.receive_json())
+            payload = Payload(**await connection.receive_json(loads=self.config.json_codec.loads))
             if payload.opcode == Opcode.INVALID_SESSION:
                 logger.warning("Received invalid session event from server, will try to resume")
                 return False
@@ -374,7 +381,7 @@ class QQAPIWsClientNetworking(QQAPINetworking, Service):
 
     async def launch(self, manager: Launart):
         async with self.stage("preparing"):
-            self.session = aiohttp.ClientSession()
+            self.session = aiohttp.ClientSession(json_serialize=self.config.json_codec.dumps)
             gateway_info = await self.call_http("get", "gateway/bot")
             ws_url = gateway_info["url"]
             remain = gateway_info.get("session_start_limit", {}).get("remaining")
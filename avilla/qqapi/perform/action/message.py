@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-from base64 import b64encode
 from datetime import datetime, timedelta, timezone
 from typing import TYPE_CHECKING, Any
 
@@ -44,7 +43,7 @@ class QQAPIMessageActionPerform((m := AccountCollector["QQAPIProtocol", "QQAPIAc
         file_data: str | bytes | None = None,
     ) -> dict:
         if isinstance(file_data, bytes):
-            file_data = b64encode(file_data).decode()
+            file_data = await self.account.avilla.encode_cache.b64encode_bytes(file_data)
         result = await self.account.connection.call_http(
             "post",
             f"v2/groups/{target.pattern['group']}/files",
@@ -69,7 +68,7 @@ class QQAPIMessageActionPerform((m := AccountCollector["QQAPIProtocol", "QQAPIAc
         file_data: str | bytes | None = None,
     ) -> dict:
         if isinstance(file_data, bytes):
-            file_data = b64encode(file_data).decode()
+            file_data = await self.account.avilla.encode_cache.b64encode_bytes(file_data)
         result = await self.account.connection.call_http(
             "post",
             f"v2/users/{target.pattern['friend']}/files",
@@ -35,12 +35,12 @@ class QQAPIMessageDeserializePerform((m := ApplicationCollector())._):
     # LINK: https://github.com/microsoft/pyright/issues/5409
     context: OptionalAccess[Context] = OptionalAccess()
 
-    @m.entity(QQAPICapability.deserialize_element, raw_element="text")
-    async def text(self, raw_element: dict) -> Text:
+    @m.entity(QQAPICapability.deserialize_element_sync, raw_element="text")
+    def text(self, raw_element: dict) -> Text:
         return Text(raw_element["text"])
 
-    @m.entity(QQAPICapability.deserialize_element, raw_element="emoji")
-    async def emoji(self, raw_element: dict) -> Face:
+    @m.entity(QQAPICapability.deserialize_element_sync, raw_element="emoji")
+    def emoji(self, raw_element: dict) -> Face:
         return Face(raw_element["id"])
 
     @m.entity(QQAPICapability.deserialize_element, raw_element="attachment")
@@ -93,8 +93,8 @@ class QQAPIMessageDeserializePerform((m := ApplicationCollector())._):
         )
         return Picture(resource)
 
-    @m.entity(QQAPICapability.deserialize_element, raw_element="mention_user")
-    async def mention(self, raw_element: dict) -> Notice:
+    @m.entity(QQAPICapability.deserialize_element_sync, raw_element="mention_user")
+    def mention(self, raw_element: dict) -> Notice:
         if self.context:
             return Notice(self.context.scene.member(raw_element["user_id"]))
         return Notice(Selector().land("qqguild").member(raw_element["user_id"]))
@@ -107,12 +107,12 @@ class QQAPIMessageDeserializePerform((m := ApplicationCollector())._):
             )
         return Notice(Selector().land("qqguild").channel(raw_element["channel_id"]))
 
-    @m.entity(QQAPICapability.deserialize_element, raw_element="mention_everyone")
-    async def mention_everyone(self, raw_element: dict) -> NoticeAll:
+    @m.entity(QQAPICapability.deserialize_element_sync, raw_element="mention_everyone")
+    def mention_everyone(self, raw_element: dict) -> NoticeAll:
         return NoticeAll()
 
-    @m.entity(QQAPICapability.deserialize_element, raw_element="message_reference")
-    async def message_reference(self, raw_element: dict) -> Reference:
+    @m.entity(QQAPICapability.deserialize_element_sync, raw_element="message_reference")
+    def message_reference(self, raw_element: dict) -> Reference:
         if self.context:
             return Reference(self.context.scene.message(raw_element["message_id"]))
         return Reference(Selector().land("qqguild").message(raw_element["message_id"]))
@@ -50,7 +50,7 @@ class QQAPIMessageSerializePerform((m := AccountCollector["QQAPIProtocol", "QQAP
         if isinstance(element.resource, (QQAPIImageResource, UrlResource)):
             return "media", ("image", element.resource.url)
         if isinstance(element.resource, LocalFileResource):
-            return "file_image", element.resource.file.read_bytes()
+            return "file_image", await self.account.avilla.encode_cache.read_file(element.resource.file)
         if isinstance(element.resource, RawResource):
             return "file_image", element.resource.data
         return "file_image", await self.account.staff.fetch_resource(element.resource)
@@ -60,7 +60,7 @@ class QQAPIMessageSerializePerform((m := AccountCollector["QQAPIProtocol", "QQAP
         if isinstance(element.resource, (QQAPIAudioResource, UrlResource)):
             return "media", ("audio", element.resource.url)
         if isinstance(element.resource, LocalFileResource):
-            return "file_audio", element.resource.file.read_bytes()
+            return "file_audio", await self.account.avilla.encode_cache.read_file(element.resource.file)
         if isinstance(element.resource, RawResource):
             return "file_audio", element.resource.data
         return "file_audio", await self.account.staff.fetch_resource(element.resource)
@@ -70,7 +70,7 @@ class QQAPIMessageSerializePerform((m := AccountCollector["QQAPIProtocol", "QQAP
         if isinstance(element.resource, (QQAPIVideoResource, UrlResource)):
             return "media", ("video", element.resource.url)
         if isinstance(element.resource, LocalFileResource):
-            return "file_video", element.resource.file.read_bytes()
+            return "file_video", await self.account.avilla.encode_cache.read_file(element.resource.file)
         if isinstance(element.resource, RawResource):
             return "file_video", element.resource.data
         return "file_video", await self.account.staff.fetch_resource(element.resource)
@@ -80,7 +80,7 @@ class QQAPIMessageSerializePerform((m := AccountCollector["QQAPIProtocol", "QQAP
         if isinstance(element.resource, (QQAPIFileResource, UrlResource)):
             return "media", ("file", element.resource.url)
         if isinstance(element.resource, LocalFileResource):
-            return "file_file", element.resource.file.read_bytes()
+            return "file_file", await self.account.avilla.encode_cache.read_file(element.resource.file)
         if isinstance(element.resource, RawResource):
             return "file_file", element.resource.data
         return "file_file", await self.account.staff.fetch_resource(element.resource)
@@ -1,8 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
-
-from aiohttp import ClientSession
+from typing import TYPE_CHECKING, AsyncIterator
 
 from avilla.core.builtins.capability import CoreCapability
 from avilla.core.ryanvk.collector.protocol import ProtocolCollector
@@ -27,6 +25,13 @@ class QQAPIResourceFetchPerform((m := ProtocolCollector["QQAPIProtocol"]())._):
     @m.entity(CoreCapability.fetch, resource=QQAPIImageResource)
     @m.entity(CoreCapability.fetch, resource=QQAPIVideoResource)
     async def fetch_resource(self, resource: QQAPIResource) -> bytes:
-        async with ClientSession() as session:
-            async with session.get(resource.url) as resp:
-                return await resp.read()
+        return await self.protocol.avilla.http.read(resource.url)
+
+    @m.entity(CoreCapability.stream, resource=QQAPIResource)
+    @m.entity(CoreCapability.stream, resource=QQAPIAudioResource)
+    @m.entity(CoreCapability.stream, resource=QQAPIFileResource)
+    @m.entity(CoreCapability.stream, resource=QQAPIImageResource)
+    @m.entity(CoreCapability.stream, resource=QQAPIVideoResource)
+    async def stream_resource(self, resource: QQAPIResource, chunk_size: int | None = None) -> AsyncIterator[bytes]:
+        async for chunk in self.protocol.avilla.http.stream(resource.url, chunk_size):
+            yield chunk
@@ -1,10 +1,13 @@
 from __future__ import annotations
 
+from operator import itemgetter
 from typing import Any
 
 from graia.amnesia.message import Element, MessageChain
 
 from avilla.core.event import AvillaEvent
+from avilla.core.multicast import memoize_serialization
+from avilla.core.ryanvk.behavior.fallback import SyncFallbackBehavior
 from avilla.core.ryanvk.collector.application import ApplicationCollector
 from avilla.core.ryanvk.overload.target import TargetOverload
 from avilla.core.selector import Selector
@@ -19,6 +22,13 @@ class RedCapability((m := ApplicationCollector())._):
         ...
 
     @Fn.complex({PredicateOverload(lambda _, raw: raw["type"]): ["element"]})
+    def deserialize_element_sync(self, element: dict) -> Element:  # type: ignore
+        ...
+
+    @Fn.complex(
+        {PredicateOverload(lambda _, raw: raw["type"]): ["element"]},
+        behavior=SyncFallbackBehavior(deserialize_element_sync),
+    )
     async def deserialize_element(self, element: dict) -> Element:  # type: ignore
         ...
 
@@ -35,13 +45,14 @@ class RedCapability((m := ApplicationCollector())._):
         ...
 
     async def deserialize(self, elements: list[dict]):
-        _elements = []
-
-        for raw_element in elements:
-            _elements.append(await self.deserialize_element(raw_element))
-
+        _elements = await self.staff.deserialize_elements(
+            elements,
+            itemgetter("type"),
+            RedCapability.deserialize_element,
+        )
         return MessageChain(_elements)
 
+    @memoize_serialization
     async def serialize(self, message: MessageChain):
         chain = []
 
@@ -2,17 +2,22 @@ from __future__ import annotations
 
 import asyncio
 from contextlib import suppress
+from functools import partial
 from typing import TYPE_CHECKING, AsyncIterator, Literal, overload
 
 from loguru import logger
 from typing_extensions import Self
 
+from avilla.core.pipeline import EventPipeline
 from avilla.core.ryanvk.staff import Staff
+from avilla.core.selector import Selector
+from avilla.core.singleflight import SingleFlight
 from avilla.red.account import RedAccount
 from avilla.red.capability import RedCapability
 from avilla.red.utils import MsgType, get_msg_types
 
 if TYPE_CHECKING:
+    from avilla.core.protocol import ProtocolConfig
     from avilla.red.protocol import RedProtocol
 
 
@@ -20,12 +25,18 @@ class RedNetworking:
     protocol: RedProtocol
     account: RedAccount | None
     close_signal: asyncio.Event
+    event_pipeline: EventPipeline
+    single_flight: SingleFlight
+    _staff: Staff | None
 
-    def __init__(self, protocol: RedProtocol):
+    def __init__(self, protocol: RedProtocol, config: ProtocolConfig):
         super().__init__()
         self.protocol = protocol
         self.account = None
         self.close_signal = asyncio.Event()
+        self.event_pipeline = EventPipeline(config.event_pipeline)
+        self.single_flight = SingleFlight(config.single_flight)
+        self._staff = None
 
     def get_staff_components(self):
         return {"connection": self, "protocol": self.protocol, "avilla": self.protocol.avilla}
@@ -35,7 +46,8 @@ class RedNetworking:
 
     @property
     def staff(self):
-        return Staff(self.get_staff_artifacts(), self.get_staff_components())
+        self._staff = Staff.reuse(self._staff, self.get_staff_artifacts(), self.get_staff_components)
+        return self._staff
 
     def message_receive(self) -> AsyncIterator[tuple[Self, dict]]:
         ...
@@ -50,6 +62,13 @@ class RedNetworking:
     async def send(self, payload: dict) -> None:
         ...
 
+    def get_scene_key(self, message: dict) -> Selector | None:
+        if not isinstance(message, dict) or "chatType" not in message:
+            return
+        if message["chatType"] == 2:
+            return Selector().land("qq").group(str(message.get("peerUin", message.get("peerUid"))))
+        return Selector().land("qq").friend(str(message.get("peerUin", message.get("senderUin"))))
+
     async def message_handle(self):
         async for connection, data in self.message_receive():
             event_type = data["type"]
@@ -63,7 +82,11 @@ class RedNetworking:
                     return
                 logger.warning(f"received unsupported event {t}: {payload}")
 
-            def handle_message(message: dict):
+            async def submit(t: str, payload: dict):
+                key = self.get_scene_key(payload) if self.event_pipeline.config.ordered else None
+                await self.event_pipeline.submit(partial(event_parse_task, t, payload), key)
+
+            async def handle_message(message: dict):
                 types = get_msg_types(message)
                 if types.msg == MsgType.system and types.send == "system":
                     if (
@@ -72,21 +95,21 @@ class RedNetworking:
                         and message["elements"][0]["grayTipElement"]["subElementType"] == 4
                         and message["elements"][0]["grayTipElement"]["groupElement"]["type"] == 1
                     ):
-                        asyncio.create_task(event_parse_task("group::member::add", message))
+                        await submit("group::member::add", message)
                     elif (
                         message["subMsgType"] == 8
                         and message["elements"][0]["elementType"] == 8
                         and message["elements"][0]["grayTipElement"]["subElementType"] == 4
                         and message["elements"][0]["grayTipElement"]["groupElement"]["type"] == 8
                     ):
-                        asyncio.create_task(event_parse_task("group::member::mute", message))
+                        await submit("group::member::mute", message)
                     elif (
                         message["subMsgType"] == 8
                         and message["elements"][0]["elementType"] == 8
                         and message["elements"][0]["grayTipElement"]["subElementType"] == 4
                         and message["elements"][0]["grayTipElement"]["groupElement"]["type"] == 5
                     ):
-                        asyncio.create_task(event_parse_task("group::name_update", message))
+                        await submit("group::name_update", message)
                     elif (
                         message["subMsgType"] == 12
                         and message["elements"][0]["elementType"] == 8
@@ -94,18 +117,18 @@ class RedNetworking:
                         and message["elements"][0]["grayTipElement"]["xmlElement"]["busiType"] == "1"
                         and message["elements"][0]["grayTipElement"]["xmlElement"]["busiId"] == "10145"
                     ):
-                        asyncio.create_task(event_parse_task("group::member::legacy::add::invited", message))
+                        await submit("group::member::legacy::add::invited", message)
                     else:
                         logger.warning(f"received unsupported event: {message}")
                         return
                 else:
-                    asyncio.create_task(event_parse_task("message::recv", message))
+                    await submit("message::recv", message)
 
             if event_type == "message::recv":
                 for msg in data["payload"]:
-                    handle_message(msg)
+                    await handle_message(msg)
             else:
-                asyncio.create_task(event_parse_task(event_type, data["payload"]))
+                await submit(event_type, data["payload"])
 
     async def connection_closed(self):
         self.close_signal.set()
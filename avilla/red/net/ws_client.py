@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import asyncio
-import json
+from functools import partial
 from typing import TYPE_CHECKING, Literal, cast
 
 import aiohttp
@@ -27,7 +27,7 @@ class RedWsClientNetworking(RedNetworking, Service):
     session: aiohttp.ClientSession
 
     def __init__(self, protocol: RedProtocol, config: RedConfig) -> None:
-        super().__init__(protocol)
+        super().__init__(protocol, config)
         self.config = config
 
     @property
@@ -43,7 +43,7 @@ class RedWsClientNetworking(RedNetworking, Service):
                 self.close_signal.set()
                 break
             elif msg.type == aiohttp.WSMsgType.TEXT:
-                data: dict = json.loads(cast(str, msg.data))
+                data: dict = self.config.json_codec.loads(cast(str, msg.data))
                 yield self, data
         else:
             await self.connection_closed()
@@ -52,10 +52,20 @@ class RedWsClientNetworking(RedNetworking, Service):
         if self.connection is None:
             raise RuntimeError("connection is not established")
 
-        await self.connection.send_json(payload)
+        await self.connection.send_json(payload, dumps=self.config.json_codec.dumps)
 
     async def call_http(
         self, method: Literal["get", "post", "multipart"], action: str, params: dict | None = None, raw: bool = False
+    ):
+        # Red 的部分读取接口 (如 group/getMemberList) 使用 POST, 因此仅以 allowlist 判定.
+        if method != "multipart" and self.single_flight.accepts(action):
+            return await self.single_flight.run(
+                (method, action, raw), params, partial(self._call_http, method, action, params, raw)
+            )
+        return await self._call_http(method, action, params, raw)
+
+    async def _call_http(
+        self, method: Literal["get", "post", "multipart"], action: str, params: dict | None = None, raw: bool = False
     ):
         action = action.replace("_", "/")
         if method == "get":
@@ -63,14 +73,22 @@ class RedWsClientNetworking(RedNetworking, Service):
                 (self.config.http_endpoint / action).with_query(params or {}),
                 headers={"Authorization": f"Bearer {self.config.access_token}"},
             ) as resp:
-                return (await resp.content.read()) if raw else await resp.json(content_type=None)
+                return (
+                    (await resp.content.read())
+                    if raw
+                    else await resp.json(loads=self.config.json_codec.loads, content_type=None)
+                )
         if method == "post":
             async with self.session.post(
                 (self.config.http_endpoint / action),
                 json=params or {},
                 headers={"Authorization": f"Bearer {self.config.access_token}"},
             ) as resp:
-                return (await resp.content.read()) if raw else await resp.json(content_type=None)
+                return (
+                    (await resp.content.read())
+                    if raw
+                    else await resp.json(loads=self.config.json_codec.loads, content_type=None)
+                )
         if method == "multipart":
             data = aiohttp.FormData(quote_fields=False)
             if params is None:
@@ -86,7 +104,11 @@ class RedWsClientNetworking(RedNetworking, Service):
                 data=data,
                 headers={"Authorization": f"Bearer {self.config.access_token}"},
             ) as resp:
-                return (await resp.content.read()) if raw else await resp.json(content_type=None)
+                return (
+                    (await resp.content.read())
+                    if raw
+                    else await resp.json(loads=self.config.json_codec.loads, content_type=None)
+                )
         raise ValueError(f"Unknown method {method}")
 
     async def wait_for_available(self):
@@ -159,7 +181,7 @@ class RedWsClientNetworking(RedNetworking, Service):
 
     async def launch(self, manager: Launart):
         async with self.stage("preparing"):
-            self.session = aiohttp.ClientSession()
+            self.session = aiohttp.ClientSession(json_serialize=self.config.json_codec.dumps)
 
         async with self.stage("blocking"):
             await self.connection_daemon(manager, self.session)
@@ -2,8 +2,6 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, cast
 
-from graia.amnesia.builtins.memcache import Memcache, MemcacheService
-
 from avilla.core.exceptions import UnknownTarget
 from avilla.core.ryanvk.collector.account import AccountCollector
 from avilla.core.selector import Selector
@@ -20,8 +18,7 @@ class RedFriendActionPerform((m := AccountCollector["RedProtocol", "RedAccount"]
 
     @m.pull("land.friend", Summary)
     async def get_summary(self, target: Selector, route: ...) -> Summary:
-        cache: Memcache = self.protocol.avilla.launch_manager.get_component(MemcacheService).cache
-        if raw := await cache.get(f"red/account({self.account.route['account']}).friend({target.pattern['friend']})"):
+        if raw := self.account.roster.get(target):
             return Summary(raw["nick"], "a friend contact assigned to this account")
         result = await self.account.websocket_client.call_http("get", "api/bot/friends", {})
         result = cast(list, result)
@@ -33,8 +30,7 @@ class RedFriendActionPerform((m := AccountCollector["RedProtocol", "RedAccount"]
 
     @m.pull("land.friend", Nick)
     async def get_nick(self, target: Selector, route: ...) -> Nick:
-        cache: Memcache = self.protocol.avilla.launch_manager.get_component(MemcacheService).cache
-        if raw := await cache.get(f"red/account({self.account.route['account']}).friend({target.pattern['friend']})"):
+        if raw := self.account.roster.get(target):
             return Nick(raw["nick"], raw["remark"] or raw["nick"], raw["longNick"])
         result = await self.account.websocket_client.call_http("get", "api/bot/friends", {})
         result = cast(list, result)
@@ -2,8 +2,6 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, cast
 
-from graia.amnesia.builtins.memcache import Memcache, MemcacheService
-
 from avilla.core.exceptions import UnknownTarget
 from avilla.core.ryanvk.collector.account import AccountCollector
 from avilla.core.selector import Selector
@@ -23,8 +21,7 @@ class RedGroupActionPerform((m := AccountCollector["RedProtocol", "RedAccount"](
 
     @m.pull("land.group", Summary)
     async def get_summary(self, target: Selector, route: ...) -> Summary:
-        cache: Memcache = self.protocol.avilla.launch_manager.get_component(MemcacheService).cache
-        if raw := await cache.get(f"red/account({self.account.route['account']}).group({target.pattern['group']})"):
+        if raw := self.account.roster.get(target):
             return Summary(raw["name"], "a group contact assigned to this account")
         result = await self.account.websocket_client.call_http("get", "api/bot/groups", {})
         result = cast(list, result)
@@ -36,8 +33,7 @@ class RedGroupActionPerform((m := AccountCollector["RedProtocol", "RedAccount"](
 
     @m.pull("land.group", Nick)
     async def get_nick(self, target: Selector, route: ...) -> Nick:
-        cache: Memcache = self.protocol.avilla.launch_manager.get_component(MemcacheService).cache
-        if raw := await cache.get(f"red/account({self.account.route['account']}).group({target.pattern['group']})"):
+        if raw := self.account.roster.get(target):
             return Nick(raw["name"], raw["remark"] or raw["name"], None)
         result = await self.account.websocket_client.call_http("get", "api/bot/groups", {})
         result = cast(list, result)
@@ -49,8 +45,7 @@ class RedGroupActionPerform((m := AccountCollector["RedProtocol", "RedAccount"](
 
     @m.pull("land.group", Count)
     async def get_count(self, target: Selector, route: ...) -> Count:
-        cache: Memcache = self.protocol.avilla.launch_manager.get_component(MemcacheService).cache
-        if raw := await cache.get(f"red/account({self.account.route['account']}).group({target.pattern['group']})"):
+        if raw := self.account.roster.get(target):
             return Count(raw["memberCount"], raw["maxMember"])
         result = await self.account.websocket_client.call_http("get", "api/bot/groups", {})
         result = cast(list, result)
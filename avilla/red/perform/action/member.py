@@ -3,8 +3,6 @@ from __future__ import annotations
 from datetime import timedelta
 from typing import TYPE_CHECKING, cast
 
-from graia.amnesia.builtins.memcache import Memcache, MemcacheService
-
 from avilla.core.exceptions import UnknownTarget
 from avilla.core.ryanvk.collector.account import AccountCollector
 from avilla.core.selector import Selector
@@ -22,10 +20,7 @@ class RedMemberActionPerform((m := AccountCollector["RedProtocol", "RedAccount"]
 
     @m.pull("land.group.member", Summary)
     async def get_summary(self, target: Selector, route: ...) -> Summary:
-        cache: Memcache = self.protocol.avilla.launch_manager.get_component(MemcacheService).cache
-        if raw := await cache.get(
-            f"red/account({self.account.route['account']}).group({target.pattern['group']}).member({target.pattern['member']})"
-        ):
+        if raw := self.account.roster.get(target):
             return Summary(raw["nick"], "a member of this group")
         result = await self.account.websocket_client.call_http(
             "get", "api/group/getMemberList", {"group": target.pattern["group"]}
@@ -39,10 +34,7 @@ class RedMemberActionPerform((m := AccountCollector["RedProtocol", "RedAccount"]
 
     @m.pull("land.group.member", Nick)
     async def get_nick(self, target: Selector, route: ...) -> Nick:
-        cache: Memcache = self.protocol.avilla.launch_manager.get_component(MemcacheService).cache
-        if raw := await cache.get(
-            f"red/account({self.account.route['account']}).group({target.pattern['group']}).member({target.pattern['member']})"
-        ):
+        if raw := self.account.roster.get(target):
             return Nick(raw["nick"], raw["remark"] or raw["nick"], raw["cardName"])
         result = await self.account.websocket_client.call_http(
             "get", "api/group/getMemberList", {"group": target.pattern["group"]}
@@ -56,10 +48,7 @@ class RedMemberActionPerform((m := AccountCollector["RedProtocol", "RedAccount"]
 
     @m.pull("land.group.member", MuteInfo)
     async def get_mute_info(self, target: Selector, route: ...) -> MuteInfo:
-        cache: Memcache = self.protocol.avilla.launch_manager.get_component(MemcacheService).cache
-        if raw := await cache.get(
-            f"red/account({self.account.route['account']}).group({target.pattern['group']}).member({target.pattern['member']})"
-        ):
+        if raw := self.account.roster.get(target):
             return MuteInfo(
                 raw["shutUpTime"] > 0,
                 timedelta(seconds=raw["shutUpTime"]),
@@ -49,8 +49,8 @@ class RedMessageDeserializePerform((m := ApplicationCollector())._):
     context: OptionalAccess[Context] = OptionalAccess()
     account: OptionalAccess[RedAccount] = OptionalAccess()
 
-    @m.entity(RedCapability.deserialize_element, element="text")
-    async def text(self, element: dict) -> Text | Notice | NoticeAll:
+    @m.entity(RedCapability.deserialize_element_sync, element="text")
+    def text(self, element: dict) -> Text | Notice | NoticeAll:
         if not element["atType"]:
             return Text(element["content"])
         if element["atType"] == 1:
@@ -65,8 +65,8 @@ class RedMessageDeserializePerform((m := ApplicationCollector())._):
             element["content"][1:],
         )
 
-    @m.entity(RedCapability.deserialize_element, element="face")
-    async def face(self, element: dict) -> Face | Poke:
+    @m.entity(RedCapability.deserialize_element_sync, element="face")
+    def face(self, element: dict) -> Face | Poke:
         if element["faceType"] == 5:
             return Poke(PokeKind.ChuoYiChuo)
         return Face(element["faceIndex"], element["faceText"])
@@ -1,10 +1,7 @@
 from __future__ import annotations
 
-from datetime import timedelta
 from typing import TYPE_CHECKING, Callable, cast
 
-from graia.amnesia.builtins.memcache import Memcache, MemcacheService
-
 from avilla.core.builtins.capability import CoreCapability
 from avilla.core.ryanvk.collector.account import AccountCollector
 from avilla.core.selector import Selector
@@ -19,41 +16,46 @@ class RedQueryPerform((m := AccountCollector["RedProtocol", "RedAccount"]())._):
 
     @m.entity(CoreCapability.query, target="land.group")
     async def query_group(self, predicate: Callable[[str, str], bool] | str, previous: None):
-        cache: Memcache = self.protocol.avilla.launch_manager.get_component(MemcacheService).cache
         result = await self.account.websocket_client.call_http("get", "api/bot/groups", {})
         result = cast(list, result)
-        for i in result:
-            group_id = str(i["groupCode"])
-            await cache.set(f"red/account({self.account.route['account']}).group({group_id})", i, timedelta(minutes=5))
+        land = Selector().land(self.account.route["land"])
+        groups = [(land.group(str(i["groupCode"])), i) for i in result]
+        self.account.roster.set_many(groups)
+        for group, _ in groups:
+            group_id = group.last_value
             if callable(predicate) and predicate("group", group_id) or group_id == predicate:
-                yield Selector().land(self.account.route["land"]).group(group_id)
+                yield group
 
     @m.entity(CoreCapability.query, target="land.friend")
     async def query_friend(self, predicate: Callable[[str, str], bool] | str, previous: None):
-        cache: Memcache = self.protocol.avilla.launch_manager.get_component(MemcacheService).cache
         result = await self.account.websocket_client.call_http("get", "api/bot/friends", {})
         result = cast(list, result)
-        for i in result:
-            friend_id = str(i["uin"])
-            await cache.set(
-                f"red/account({self.account.route['account']}).friend({friend_id})", i, timedelta(minutes=5)
-            )
+        land = Selector().land(self.account.route["land"])
+        friends = [(land.friend(str(i["uin"])), i) for i in result]
+        self.account.roster.set_many(friends)
+        for friend, _ in friends:
+            friend_id = friend.last_value
             if callable(predicate) and predicate("friend", friend_id) or friend_id == predicate:
-                yield Selector().land(self.account.route["land"]).friend(friend_id)
+                yield friend
 
     @m.entity(CoreCapability.query, target="member", previous="land.group")  # type: ignore
     async def query_group_members(self, predicate: Callable[[str, str], bool] | str, previous: Selector):
-        cache: Memcache = self.protocol.avilla.launch_manager.get_component(MemcacheService).cache
         result = await self.account.websocket_client.call_http(
             "post", "api/group/getMemberList", {"group": int(previous["group"])}
         )
         result = cast(list, result)
-        for i in result:
-            member_id = str(i["uin"])
-            await cache.set(
-                f"red/account({self.account.route['account']}).group({previous['group']}).member({member_id})",
-                i,
-                timedelta(minutes=5),
-            )
+        members = [(previous.member(str(i["uin"])), i) for i in result]
+        self.account.roster.set_many(members)
+        for member, _ in members:
+            member_id = member.last_value
             if callable(predicate) and predicate("member", member_id) or member_id == predicate:
-                yield previous.member(member_id)
+                yield member
+
+    @m.entity(CoreCapability.query, target="member", previous="land.group", point=True)  # type: ignore
+    async def query_group_member(self, predicate: str, previous: Selector):
+        if self.account.roster.get(previous.member(predicate)) is not None:
+            yield previous.member(predicate)
+            return
+        # Red 没有单个成员的查询接口, 缓存未命中时仍需拉取完整列表 (同时会刷新缓存).
+        async for i in self.query_group_members(predicate, previous):
+            yield i
@@ -3,9 +3,8 @@ from __future__ import annotations
 from contextlib import suppress
 from typing import TYPE_CHECKING
 
-from aiohttp import ClientSession
-
 from avilla.core.builtins.capability import CoreCapability
+from avilla.core.http import read_file
 from avilla.core.ryanvk.collector.protocol import ProtocolCollector
 from avilla.red.resource import (
     RedFileResource,
@@ -34,13 +33,10 @@ class RedResourceFetchPerform((m := ProtocolCollector["RedProtocol"]())._):
             and resource.path
             and resource.path.exists()
         ):
-            with resource.path.open("rb") as f:
-                return f.read()
+            return await read_file(resource.path)
         if isinstance(resource, RedImageResource):
             with suppress(Exception):
-                async with ClientSession() as session:
-                    async with session.get(resource.url) as resp:
-                        return await resp.read()
+                return await self.protocol.avilla.http.read(resource.url)
         if TYPE_CHECKING:
             assert isinstance(resource.ctx.account, RedAccount)
         return await resource.ctx.account.websocket_client.call_http(
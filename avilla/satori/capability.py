@@ -8,6 +8,8 @@ from satori.element import transform
 from satori.model import Event
 
 from avilla.core.event import AvillaEvent
+from avilla.core.multicast import memoize_serialization
+from avilla.core.ryanvk.behavior.fallback import SyncFallbackBehavior
 from avilla.core.ryanvk.collector.application import ApplicationCollector
 from avilla.standard.core.application.event import AvillaLifecycleEvent
 from graia.ryanvk import Fn, PredicateOverload, TypeOverload
@@ -19,6 +21,13 @@ class SatoriCapability((m := ApplicationCollector())._):
         ...
 
     @Fn.complex({TypeOverload(): ["raw_element"]})
+    def deserialize_element_sync(self, raw_element: Any) -> Element:
+        ...
+
+    @Fn.complex(
+        {TypeOverload(): ["raw_element"]},
+        behavior=SyncFallbackBehavior(deserialize_element_sync),
+    )
     async def deserialize_element(self, raw_element: Any) -> Element:
         ...
 
@@ -27,13 +36,14 @@ class SatoriCapability((m := ApplicationCollector())._):
         ...
 
     async def deserialize(self, content: str):
-        elements = []
-
-        for raw_element in transform(parse(content)):
-            elements.append(await self.deserialize_element(raw_element))
-
+        elements = await self.staff.deserialize_elements(
+            transform(parse(content)),
+            type,
+            SatoriCapability.deserialize_element,
+        )
         return MessageChain(elements)
 
+    @memoize_serialization
     async def serialize(self, message: MessageChain):
         chain = []
 
@@ -61,12 +61,12 @@ class SatoriMessageDeserializePerform((m := ApplicationCollector())._):
 
     # LINK: https://github.com/microsoft/pyright/issues/5409
 
-    @m.entity(SatoriCapability.deserialize_element, raw_element=SatoriText)
-    async def text(self, raw_element: SatoriText) -> Text:
+    @m.entity(SatoriCapability.deserialize_element_sync, raw_element=SatoriText)
+    def text(self, raw_element: SatoriText) -> Text:
         return Text(raw_element.text)
 
-    @m.entity(SatoriCapability.deserialize_element, raw_element=At)
-    async def at(self, raw_element: At) -> Notice | NoticeAll:
+    @m.entity(SatoriCapability.deserialize_element_sync, raw_element=At)
+    def at(self, raw_element: At) -> Notice | NoticeAll:
         if raw_element.type in ("all", "here"):
             return NoticeAll()
         scene = self.context.scene if self.context else Selector().land("satori")
@@ -111,8 +111,8 @@ class SatoriMessageDeserializePerform((m := ApplicationCollector())._):
         res.selector = scene.video(raw_element.src)
         return File(res)
 
-    @m.entity(SatoriCapability.deserialize_element, raw_element=Quote)
-    async def quote(self, raw_element: Quote) -> Reference:
+    @m.entity(SatoriCapability.deserialize_element_sync, raw_element=Quote)
+    def quote(self, raw_element: Quote) -> Reference:
         scene = self.context.scene if self.context else Selector().land("satori")
         return Reference(scene.message(raw_element.id))  # type: ignore
 
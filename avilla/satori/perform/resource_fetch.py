@@ -1,11 +1,11 @@
 from __future__ import annotations
 
 from base64 import b64decode
-from typing import TYPE_CHECKING
-
-from aiohttp import ClientSession
+from pathlib import Path
+from typing import TYPE_CHECKING, AsyncIterator
 
 from avilla.core.builtins.capability import CoreCapability
+from avilla.core.http import read_file, stream_bytes, stream_file
 from avilla.core.ryanvk.collector.protocol import ProtocolCollector
 from avilla.satori.resource import (
     SatoriAudioResource,
@@ -29,10 +29,23 @@ class SatoriResourceFetchPerform((m := ProtocolCollector["SatoriProtocol"]())._)
     @m.entity(CoreCapability.fetch, resource=SatoriFileResource)  # type: ignore
     async def fetch_resource(self, resource: SatoriResource) -> bytes:
         if resource.src.startswith("file://"):
-            with open(resource.src[7:], "rb") as f:
-                return f.read()
+            return await read_file(Path(resource.src[7:]))
         if resource.src.startswith("data:"):
             return b64decode(resource.src[5:].split(";", 1)[1][7:])
-        async with ClientSession() as session:
-            async with session.get(resource.src) as resp:
-                return await resp.read()
+        return await self.protocol.avilla.http.read(resource.src)
+
+    @m.entity(CoreCapability.stream, resource=SatoriResource)
+    @m.entity(CoreCapability.stream, resource=SatoriImageResource)
+    @m.entity(CoreCapability.stream, resource=SatoriVideoResource)
+    @m.entity(CoreCapability.stream, resource=SatoriAudioResource)
+    @m.entity(CoreCapability.stream, resource=SatoriFileResource)  # type: ignore
+    async def stream_resource(self, resource: SatoriResource, chunk_size: int | None = None) -> AsyncIterator[bytes]:
+        chunk_size = chunk_size or self.protocol.avilla.http.config.chunk_size
+        if resource.src.startswith("file://"):
+            chunks = stream_file(Path(resource.src[7:]), chunk_size)
+        elif resource.src.startswith("data:"):
+            chunks = stream_bytes(b64decode(resource.src[5:].split(";", 1)[1][7:]), chunk_size)
+        else:
+            chunks = self.protocol.avilla.http.stream(resource.src, chunk_size)
+        async for chunk in chunks:
+            yield chunk
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from dataclasses import dataclass
+
 from satori.config import WebsocketsInfo
 from satori.client.network.websocket import WsNetwork
 
@@ -10,6 +12,7 @@ from graia.ryanvk import merge, ref
 from .service import SatoriService
 
 
+@dataclass
 class SatoriConfig(ProtocolConfig, WebsocketsInfo):
     ...
 
@@ -62,4 +65,5 @@ class SatoriProtocol(BaseProtocol):
 
     def configure(self, config: SatoriConfig):
         self.service.apply(config)
+        self.service.event_pipeline.config = config.event_pipeline
         return self
@@ -1,15 +1,16 @@
 from __future__ import annotations
 
-import asyncio
 from contextlib import suppress
+from functools import partial
 from typing import TYPE_CHECKING
 
 from loguru import logger
 from satori.client.account import Account
 from satori.client import App
-from satori.model import Event, LoginStatus
+from satori.model import ChannelType, Event, LoginStatus
 
 from avilla.core.account import AccountInfo
+from avilla.core.pipeline import EventPipeline
 from avilla.standard.core.account import (
     AccountAvailable,
     AccountRegistered,
@@ -32,10 +33,14 @@ class SatoriService(App):
 
     protocol: SatoriProtocol
     _accounts: dict[str, SatoriAccount]
+    event_pipeline: EventPipeline
+    _staff: Staff | None
 
     def __init__(self, protocol: SatoriProtocol):
         self.protocol = protocol
         self._accounts = {}
+        self.event_pipeline = EventPipeline()
+        self._staff = None
         super().__init__()
         self.register(self.handle_event)
         self.lifecycle(self.handle_lifecycle)
@@ -48,7 +53,16 @@ class SatoriService(App):
 
     @property
     def staff(self):
-        return Staff(self.get_staff_artifacts(), self.get_staff_components())
+        self._staff = Staff.reuse(self._staff, self.get_staff_artifacts(), self.get_staff_components)
+        return self._staff
+
+    def get_scene_key(self, account: Account, event: Event) -> Selector | None:
+        if event.channel is None:
+            return
+        if event.channel.type == ChannelType.DIRECT:
+            return Selector().land(account.platform).private(event.channel.id)
+        guild = Selector().land(account.platform).guild(event.guild.id if event.guild else "True")
+        return guild.channel(event.channel.id)
 
     async def handle_event(self, account: Account, event: Event):
         async def event_parse_task(connection: Account, raw: Event):
@@ -58,7 +72,8 @@ class SatoriService(App):
 
             logger.warning(f"received unsupported event {raw.type}: {raw}")
 
-        asyncio.create_task(event_parse_task(account, event))
+        key = self.get_scene_key(account, event) if self.event_pipeline.config.ordered else None
+        await self.event_pipeline.submit(partial(event_parse_task, account, event), key)
 
     async def handle_lifecycle(self, account: Account, state: LoginStatus):
         if state == LoginStatus.ONLINE:
@@ -12,6 +12,7 @@ from typing import (
     Callable,
     DefaultDict,
     Dict,
+    FrozenSet,
     Generic,
     Iterable,
     List,
@@ -51,13 +52,13 @@ from .typing import (
 from .util import (
     ElementType,
     MessageChainType,
+    TwilightDispatchIndex,
     TwilightHelpManager,
     TwilightParser,
     Unmatched,
     _from_mapping_string,
-    _to_mapping_str,
     elem_mapping_ctx,
-    split,
+    tokenize_chain,
     transform_regex,
 )
 
@@ -530,6 +531,26 @@ class TwilightMatcher:
                     self.dispatch_ref[m.dest] = m
 
         self._regex_pattern: re.Pattern = re.compile("".join(regex_str_list))
+        self.leading_literals: Optional[FrozenSet[str]] = self._leading_literals()
+
+    def _leading_literals(self) -> Optional[FrozenSet[str]]:
+        """首个匹配项可能的字面量前缀, 无法确定时为 None.
+
+        含有 ArgumentMatch (参数可以出现在任意位置) 或首项不是无旗标, 非可选的
+        FullMatch / 纯字符串 UnionMatch 时无法确定.
+        """
+        if self.match_ref[ArgumentMatch] or not self.match_ref[RegexMatch]:
+            return None
+        first = self.match_ref[RegexMatch][0]
+        if first.optional or first._flags:
+            return None
+        if isinstance(first, FullMatch):
+            literals = [first.pattern]
+        elif type(first) is UnionMatch and all(isinstance(i, str) for i in first.pattern):
+            literals = [re.sub(r"\\(.)", r"\1", cast(str, i), flags=re.S) for i in first.pattern]
+        else:
+            return None
+        return None if "" in literals else frozenset(literals)
 
     def match(
         self, arguments: List[str], elem_mapping: Dict[str, Element]
@@ -661,6 +682,7 @@ class Twilight(Generic[T_Sparkle], BaseDispatcher):
         self.help_id: str = TwilightHelpManager.AUTO_ID
         self.help_brief: str = TwilightHelpManager.AUTO_ID
         self.matcher: TwilightMatcher = TwilightMatcher(*root)
+        TwilightDispatchIndex.register(self)
 
     def __repr__(self) -> str:
         return f"<Twilight: {self.matcher}>"
@@ -674,10 +696,9 @@ class Twilight(Generic[T_Sparkle], BaseDispatcher):
         Returns:
             T_Sparkle: 生成的 Sparkle 对象.
         """
-        mapping_str, elem_mapping = _to_mapping_str(chain, **self.map_param)
+        _, elem_mapping, arguments = tokenize_chain(chain, self.map_param)
         token = elem_mapping_ctx.set(elem_mapping)
-        arguments: List[str] = split(mapping_str, keep_quote=True)
-        res, match = self.matcher.match(arguments, elem_mapping)
+        res, match = self.matcher.match(list(arguments), elem_mapping)
         if storage:
             storage["__parser_regex_match_obj__"] = match
             storage["__parser_regex_match_map__"] = elem_mapping
@@ -811,9 +832,10 @@ class Twilight(Generic[T_Sparkle], BaseDispatcher):
         else:
             chain = await interface.lookup_param("message_chain", MessageChain, None)
         with contextlib.suppress(Exception):
-            local_storage[f"{__name__}:result"] = self.generate(chain, local_storage)
-            local_storage[f"{__name__}:twilight"] = self
-            return
+            if TwilightDispatchIndex.admits(self, tokenize_chain(chain, self.map_param)[2]):
+                local_storage[f"{__name__}:result"] = self.generate(chain, local_storage)
+                local_storage[f"{__name__}:twilight"] = self
+                return
         interface.stop()
 
     async def catch(self, interface: DispatcherInterface):
@@ -2,6 +2,8 @@
 import argparse
 import inspect
 import re
+import weakref
+from collections import OrderedDict
 from contextvars import ContextVar
 from typing import (
     TYPE_CHECKING,
@@ -9,13 +11,16 @@ from typing import (
     ClassVar,
     Dict,
     Final,
+    FrozenSet,
     List,
     Literal,
     NoReturn,
     Optional,
+    Tuple,
     Type,
     TypeVar,
     Union,
+    cast,
     overload,
 )
 
@@ -173,6 +178,62 @@ class TwilightParser(argparse.ArgumentParser):
         return True
 
 
+class TwilightDispatchIndex:
+    """按首个字面量前缀索引所有 Twilight, 使消息只交给可能匹配的 Twilight 进行完整的匹配.
+
+    前缀无法确定的 Twilight (见 ``TwilightMatcher.leading_literals``) 不进入索引, 总是进行完整匹配.
+    """
+
+    _registry: ClassVar["weakref.WeakSet[Twilight]"] = weakref.WeakSet()
+    _trie: ClassVar[Optional[Dict[str, dict]]] = None
+    _last: ClassVar[Tuple[Optional[List[str]], FrozenSet[int]]] = (None, frozenset())
+
+    @classmethod
+    def register(cls, twilight: "Twilight") -> None:
+        if twilight.matcher.leading_literals is None:
+            return
+        cls._registry.add(twilight)
+        cls._trie = None
+        cls._last = (None, frozenset())
+
+    @classmethod
+    def _build(cls) -> Dict[str, dict]:
+        trie: Dict[str, dict] = {}
+        for twilight in cls._registry:
+            for literal in cast(FrozenSet[str], twilight.matcher.leading_literals):
+                node = trie
+                for char in literal:
+                    node = node.setdefault(char, {})
+                node.setdefault("", set()).add(id(twilight))
+        return trie
+
+    @classmethod
+    def candidates(cls, string: str) -> FrozenSet[int]:
+        """返回首个字面量是 ``string`` 前缀的 Twilight 的 id."""
+        node = cls._trie
+        if node is None:
+            node = cls._trie = cls._build()
+        result: set = set()
+        for char in string:
+            node = node.get(char)
+            if node is None:
+                break
+            if "" in node:
+                result |= node[""]
+        return frozenset(result)
+
+    @classmethod
+    def admits(cls, twilight: "Twilight", arguments: List[str]) -> bool:
+        """``arguments`` 为 ``tokenize_chain`` 返回的参数列表, 同一列表的查询结果会被复用."""
+        if twilight.matcher.leading_literals is None or twilight not in cls._registry:
+            return True
+        last_arguments, candidates = cls._last
+        if last_arguments is not arguments:
+            candidates = cls.candidates(" ".join(arguments))
+            cls._last = (arguments, candidates)
+        return id(twilight) in candidates
+
+
 class TwilightHelpManager:
     AUTO_ID: Final[str] = "&auto_id" + hex(id("&auto_id"))
     _manager_ref: ClassVar[Dict[str, "TwilightHelpManager"]] = {}
@@ -328,6 +389,39 @@ def _to_mapping_str(
     return "".join(elem_str_list), elem_mapping
 
 
+_TOKENIZE_MEMO_SIZE: Final = 32
+_tokenize_memo: "OrderedDict[tuple, Tuple[MessageChain, tuple, str, Dict[str, Element], List[str]]]" = OrderedDict()
+
+
+def tokenize_chain(chain: MessageChain, map_param: Dict[str, bool]) -> Tuple[str, Dict[str, Element], List[str]]:
+    """转换消息链并切分参数, 返回映射字符串, 映射字典与参数列表.
+
+    同一消息链在各个 Twilight 间只转换一次: 结果以消息链的身份与 ``map_param`` 为键缓存,
+    消息链的元素发生增删或替换时重新计算. 返回的对象为各 Twilight 共享, 请勿修改.
+
+    Args:
+        chain (MessageChain): 消息链
+        map_param (Dict[str, bool]): 传给 ``_to_mapping_str`` 的参数
+
+    Returns:
+        Tuple[str, Dict[str, Element], List[str]]: 映射字符串, 映射字典与参数列表
+    """
+    key = (id(chain), *sorted(map_param.items()))
+    fingerprint = tuple(map(id, chain.content))
+    entry = _tokenize_memo.get(key)
+    if entry is not None and entry[0] is chain and entry[1] == fingerprint:
+        _tokenize_memo.move_to_end(key)
+        return entry[2], entry[3], entry[4]
+
+    mapping_str, elem_mapping = _to_mapping_str(chain, **map_param)
+    arguments = split(mapping_str, keep_quote=True)
+    _tokenize_memo[key] = (chain, fingerprint, mapping_str, elem_mapping, arguments)
+    _tokenize_memo.move_to_end(key)
+    if len(_tokenize_memo) > _TOKENIZE_MEMO_SIZE:
+        _tokenize_memo.popitem(last=False)
+    return mapping_str, elem_mapping, arguments
+
+
 __element_pattern = re.compile("(\x02\\w+\x03)")
 
 
@@ -0,0 +1,85 @@
+# 运行: python -m benchmarks.selector
+
+import timeit
+from collections.abc import Mapping
+from types import MappingProxyType
+
+from avilla.core.selector import Selector
+
+EMPTY_MAP = MappingProxyType({})
+
+
+class LegacySelector:
+    # dict + MappingProxyType 实现, 用于对照.
+    def __init__(self, pattern: Mapping[str, str] = EMPTY_MAP) -> None:
+        self.pattern = MappingProxyType({k: str(v) for k, v in pattern.items()})
+        self._hash = hash(("Selector", *self.pattern.items()))
+
+    def modify(self, pattern: Mapping[str, str]):
+        return self.__class__(pattern=pattern)
+
+    def __getattr__(self, name: str):
+        if name.startswith("__"):
+            return super().__getattribute__(name)
+
+        def wrapper(content: str):
+            return self.modify({**self.pattern, name: str(content)})
+
+        return wrapper
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __eq__(self, o: object) -> bool:
+        return isinstance(o, self.__class__) and o._hash == self._hash
+
+    def land(self, land: str):
+        return self.modify({"land": land, **{k: v for k, v in self.pattern.items() if k != "land"}})
+
+    @property
+    def display(self) -> str:
+        return ".".join(f"{k}({v})" for k, v in self.pattern.items())
+
+
+def bench(name: str, stmt, number: int = 200_000):
+    legacy = timeit.timeit(lambda: stmt(LegacySelector), number=number)
+    current = timeit.timeit(lambda: stmt(Selector), number=number)
+    print(
+        f"{name:<12} legacy {legacy * 1e9 / number:8.1f} ns"
+        f"  current {current * 1e9 / number:8.1f} ns  x{legacy / current:.2f}"
+    )
+
+
+def construct(cls):
+    return cls().land("qq").group("123456").member("654321")
+
+
+def from_mapping(cls):
+    return cls({"land": "qq", "group": "123456", "member": "654321"})
+
+
+def hashing(cls, _cache={}):
+    if cls not in _cache:
+        _cache[cls] = [construct(cls) for _ in range(4)]
+    return {i: None for i in _cache[cls]}
+
+
+def equality(cls, _cache={}):
+    if cls not in _cache:
+        _cache[cls] = (construct(cls), construct(cls))
+    a, b = _cache[cls]
+    return a == b
+
+
+def display(cls, _cache={}):
+    if cls not in _cache:
+        _cache[cls] = construct(cls)
+    return _cache[cls].display
+
+
+if __name__ == "__main__":
+    bench("construct", construct)
+    bench("from_mapping", from_mapping)
+    bench("hash", hashing)
+    bench("eq", equality)
+    bench("display", display)
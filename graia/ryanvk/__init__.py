@@ -4,6 +4,7 @@ from ._runtime import ref as ref
 from .access import Access as Access
 from .access import OptionalAccess as OptionalAccess
 from .behavior import OverloadBehavior as OverloadBehavior
+from .behavior import invalidate_dispatch_cache as invalidate_dispatch_cache
 from .capability import Capability as Capability
 from .collector import BaseCollector as BaseCollector
 from .endpoint import Endpoint as Endpoint
@@ -4,6 +4,7 @@ from collections import ChainMap
 from itertools import chain
 from typing import Any
 
+from graia.ryanvk.behavior import invalidate_dispatch_cache
 from graia.ryanvk.typing import SupportsMerge
 
 GLOBAL_GALLERY = {}  # layout: {namespace: {identify: {...}}}, cover-mode.
@@ -27,4 +28,6 @@ def merge(*artifacts: dict[Any, Any]):
         else:
             result[sign] = chainmap[sign]
 
+    # merge_scopes 可能就地修改了参与合并的 scope.
+    invalidate_dispatch_cache()
     return result
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Callable, TypeVar
+from typing import TYPE_CHECKING, Any, Callable, Hashable, TypeVar
 
 from typing_extensions import Concatenate, ParamSpec
 
@@ -9,6 +9,7 @@ from .sign import FnImplement, FnRecord
 if TYPE_CHECKING:
     from .collector import BaseCollector
     from .fn import Fn
+    from .overload import FnOverload
     from .perform import BasePerform
     from .staff import Staff
 
@@ -17,37 +18,114 @@ N = TypeVar("N", bound="BasePerform")
 R = TypeVar("R", covariant=True)
 P = ParamSpec("P")
 
+DISPATCH_CACHE_SIZE = 4096
+DISPATCH_SCOPES_SIZE = 64
+
+_dispatch_generation = 0
+
+
+def invalidate_dispatch_cache() -> None:
+    """使所有 OverloadBehavior 上的分派缓存失效, 在就地修改 artifacts 后调用."""
+
+    global _dispatch_generation
+    _dispatch_generation += 1
+
+
+def get_dispatch_generation() -> int:
+    return _dispatch_generation
+
 
 class OverloadBehavior:
+    dispatch_cache: dict[tuple[int, ...], tuple[tuple[dict[Any, Any], ...], dict[Hashable, Any]]]
+    # layout: {collections identity: (collections, {(fn, *overload keys): (collector, entity)})}
+    # collections 被强引用, 以保证 identity 中的 id 在缓存存活期间不会被复用.
+
+    generation: int
+
+    def __init__(self) -> None:
+        self.dispatch_cache = {}
+        self.generation = _dispatch_generation
+
     def harvest_record(self, staff: Staff, fn: Fn) -> FnRecord:
         result = staff.artifact_map.get(FnImplement(fn))
         if result is None:
             raise NotImplementedError
         return result
 
+    def get_dispatch_scope(self, staff: Staff) -> dict[Hashable, Any]:
+        if self.generation != _dispatch_generation:
+            self.dispatch_cache.clear()
+            self.generation = _dispatch_generation
+
+        identity = staff.collection_identity
+        scope = self.dispatch_cache.get(identity)
+        if scope is None:
+            if len(self.dispatch_cache) >= DISPATCH_SCOPES_SIZE:
+                self.dispatch_cache.clear()
+            scope = self.dispatch_cache[identity] = (tuple(staff.artifact_collections), {})
+
+        return scope[1]
+
+    def get_dispatch_key(self, fn: Fn, layouts: list[tuple[FnOverload, dict[str, Any]]]) -> tuple | None:
+        key: tuple = (fn,)
+
+        for overload_item, layout in layouts:
+            overload_key = overload_item.get_dispatch_key(layout)
+            if overload_key is None:
+                return
+
+            key += overload_key
+
+        return key
+
     def harvest_overload(
         self, staff: Staff, fn: Fn[P, R], *args: P.args, **kwargs: P.kwargs
     ) -> tuple[BaseCollector, Callable[Concatenate[Any, P], R]]:
-        artifact_record = self.harvest_record(staff, fn)
+        if not fn.has_overload_capability:
+            return self.harvest_record(staff, fn)["record_tuple"]  # type: ignore
 
-        if fn.has_overload_capability:
+        arguments = fn.extract_overload_arguments(args, kwargs)
+        if arguments is None:
             bound_args = fn.shape_signature.bind(*args, **kwargs)
             bound_args.apply_defaults()
-            collections = None
+            arguments = bound_args.arguments
+
+        layouts = [
+            (overload_item, {i: arguments[i] for i in required_args})
+            for overload_item, required_args in fn.overload_param_map.items()
+        ]
+
+        dispatch_key = self.get_dispatch_key(fn, layouts)
+        dispatch_scope = None
+        if dispatch_key is not None:
+            dispatch_scope = self.get_dispatch_scope(staff)
+            try:
+                return dispatch_scope[dispatch_key]
+            except KeyError:
+                pass
+            except TypeError:
+                # unhashable overload key, cannot be memoized.
+                dispatch_scope = None
 
-            for overload_item, required_args in fn.overload_param_map.items():
-                scope = artifact_record["overload_scopes"][overload_item.identity]
-                entities = overload_item.get_entities(scope, {i: bound_args.arguments[i] for i in required_args})
-                collections = entities if collections is None else collections.intersection(entities)
+        artifact_record = self.harvest_record(staff, fn)
+        collections = None
 
-            if not collections:
-                raise NotImplementedError
+        for overload_item, layout in layouts:
+            scope = artifact_record["overload_scopes"][overload_item.identity]
+            entities = overload_item.get_entities(scope, layout)
+            collections = entities if collections is None else collections.intersection(entities)
+
+        if not collections:
+            raise NotImplementedError
 
-            return collections.pop()  # type: ignore
+        result = next(iter(collections))
 
-        else:
-            return artifact_record["record_tuple"]  # type: ignore
+        if dispatch_scope is not None:
+            if len(dispatch_scope) >= DISPATCH_CACHE_SIZE:
+                dispatch_scope.clear()
+            dispatch_scope[dispatch_key] = result
 
+        return result  # type: ignore
 
 
 DEFAULT_BEHAVIOR = OverloadBehavior()
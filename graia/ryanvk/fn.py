@@ -7,7 +7,7 @@ from typing_extensions import Concatenate, ParamSpec, Self, TypeVar
 
 from graia.ryanvk.sign import FnImplement
 
-from .behavior import DEFAULT_BEHAVIOR, OverloadBehavior
+from .behavior import DEFAULT_BEHAVIOR, OverloadBehavior, invalidate_dispatch_cache
 from .override import OverridePerformEntity
 from .perform import BasePerform
 
@@ -45,6 +45,8 @@ class Fn(Generic[P, R]):
     overload_params: dict[str, FnOverload]
     overload_param_map: dict[FnOverload, list[str]]
     overload_map: dict[str, FnOverload]
+    overload_arg_specs: list[tuple[str, int | None, Any]] | None
+    # layout: [(param name, positional index, default)], None means falling back to Signature.bind.
 
     def __init__(
         self: Fn[P, R],
@@ -59,6 +61,7 @@ class Fn(Generic[P, R]):
         self.overload_param_map = overload_param_map or {}
         self.overload_params = {i: k for k, v in self.overload_param_map.items() for i in v}
         self.overload_map = {i.identity: i for i in self.overload_param_map}
+        self.overload_arg_specs = self._compile_arg_specs()
 
     def __set_name__(self, owner: type[BasePerform], name: str):
         self.owner = owner
@@ -92,6 +95,44 @@ class Fn(Generic[P, R]):
     def has_overload_capability(self) -> bool:
         return bool(self.overload_param_map)
 
+    def _compile_arg_specs(self) -> list[tuple[str, int | None, Any]] | None:
+        specs = []
+        parameters = list(self.shape_signature.parameters.values())
+
+        for name in self.overload_params:
+            param = self.shape_signature.parameters.get(name)
+            if param is None or param.kind in (param.VAR_POSITIONAL, param.VAR_KEYWORD):
+                return
+
+            if param.kind == param.KEYWORD_ONLY:
+                index = None
+            else:
+                index = parameters.index(param)
+                if any(i.kind == i.VAR_POSITIONAL for i in parameters[:index]):
+                    return
+
+            specs.append((name, index, param.default))
+
+        return specs
+
+    def extract_overload_arguments(self, args: tuple[Any, ...], kwargs: dict[str, Any]) -> dict[str, Any] | None:
+        if self.overload_arg_specs is None:
+            return
+
+        arguments = {}
+        for name, index, default in self.overload_arg_specs:
+            if index is not None and index < len(args):
+                arguments[name] = args[index]
+            elif name in kwargs:
+                arguments[name] = kwargs[name]
+            elif default is not inspect.Parameter.empty:
+                arguments[name] = default
+            else:
+                # let Signature.bind raise the proper TypeError.
+                return
+
+        return arguments
+
     def collect(
         self,
         collector: BaseCollector,
@@ -118,6 +159,7 @@ class Fn(Generic[P, R]):
             else:
                 artifact["record_tuple"] = (collector, entity)
 
+            invalidate_dispatch_cache()
             return entity
 
         return wrapper
@@ -22,6 +22,10 @@ class FnOverload:
     def get_entities(self, scope: dict[Any, Any], args: dict[str, Any]) -> set[tuple[BaseCollector, Callable]]:
         return scope["_"]
 
+    def get_dispatch_key(self, args: dict[str, Any]) -> tuple | None:
+        # 返回 None 表示该 overload 的结果无法被 OverloadBehavior 缓存, 子类需自行声明.
+        return None
+
     def merge_scopes(self, *scopes: dict[Any, Any]) -> dict:
         return scopes[-1]
 
@@ -34,6 +38,9 @@ class SimpleOverload(FnOverload):
     def identity(self) -> str:
         return str(id(self))
 
+    def get_dispatch_key(self, args: dict[str, Any]) -> tuple | None:
+        return tuple(args.values())
+
     def collect_entity(
         self,
         collector: BaseCollector,
@@ -77,6 +84,9 @@ class TypeOverload(FnOverload):
     def identity(self) -> str:
         return "type_overload:" + str(id(self))
 
+    def get_dispatch_key(self, args: dict[str, Any]) -> tuple | None:
+        return tuple(type(i) for i in args.values())
+
     def collect_entity(
         self,
         collector: BaseCollector,
@@ -128,6 +138,22 @@ class NoneOverload(FnOverload):
     def identity(self) -> str:
         return "none_overload:" + str(id(self))
 
+    def get_dispatch_key(self, args: dict[str, Any]) -> tuple | None:
+        key = ()
+
+        for arg_name, arg_value in args.items():
+            if arg_value is None:
+                key += (None,)
+                continue
+
+            bypassing_key = self.bypassing.get_dispatch_key({arg_name: arg_value})
+            if bypassing_key is None:
+                return
+
+            key += (bypassing_key,)
+
+        return key
+
     def get_params_layout(self, params: list[str], args: dict[str, Any]) -> dict[str, Any]:
         if self.default_factory is not None:
             return {param: args.get(param) or self.default_factory(param) for param in params}
@@ -169,6 +195,7 @@ class NoneOverload(FnOverload):
 
         return sets.pop().intersection(*sets)
 
+
 class PredicateOverload(FnOverload):
     predicate: Callable[[str, Any], Any]
 
@@ -179,6 +206,9 @@ class PredicateOverload(FnOverload):
     def identity(self) -> str:
         return "predicate_overload:" + str(id(self))
 
+    def get_dispatch_key(self, args: dict[str, Any]) -> tuple | None:
+        return tuple(self.predicate(arg_name, arg_value) for arg_name, arg_value in args.items())
+
     def collect_entity(
         self,
         collector: BaseCollector,
@@ -3,9 +3,10 @@ from __future__ import annotations
 from collections import ChainMap
 from contextlib import AsyncExitStack, asynccontextmanager
 from copy import copy
-from typing import TYPE_CHECKING, Any, Callable, Protocol, TypeVar, overload
+from functools import partial
+from typing import TYPE_CHECKING, Any, Callable, Mapping, Protocol, TypeVar, overload
 
-from typing_extensions import ParamSpec
+from typing_extensions import ParamSpec, Self
 
 if TYPE_CHECKING:
     from .fn import Fn
@@ -15,24 +16,47 @@ P = ParamSpec("P")
 R = TypeVar("R", covariant=True)
 VnCallable = TypeVar("VnCallable", bound=Callable)
 
+
 class Staff:
     artifact_collections: list[dict[Any, Any]]
     artifact_map: ChainMap[Any, Any]
-    components: dict[str, Any]
+    collection_identity: tuple[int, ...]
+    components: Mapping[str, Any]
     exit_stack: AsyncExitStack
     instances: dict[type, Any]
 
-    def __init__(self, artifacts_collections: list[dict[Any, Any]], components: dict[str, Any]) -> None:
+    def __init__(self, artifacts_collections: list[dict[Any, Any]], components: Mapping[str, Any]) -> None:
         self.artifact_collections = artifacts_collections
         self.artifact_map = ChainMap(*artifacts_collections)
+        self.collection_identity = tuple(map(id, artifacts_collections))
         self.components = components
         self.exit_stack = AsyncExitStack()
         self.instances = {}
 
+    def is_built_from(self, artifacts_collections: list[dict[Any, Any]]) -> bool:
+        return self.collection_identity == tuple(map(id, artifacts_collections))
+
+    @classmethod
+    def reuse(
+        cls,
+        cached: Staff | None,
+        artifacts_collections: list[dict[Any, Any]],
+        get_components: Callable[[], Mapping[str, Any]],
+    ) -> Self:
+        # 沿用 cached, 仅当 artifacts 集合被替换 (如 inject 或重新加载) 时才重新构造.
+        if cached is not None and isinstance(cached, cls) and cached.is_built_from(artifacts_collections):
+            return cached
+        return cls(artifacts_collections, get_components())
+
     def call_fn(self, fn: Fn[P, R], *args: P.args, **kwargs: P.kwargs) -> R:
         collector, entity = fn.behavior.harvest_overload(self, fn, *args, **kwargs)
         return fn.execute(self, collector, entity, *args, **kwargs)
 
+    def bind_fn(self, fn: Fn[P, R], *args: P.args, **kwargs: P.kwargs) -> Callable[P, R]:
+        # 只进行一次分派, 返回已绑定分派结果的调用, 供同类参数反复调用; 仍经过 Fn.execute.
+        collector, entity = fn.behavior.harvest_overload(self, fn, *args, **kwargs)
+        return partial(fn.execute, self, collector, entity)
+
     class PostInitShape(Protocol[P]):
         def __post_init__(self, *args: P.args, **kwargs: P.kwargs) -> Any:
             ...
@@ -48,7 +72,10 @@ class Staff:
     def inject(self, perform_type: ..., *args, **kwargs):
         perform = perform_type(self)
         perform.__post_init__(*args, **kwargs)
-        self.artifact_collections.insert(0, perform.__collector__.artifacts)
+        # 不就地修改, 以免影响 ext 派生出的 staff.
+        self.artifact_collections = [perform.__collector__.artifacts, *self.artifact_collections]
+        self.artifact_map = ChainMap(*self.artifact_collections)
+        self.collection_identity = tuple(map(id, self.artifact_collections))
 
     async def maintain(self, perform: BasePerform):
         await self.exit_stack.enter_async_context(perform.lifespan())
@@ -58,9 +85,12 @@ class Staff:
         async with self.exit_stack:
             yield self
 
-    def ext(self, components: dict[str, Any]):
+    def ext(self, components: Mapping[str, Any]):
+        # copy-on-write: 派生的 staff 共享 artifacts 与 exit_stack, components 以 ChainMap 叠加在原有之上,
+        # 并拥有独立的 instances, 因为 perform 实例绑定了 staff (以及其 components).
         instance = copy(self)
-        instance.components.update(components)
+        instance.components = ChainMap(dict(components), self.components)
+        instance.instances = {}
         return instance
 
     def get_fn_call(self, fn: Fn[P, R]) -> Callable[P, R]: